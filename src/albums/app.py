@@ -6,11 +6,11 @@ and console output between the various album-checking and management subcommands
 
 import logging
 from pathlib import Path
-from typing import Any, Callable, Final, Iterator, Self
+from typing import Any, Callable, Final, Iterator, Self, Tuple
 
 import click
 from rich.console import Console
-from sqlalchemy import Engine
+from sqlalchemy import Engine, Select
 from sqlalchemy.orm import Session
 
 from .config import Configuration
@@ -19,7 +19,7 @@ from .entities import Album
 logger: Final = logging.getLogger(__name__)
 
 # Bumped whenever the database schema or scan logic changes incompatibly.
-SCANNER_VERSION: Final = 9
+SCANNER_VERSION: Final = 10
 
 
 class Context(dict[Any, Any]):
@@ -36,6 +36,7 @@ class Context(dict[Any, Any]):
         db_path: Absolute path to the on-disk database file.
         select_album_entities: Callable returning an iterator over ``Album`` objects for
             the current command invocation, respecting any active collection or album filters.
+        selected_album_ids: Statement selecting the IDs of the same albums, to query them without loading entities.
         is_filtered: Whether a user-provided filter narrowed the selection.
         config: Loaded application configuration (defaults + CLI overrides).
         verbose: Logging verbosity level (number of ``-v`` flags on the command line).
@@ -50,6 +51,7 @@ class Context(dict[Any, Any]):
     db: Engine
     db_path: Path
     select_album_entities: Callable[[Session], Iterator[Album]]
+    selected_album_ids: Select[Tuple[int | None]]
     is_filtered: bool
     config: Configuration
     verbose: int = 0
@@ -6,9 +6,9 @@ from sqlalchemy.orm import Session
 
 from albums.app import Context
 from albums.entities import Album
-from albums.tagger import AlbumTaggerProvider
+from albums.tagger import AlbumTaggerProvider, BasicField, PaddingPolicy, WriteSet
 
-from .check_types import CheckConfiguration, CheckResult
+from .check_types import CheckConfiguration, CheckInput, CheckResult
 
 
 class Check:
@@ -19,6 +19,21 @@ class Check:
     # subclass may override to define static dependencies on other checks passing first
     must_pass_checks: set[str] = set()
 
+    # subclass may set to True if fixes only change tags through self.tagger, so that tag writes can be deferred and
+    # each file is saved once (checks that rename, delete or create files must leave this False)
+    tag_writes_only: bool = False
+
+    # subclass should declare the album data that check() reads to decide whether an album passes, so that a check that
+    # passed does not run again after a fix that did not change its inputs. input_fields narrows FIELDS (None = any field).
+    # A check that reads other albums (LIBRARY) runs after the other checks and a pass is never remembered.
+    inputs: frozenset[CheckInput] = frozenset(CheckInput)
+    input_fields: frozenset[BasicField] | None = None
+
+    # subclass must list the global settings (Configuration attribute names) and other checks whose configuration check()
+    # reads, so that a remembered pass is not used after they change
+    input_settings: frozenset[str] = frozenset()
+    input_check_configs: frozenset[str] = frozenset()
+
     # subclass may use these instance values
     ctx: Context
     session: Session
@@ -32,9 +47,29 @@ class Check:
     def init(self, check_config: CheckConfiguration):
         pass
 
+    def prepare(self) -> None:
+        """Called before checking albums, and again if a fix may have changed other albums. A check that depends on other
+        albums should query the whole library here in one pass, so that check() only needs to look up each album."""
+        pass
+
+    def affected_by(self, write_set: WriteSet) -> bool:
+        """Whether tag changes could change the result of this check."""
+        if write_set and CheckInput.STREAM in self.inputs:
+            return True  # file sizes and timestamps changed
+        if write_set.pictures and CheckInput.PICTURES in self.inputs:
+            return True
+        if not write_set.fields or CheckInput.FIELDS not in self.inputs:
+            return False
+        if self.input_fields is None:
+            return True
+        # other field names (such as legacy fields) could replace any field
+        return any(not isinstance(field, BasicField) or field in self.input_fields for field in write_set.fields)
+
     def __init__(self, ctx: Context, tagger: AlbumTaggerProvider | None = None, session: Session | None = None):
         self.ctx = ctx
         # note "real" non-test code should always provide tagger and managed session
-        self.tagger = tagger if tagger else AlbumTaggerProvider(ctx.config.library, id3v1=ctx.config.id3v1)
+        self.tagger = (
+            tagger if tagger else AlbumTaggerProvider(ctx.config.library, id3v1=ctx.config.id3v1, padding=PaddingPolicy(ctx.config.tag_padding))
+        )
         self.session = session if session else (Session(ctx.db) if hasattr(ctx, "db") else Session())
         self.init(ctx.config.checks[self.name])
@@ -7,7 +7,7 @@ from albums.entities import Album
 from albums.tagger import AlbumTagger, BasicField, Cap
 
 from .base_check import Check
-from .check_types import CheckResult, Fixer, FixResult
+from .check_types import CheckInput, CheckResult, Fixer, FixResult
 from .field_policy import Policy, check_policy
 
 logger: Final = logging.getLogger(__name__)
@@ -17,6 +17,8 @@ class BaseCheckFieldPerAlbum(Check):
     # subclass must define check name and album field to check
     name: str
     field: BasicField
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
 
     # subclass may override
     # force presence to NEVER when album is a mix of vorbis-comment and non-vorbis-comment tracks
@@ -33,6 +35,7 @@ class BaseCheckFieldPerAlbum(Check):
         if not self.field_description:
             self.field_description = self.field.value
         self.option_remove_field = f">> Remove {self.field_description} from all tracks"
+        self.input_fields = frozenset((self.field,))
 
     def check(self, album: Album):
         if not all(AlbumTagger.supports(track.filename, Cap.BASIC_FIELDS) for track in album.tracks):
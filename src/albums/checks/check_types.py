@@ -31,6 +31,16 @@ class FixResult(Enum):
         return FixResult.CHANGED_ALBUM if changed else FixResult.NO_CHANGE
 
 
+class CheckInput(Enum):
+    """Kinds of album data that a check may read to decide whether an album passes."""
+
+    FIELDS = auto()  # Track tag fields, including legacy field names.
+    PICTURES = auto()  # Embedded pictures and picture files.
+    FILES = auto()  # Album path, filenames and other files in the folder, which tag writes do not change.
+    STREAM = auto()  # Audio stream properties, file sizes and timestamps.
+    LIBRARY = auto()  # Other albums in the library.
+
+
 @dataclass
 class Fixer:
     """Encapsulates a proposed correction along with user-interface hints for interactive mode.
@@ -1,24 +1,40 @@
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from pathlib import Path
 from typing import Final, Mapping, Sequence
 
+from rich.console import Console
 from rich.markup import escape
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from albums.app import Context
-from albums.database import Match, load_album_entities
+from albums.config import Configuration
+from albums.database import Match, db_open, load_album_entities
 from albums.entities import Album
-from albums.interactive import interact, prompt_ignore_checks
+from albums.interactive import prompt_ignore_checks
+from albums.interactive.interact import interact
 from albums.library import run_scan
-from albums.tagger import AlbumTaggerProvider
+from albums.tagger import AlbumTaggerProvider, PaddingPolicy, WriteSet
+from albums.words import plural
 
 from .all import ALL_CHECKS
 from .base_check import Check
 from .check_types import CheckResult, FixResult
 from .helpers import album_display_name
+from .profiler import CheckProfiler
+from .result_cache import CheckResultCache
+from .scheduler import depends_on_library, schedule_checks
 
 logger: Final = logging.getLogger(__name__)
 
+# Number of albums sent to a worker process at a time when checking in parallel.
+REPORT_CHUNK_SIZE: Final = 32
+
 
 @dataclass(frozen=True)
 class CheckDisposition:
@@ -29,6 +45,22 @@ class CheckDisposition:
     user_quit: bool
     displayed: bool
     suppressed_failure_message: str | None
+    write_set: WriteSet | None = None  # if known, all changes were tag writes
+
+
+@dataclass(frozen=True)
+class AlbumReport:
+    album_id: int | None
+    modified_at: int
+    scanner: int
+    messages: list[str]
+    issues: int
+    checks_passed: set[str]
+    cached: set[str]
+
+
+# checker, check instances, result cache and session of a worker process, set by Checker._init_report_worker
+_report_worker: tuple["Checker", list[Check], CheckResultCache, Session] | None = None
 
 
 class Checker:
@@ -38,17 +70,42 @@ class Checker:
     _fix: bool
     _interactive: bool
     _show_ignore_option: bool
+    _jobs: int
+    _recheck: bool
+    _tagger: AlbumTaggerProvider | None = None
 
-    def __init__(self, ctx: Context, automatic: bool, preview: bool, fix: bool, interactive: bool, show_ignore_option: bool):
+    def __init__(
+        self,
+        ctx: Context,
+        automatic: bool,
+        preview: bool,
+        fix: bool,
+        interactive: bool,
+        show_ignore_option: bool,
+        jobs: int = 1,
+        recheck: bool = False,
+        profiler: CheckProfiler | None = None,
+    ):
         if preview and (automatic or fix or interactive):
             ctx.console.print("--preview cannot be used with other fix options")
             raise SystemExit(1)
+        if jobs > 1 and (automatic or fix or interactive):
+            ctx.console.print("--jobs cannot be used with fix options")
+            raise SystemExit(1)
+        if jobs > 1 and profiler:
+            ctx.console.print("--jobs cannot be used with --profile")
+            raise SystemExit(1)
         self.ctx = ctx
         self._automatic = automatic
         self._preview = preview
         self._fix = fix
         self._interactive = interactive
         self._show_ignore_option = show_ignore_option
+        self._jobs = jobs
+        self._recheck = recheck
+        self._profiler = profiler
+        self._library_checks: list[Check] = []
+        self._stale_checks: set[str] = set()  # checks to prepare again before running them
 
     def run_enabled(self, session: Session) -> int:
         need_checks = self.get_required_disabled_checks()
@@ -61,63 +118,266 @@ class Checker:
             raise ValueError("invalid preview setting")  # not allowed by cli
         preview_failed_checks: list[str] = []
 
-        tagger = AlbumTaggerProvider(self.ctx.config.library, id3v1=self.ctx.config.id3v1)
-        check_instances = [check(self.ctx, tagger=tagger, session=session) for check in ALL_CHECKS if self.ctx.config.checks[check.name]["enabled"]]
+        if self._jobs > 1 and self._report_only():
+            if self.ctx.is_persistent:
+                return self._report_parallel(session)
+            logger.info("checking in a single process because the database is in memory")
+
+        # tag changes are saved before a fix that may change files in other ways, and after checking each album
+        padding = PaddingPolicy(self.ctx.config.tag_padding)
+        tagger = AlbumTaggerProvider(self.ctx.config.library, id3v1=self.ctx.config.id3v1, defer_writes=True, padding=padding)
+        self._tagger = tagger
+        if self._profiler:
+            self._profiler.attach(self.ctx.db, tagger)
+        check_instances = self._create_checks(tagger, session)
+        cache = CheckResultCache(self.ctx, session, self._enabled_checks(), enabled=not self._recheck)
 
         issues_displayed = 0
+        albums_reported = 0
 
         for album in self.ctx.select_album_entities(session):
-            if not (self.ctx.config.library / album.path).is_dir():
-                logger.info(f"album was deleted: {album.path}")
-                run_scan(self.ctx, session, iter([album]))
-                session.commit()
+            if self._scan_deleted(session, album):
                 continue
             logger.info(f"checking album: {album.path}")
+            if self._report_only():
+                report = self._report_album(check_instances, cache, album)
+                for message in report.messages:
+                    self.ctx.console.print(message, highlight=False)
+                issues_displayed += report.issues
+                cache.save(report.album_id, report.modified_at, report.scanner, report.checks_passed, report.cached)
+                albums_reported += 1
+                if albums_reported % REPORT_CHUNK_SIZE == 0:
+                    session.commit()
+                continue
             deleted = False
+            album_changed = False
             check_all = True
-            while check_all and not deleted:
-                preview_failed_checks = []
-                checks_passed: set[str] = set()
-                check_all = False
-                for check in check_instances:
-                    if check.name not in album.ignore_checks:
-                        missing_dependent_checks = check.must_pass_checks - checks_passed
-                        if missing_dependent_checks:
-                            for message in preview_failed_checks:
-                                self.ctx.console.print(message, highlight=False)
-                            preview_failed_checks = []
-                            self.ctx.console.print(
-                                f'[bold]dependency not met for check {check.name}[/bold] on "{album_display_name(self.ctx, album)}": {" and ".join(missing_dependent_checks)} must pass first',
-                                highlight=False,
-                            )
-                            if self._interactive and album.album_id is not None:
-                                prompt_ignore_checks(session, album.album_id, check.name)
+            cached = cache.passed(album.album_id, album.modified_at, album.scanner)
+            checks_passed: set[str] = set()
+            try:
+                while check_all and not deleted:
+                    preview_failed_checks = []
+                    checks_passed = set()
+                    check_all = False
+                    for check in check_instances:
+                        if check.name not in album.ignore_checks:
+                            missing_dependent_checks = check.must_pass_checks - checks_passed
+                            if missing_dependent_checks:
+                                for message in preview_failed_checks:
+                                    self.ctx.console.print(message, highlight=False)
+                                preview_failed_checks = []
+                                self.ctx.console.print(self._dependency_message(check, album, missing_dependent_checks), highlight=False)
+                                if self._interactive and album.album_id is not None:
+                                    prompt_ignore_checks(session, album.album_id, check.name)
 
-                            issues_displayed += 1
+                                issues_displayed += 1
 
+                            elif check.name in cached:
+                                checks_passed.add(check.name)  # passed before, and album and check config have not changed
+                            else:
+                                disposition = self._run_check(session, check, album)
+                                if disposition.displayed:
+                                    issues_displayed += 1
+                                if disposition.deleted:
+                                    deleted = True
+                                    break  # don't run any more checks on this album
+                                if disposition.maybe_changed:
+                                    logger.debug(f"re-run checks after running {check.name}")
+                                    album_changed = True
+                                    if disposition.write_set is None:
+                                        cached.clear()
+                                    else:  # checks that passed do not need to run again if their inputs did not change
+                                        write_set = disposition.write_set
+                                        cached = {
+                                            c.name for c in check_instances if c.name in cached | checks_passed and not c.affected_by(write_set)
+                                        }
+                                        if disposition.passed:
+                                            cached.add(check.name)  # passed when checked again after the fix
+                                    check_all = True  # re-run all checks
+                                    break  # from the beginning
+                                elif disposition.passed:
+                                    checks_passed.add(check.name)
+                                elif disposition.suppressed_failure_message:
+                                    preview_failed_checks.append(disposition.suppressed_failure_message)
                         else:
-                            disposition = self._run_check(session, check, album)
-                            if disposition.displayed:
-                                issues_displayed += 1
-                            if disposition.deleted:
-                                deleted = True
-                                break  # don't run any more checks on this album
-                            if disposition.maybe_changed:
-                                logger.debug(f"commit changes after running {check.name}")
-                                session.commit()
-                                check_all = True  # re-run all checks
-                                break  # from the beginning
-                            elif disposition.passed:
-                                checks_passed.add(check.name)
-                            elif disposition.suppressed_failure_message:
-                                preview_failed_checks.append(disposition.suppressed_failure_message)
-                    else:
-                        logger.debug(f"skipping ignored check {check.name} for album {album.path}")
+                            logger.debug(f"skipping ignored check {check.name} for album {album.path}")
+            finally:
+                tagger.flush()
+            if album_changed and not deleted:
+                # saving deferred tag changes updated file sizes and timestamps
+                run_scan(self.ctx, session, load_album_entities(session, {"path": [Match(album.path)]}))
+                # some fixes only change the database, make sure results from before the fix are not used again
+                album.modified_at = int(datetime.now(UTC).timestamp())
+            elif not deleted:
+                cache.save(album.album_id, album.modified_at, album.scanner, checks_passed, cached)
+            session.commit()
+        session.commit()
+        if self._profiler:
+            self._profiler.detach()
+
+        if padding.in_place or padding.rewrites:
+            message = f"saved tags in {plural(padding.in_place + padding.rewrites, 'file')}: {padding.in_place} updated in place, {padding.rewrites} rewritten"
+            logger.info(message)
+            if self.ctx.verbose:
+                self.ctx.console.print(message)
+        return issues_displayed
+
+    def _report_only(self) -> bool:
+        return not (self._automatic or self._fix or self._interactive)
+
+    def _enabled_checks(self) -> list[type[Check]]:
+        return [check for check in ALL_CHECKS if self.ctx.config.checks[check.name]["enabled"]]
+
+    def _create_checks(self, tagger: AlbumTaggerProvider, session: Session) -> list[Check]:
+        check_instances = [check(self.ctx, tagger=tagger, session=session) for check in schedule_checks(self._enabled_checks())]
+        for check in check_instances:
+            with self._measure(check, "prepare"):
+                check.prepare()
+        self._library_checks = [check for check in check_instances if depends_on_library(check)]
+        return check_instances
+
+    def _library_changed(self, write_set: WriteSet | None = None, fixed_by: Check | None = None):
+        """Prepare checks that depend on other albums again before they run, if the change could affect them. A check that
+        made the change keeps its own state up to date, e.g. the database may still have an album that its fix deleted."""
+        self._stale_checks.update(
+            check.name for check in self._library_checks if check is not fixed_by and (write_set is None or check.affected_by(write_set))
+        )
+
+    def _prepare_if_stale(self, check: Check):
+        if check.name in self._stale_checks:
+            with self._measure(check, "prepare"):
+                check.prepare()
+            self._stale_checks.discard(check.name)
+
+    def _measure(self, check: Check, kind: str) -> AbstractContextManager[None]:
+        if self._profiler is None or (kind == "prepare" and type(check).prepare is Check.prepare):
+            return nullcontext()  # not profiling, or nothing to prepare
+        return self._profiler.measure(check.name, kind)
+
+    def _scan_deleted(self, session: Session, album: Album) -> bool:
+        if (self.ctx.config.library / album.path).is_dir():
+            return False
+        logger.info(f"album was deleted: {album.path}")
+        run_scan(self.ctx, session, iter([album]))
+        session.commit()
+        self._library_changed()
+        return True
+
+    def _report_album(self, check_instances: Sequence[Check], cache: CheckResultCache, album: Album) -> AlbumReport:
+        """Run checks on an album without fixing anything. Checks that passed before on the unchanged album are skipped."""
+        cached = cache.passed(album.album_id, album.modified_at, album.scanner)
+        messages: list[str] = []
+        issues = 0
+        preview_failed_checks: list[str] = []
+        checks_passed: set[str] = set()
+        for check in check_instances:
+            if check.name in album.ignore_checks:
+                logger.debug(f"skipping ignored check {check.name} for album {album.path}")
+                continue
+            missing_dependent_checks = check.must_pass_checks - checks_passed
+            if missing_dependent_checks:
+                messages.extend(preview_failed_checks)
+                preview_failed_checks = []
+                messages.append(self._dependency_message(check, album, missing_dependent_checks))
+                issues += 1
+                continue
+            if check.name in cached:
+                checks_passed.add(check.name)
+                continue
+            self._prepare_if_stale(check)
+            with self._measure(check, "check"):
+                check_result = check.check(album)
+            if not check_result:
+                checks_passed.add(check.name)
+            elif self._preview and check_result.fixer and check_result.fixer.option_automatic_index is not None:
+                messages.extend(self._preview_messages(check, check_result, album))
+                issues += 1
+            elif self._preview:
+                preview_failed_checks.append(self._failure_message(check, check_result, album))
+            else:
+                messages.append(self._failure_message(check, check_result, album))
+                issues += 1
+        return AlbumReport(album.album_id, album.modified_at, album.scanner, messages, issues, checks_passed, cached)
+
+    def _report_parallel(self, session: Session) -> int:
+        album_ids: list[int] = []
+        for album in self.ctx.select_album_entities(session):
+            if not self._scan_deleted(session, album) and album.album_id is not None:
+                album_ids.append(album.album_id)
+        session.commit()
+        if not album_ids:
+            return 0
+
+        # workers can't write to the database, so let checks that depend on the library save what they prepare first
+        tagger = AlbumTaggerProvider(self.ctx.config.library, id3v1=self.ctx.config.id3v1, padding=PaddingPolicy(self.ctx.config.tag_padding))
+        for check in self._enabled_checks():
+            if depends_on_library(check):
+                check(self.ctx, tagger=tagger, session=session).prepare()
         session.commit()
+
+        chunks = [album_ids[start : start + REPORT_CHUNK_SIZE] for start in range(0, len(album_ids), REPORT_CHUNK_SIZE)]
+        logger.info(f"checking {plural(len(album_ids), 'album')} with {plural(min(self._jobs, len(chunks)), 'worker')}")
+        cache = CheckResultCache(self.ctx, session, self._enabled_checks(), enabled=not self._recheck)
+        issues_displayed = 0
+        with ProcessPoolExecutor(
+            max_workers=min(self._jobs, len(chunks)),
+            mp_context=get_context("spawn"),
+            initializer=Checker._init_report_worker,
+            initargs=(self.ctx.config, self.ctx.db_path, self._preview, self._recheck),
+        ) as executor:
+            # results are in library order, as soon as all albums before them are done
+            for reports in executor.map(Checker._report_worker_albums, chunks):
+                for report in reports:
+                    for message in report.messages:
+                        self.ctx.console.print(message, highlight=False)
+                    issues_displayed += report.issues
+                    cache.save(report.album_id, report.modified_at, report.scanner, report.checks_passed, report.cached)
+                session.commit()
         return issues_displayed
 
+    @staticmethod
+    def _init_report_worker(config: Configuration, db_path: Path, preview: bool, recheck: bool):
+        global _report_worker
+        ctx = Context()
+        ctx.console = Console(quiet=True)  # results are printed by the main process
+        ctx.config = config
+        ctx.db_path = db_path
+        ctx.db = db_open(db_path, read_only=True)
+        checker = Checker(ctx, automatic=False, preview=preview, fix=False, interactive=False, show_ignore_option=False, recheck=recheck)
+        session = Session(ctx.db)
+        tagger = AlbumTaggerProvider(config.library, id3v1=config.id3v1, padding=PaddingPolicy(config.tag_padding))
+        cache = CheckResultCache(ctx, session, checker._enabled_checks(), enabled=not recheck)
+        _report_worker = (checker, checker._create_checks(tagger, session), cache, session)
+
+    @staticmethod
+    def _report_worker_albums(album_ids: list[int]) -> list[AlbumReport]:
+        if _report_worker is None:
+            raise RuntimeError("report worker is not initialized")
+        (checker, check_instances, cache, session) = _report_worker
+        albums = {album.album_id: album for album in session.scalars(select(Album).where(Album.album_id.in_(album_ids)))}
+        results = [checker._report_album(check_instances, cache, albums[album_id]) for album_id in album_ids if album_id in albums]
+        session.expunge_all()  # don't keep albums that have been checked
+        session.rollback()
+        return results
+
+    def _dependency_message(self, check: Check, album: Album, missing_dependent_checks: set[str]) -> str:
+        return f'[bold]dependency not met for check {check.name}[/bold] on "{album_display_name(self.ctx, album)}": {" and ".join(sorted(missing_dependent_checks))} must pass first'
+
+    def _preview_messages(self, check: Check, check_result: CheckResult, album: Album) -> list[str]:
+        fixer = check_result.fixer
+        if fixer is None or fixer.option_automatic_index is None:
+            raise ValueError("check result has no automatic fix")
+        return [
+            f'[bold]preview automatic fix {check.name}:[/bold] [bold cyan]"{album_display_name(self.ctx, album)}"[/bold cyan]',
+            f"    {escape(check_result.message)}",
+            f"    {fixer.prompt}: {fixer.options[fixer.option_automatic_index]}",
+        ]
+
+    def _failure_message(self, check: Check, check_result: CheckResult, album: Album) -> str:
+        return f'[bold]{check.name}[/bold] [bold yellow]{escape(check_result.message)}[/bold yellow] : [bold cyan]"{album_display_name(self.ctx, album)}"[/bold cyan]'
+
     def get_required_disabled_checks(self) -> Mapping[str, Sequence[str]]:
-        check_classes = [check for check in ALL_CHECKS if self.ctx.config.checks[check.name]["enabled"]]
+        check_classes = self._enabled_checks()
         enabled = set(check.name for check in check_classes)
         required_disabled: dict[str, list[str]] = {}
         for check in check_classes:
@@ -137,9 +397,17 @@ class Checker:
         quit = False
         displayed = False
         suppressed_failure_message = None
+        write_set: WriteSet | None = WriteSet()
         while maybe_fixable and not passed and not quit and not deleted:
-            check_result = check.check(album)
+            self._prepare_if_stale(check)
+            with self._measure(check, "check"):
+                check_result = check.check(album)
             if check_result:
+                album_tagger = self._tagger.get(album.path) if self._tagger else None
+                if album_tagger:
+                    album_tagger.take_write_set()  # only track changes made by the fix
+                    if not check.tag_writes_only or self._will_interact(check_result):
+                        album_tagger.flush()  # fix may change files in other ways, or the user may change them in another program
                 disposition = self._handle_check_result(session, check, check_result, album)
                 if disposition.suppressed_failure_message:
                     suppressed_failure_message = disposition.suppressed_failure_message
@@ -151,15 +419,41 @@ class Checker:
                 if not deleted and disposition.maybe_changed:
                     session.flush()
                     path = album.path
-                    (_, any_changes) = run_scan(self.ctx, session, load_album_entities(session, {"path": [Match(path)]}), reread=True)
+                    fix_writes = album_tagger.take_write_set() if album_tagger and check.tag_writes_only else None
+                    if fix_writes and write_set is not None:
+                        # the fix only wrote tags through the tagger, so only those need to be scanned again
+                        write_set = write_set.union(fix_writes)
+                        self._library_changed(fix_writes, check)
+                        with self._measure(check, "rescan"):
+                            (_, any_changes) = run_scan(
+                                self.ctx, session, load_album_entities(session, {"path": [Match(path)]}), tagger=self._tagger, write_set=fix_writes
+                            )
+                    else:
+                        # the fix may have changed anything, e.g. in an external tagger
+                        write_set = None
+                        self._library_changed(fixed_by=check)
+                        if album_tagger:
+                            album_tagger.flush()  # read the files as they are now, not files opened before the fix
+                        with self._measure(check, "rescan"):
+                            (_, any_changes) = run_scan(
+                                self.ctx, session, load_album_entities(session, {"path": [Match(path)]}), reread=True, tagger=self._tagger
+                            )
                     maybe_fixable = any_changes
                 elif deleted:
                     run_scan(self.ctx, session, iter([album]))  # delete immediately
+                    self._library_changed()
                 else:
                     maybe_fixable = False
             else:
                 passed = True
-        return CheckDisposition(passed, maybe_changed, deleted, quit, displayed, suppressed_failure_message)
+        return CheckDisposition(passed, maybe_changed, deleted, quit, displayed, suppressed_failure_message, write_set)
+
+    def _will_interact(self, check_result: CheckResult) -> bool:
+        """Whether ``_handle_check_result`` will ask the user what to do, instead of fixing automatically or only reporting."""
+        fixer = check_result.fixer
+        if fixer and fixer.option_automatic_index is not None and (self._preview or self._automatic):
+            return False
+        return self._interactive or (fixer is not None and self._fix)
 
     def _handle_check_result(self, session: Session, check: Check, check_result: CheckResult, album: Album) -> CheckDisposition:
         fixer = check_result.fixer
@@ -169,11 +463,8 @@ class Checker:
         user_quit = False
         suppressed_failure_message = None
         if self._preview and fixer and fixer.option_automatic_index is not None:
-            self.ctx.console.print(
-                f'[bold]preview automatic fix {check.name}:[/bold] [bold cyan]"{album_display_name(self.ctx, album)}"[/bold cyan]', highlight=False
-            )
-            self.ctx.console.print(f"    {escape(check_result.message)}", highlight=False)
-            self.ctx.console.print(f"    {fixer.prompt}: {fixer.options[fixer.option_automatic_index]}", highlight=False)
+            for message in self._preview_messages(check, check_result, album):
+                self.ctx.console.print(message, highlight=False)
             displayed_any = True
         elif self._automatic and fixer and fixer.option_automatic_index is not None:
             self.ctx.console.print(
@@ -181,7 +472,8 @@ class Checker:
                 highlight=False,
             )
             self.ctx.console.print(f"    {fixer.prompt}: {fixer.options[fixer.option_automatic_index]}", highlight=False)
-            fix_result = fixer.fix(fixer.options[fixer.option_automatic_index])
+            with self._measure(check, "fix"):
+                fix_result = fixer.fix(fixer.options[fixer.option_automatic_index])
             maybe_changed = fix_result != FixResult.NO_CHANGE
             deleted = fix_result == FixResult.DELETED_ALBUM
             displayed_any = True
@@ -191,7 +483,7 @@ class Checker:
             (maybe_changed, deleted, user_quit) = interact(self.ctx, session, check.name, check_result, album, self._show_ignore_option)
             displayed_any = True
         else:
-            message = f'[bold]{check.name}[/bold] [bold yellow]{escape(check_result.message)}[/bold yellow] : [bold cyan]"{album_display_name(self.ctx, album)}"[/bold cyan]'
+            message = self._failure_message(check, check_result, album)
             if self._preview:
                 suppressed_failure_message = message
             else:
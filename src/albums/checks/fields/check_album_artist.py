@@ -5,7 +5,7 @@ from typing import Any, Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import format_field_values
 from albums.entities import Album
 from albums.tagger import AlbumTagger, BasicField, Cap
@@ -19,6 +19,9 @@ OPTION_COPY_ALBUM_ARTIST_TO_ARTIST: Final = ">> Copy album artist -> artist"
 
 class CheckAlbumArtist(Check):
     name = "album-artist"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = frozenset({BasicField.ARTIST, BasicField.ALBUMARTIST})
     default_config = {"enabled": True, "remove_redundant": False, "require_redundant": False}
     must_pass_checks = {"legacy-fields"}
 
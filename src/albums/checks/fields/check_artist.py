@@ -6,7 +6,7 @@ from typing import Any, Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import format_field_values
 from albums.entities import Album
 from albums.tagger import AlbumTagger, BasicField, Cap
@@ -17,6 +17,9 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckArtistField(Check):
     name = "artist"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = frozenset({BasicField.ARTIST, BasicField.ALBUMARTIST})
     default_config = {
         "enabled": True,
         "ignore_parent_folders": ["compilation", "compilations", "soundtrack", "soundtracks", "various artists"],
@@ -1,9 +1,8 @@
 from itertools import chain
 from shutil import rmtree
-from typing import Final, Sequence, override
+from typing import Any, Final, Sequence, override
 
 import humanize
-from prompt_toolkit.shortcuts import confirm
 from rich.console import RenderableType
 from rich.markup import escape
 from sqlalchemy import select
@@ -11,9 +10,9 @@ from sqlalchemy.orm import Session
 
 from albums.app import Context
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album, OtherFile, PictureFile, Track
-from albums.tagger import AlbumTaggerProvider
+from albums.tagger import AlbumTaggerProvider, BasicField
 
 OPTION_DELETE_OTHER: Final = ">> KEEP left (THIS album) and DELETE right (other): "
 OPTION_KEEP_OTHER: Final = ">> DELETE left (THIS album) and KEEP right (other): "
@@ -21,24 +20,36 @@ OPTION_KEEP_OTHER: Final = ">> DELETE left (THIS album) and KEEP right (other):
 
 class CheckDuplicateAlbum(Check):
     name = "duplicate-album"
-    default_config = {"enabled": True}
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.LIBRARY})
+    input_fields = frozenset({BasicField.ALBUM, BasicField.ARTIST, BasicField.ALBUMARTIST})
+    default_config = {"enabled": True, "match": "normalized", "min_similarity": 0.8}
     must_pass_checks = {"album", "artist"}
 
     def __init__(self, ctx: Context, tagger: AlbumTaggerProvider | None = None, session: Session | None = None):
         super().__init__(ctx, tagger, session)
+        self._prepared = False
 
-        from albums.library import DuplicateFinder  # avoid circular import when all checks are imported
+    def init(self, check_config: dict[str, Any]):
+        from albums.library import DuplicateFinder, NameMatch  # avoid circular import when all checks are imported
 
-        self._duplicates = DuplicateFinder()
+        match = NameMatch.from_str(str(check_config.get("match", CheckDuplicateAlbum.default_config["match"])))
+        min_similarity = float(check_config.get("min_similarity", CheckDuplicateAlbum.default_config["min_similarity"]))
+        self._duplicates = DuplicateFinder(match, min_similarity)
+
+    @override
+    def prepare(self):
         # tell user about the delay so the check can be disabled if unwanted
-        with ctx.console.status(f"Initializing [bold]{self.name}[/bold] check [italic](disable check to skip)[/italic]", spinner="bouncingBar"):
+        with self.ctx.console.status(f"Initializing [bold]{self.name}[/bold] check [italic](disable check to skip)[/italic]", spinner="bouncingBar"):
             self._duplicates.start(self.session)
+        self._prepared = True
 
     @override
     def check(self, album: Album) -> CheckResult | None:
         if not self.ctx.is_persistent:
             return None
 
+        if not self._prepared:
+            self.prepare()
         duplicate_ids = self._duplicates.find(album)
         if not duplicate_ids:
             return None
@@ -84,6 +95,8 @@ class CheckDuplicateAlbum(Check):
         raise ValueError(f"invalid option {option}")
 
     def _confirm_delete(self, album: Album):
+        from prompt_toolkit.shortcuts import confirm  # prompt_toolkit is slow to import and only needed for this fix
+
         path = self.ctx.config.library / album.path
         if confirm(f'Are you sure you want to permanently delete "{str(path)}"?'):
             num = 0
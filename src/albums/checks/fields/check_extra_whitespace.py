@@ -3,7 +3,7 @@ from typing import Collection
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.tagger import AlbumTagger, BasicField, Cap
 from albums.words import plural
@@ -11,6 +11,8 @@ from albums.words import plural
 
 class CheckExtraWhitespace(Check):
     name = "extra-whitespace"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
     default_config = {"enabled": True}
 
     def check(self, album: Album):
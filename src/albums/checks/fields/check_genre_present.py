@@ -4,7 +4,7 @@ from typing import Any, Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.field_policy import Policy, check_policy
 from albums.entities import Album
 from albums.tagger import AlbumTagger, BasicField, Cap
@@ -14,6 +14,9 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckGenrePresent(Check):
     name = "genre-present"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = frozenset({BasicField.GENRE})
     default_config = {
         "enabled": True,
         "presence": "consistent",
@@ -3,7 +3,7 @@ from typing import Final, override
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.tagger import LEGACY_VORBIS_FIELDS, BasicField
 
@@ -14,6 +14,8 @@ OPTION_CONVERT_LEGACY = ">> Convert legacy fields to standard fields"
 
 class CheckLegacyFields(Check):
     name = "legacy-fields"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS})
     default_config = {"enabled": True}
 
     @override
@@ -4,7 +4,7 @@ from typing import Any, Collection, Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.tagger import AlbumTagger, BasicField, Cap
 
@@ -43,6 +43,9 @@ DEPRECATED_MBID_FIELDS: Final = frozenset((BasicField.MUSICBRAINZ_TRMID,))
 
 class CheckMusicBrainzFields(Check):
     name = "musicbrainz-fields"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = ALL_MBID_FIELDS | {BasicField.MUSICBRAINZ_ALBUMRELEASETYPE}
     default_config = {"enabled": True, "remove_all": False, "remove_deprecated": True}
 
     def init(self, check_config: dict[str, Any]):
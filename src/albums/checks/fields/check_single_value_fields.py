@@ -5,7 +5,7 @@ import yaml
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import describe_track_number, ordered_tracks
 from albums.entities import Album
 from albums.tagger import BASIC_FIELDS, AlbumTagger, BasicField, Cap
@@ -16,6 +16,8 @@ OPTION_REMOVE_DUPLICATES_ONLY: Final = ">> Remove duplicate values (preserve uni
 
 class CheckSingleValueFields(Check):
     name = "single-value-fields"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
     default_config = {"enabled": True, "fields": ["artist", "title"], "concatenators": [" / ", "/", " - "], "automatic_concatenate": True}
 
     def init(self, check_config: dict[str, Any]):
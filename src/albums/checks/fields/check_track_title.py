@@ -4,7 +4,7 @@ from typing import Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import format_field_values, parse_filename
 from albums.entities import Album, Track
 from albums.tagger import AlbumTagger, BasicField, Cap
@@ -17,6 +17,9 @@ OPTION_USE_PROPOSED: Final = ">> Use proposed track titles"
 
 class CheckTrackTitle(Check):
     name = "track-title"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = frozenset({BasicField.TITLE})
     default_config = {"enabled": True}
 
     def check(self, album: Album):
@@ -1,8 +1,10 @@
 import re
 from collections import defaultdict
+from functools import lru_cache
 from os import unlink
 from typing import Collection, Final, List, Mapping, Sequence, Tuple
 
+from pathvalidate import ValidationError, sanitize_filename, validate_filename
 from rich.markup import escape
 
 from albums.app import Context
@@ -12,10 +14,17 @@ from albums.tagger import BasicField
 from .check_types import FixResult
 
 FRONT_COVER_FILENAME: Final = "cover"
+NUMBERING_FIELDS: Final = frozenset((BasicField.TRACKNUMBER, BasicField.TRACKTOTAL, BasicField.DISCNUMBER, BasicField.DISCTOTAL))
+
+_FILENAME_PARSER: Final = re.compile("(?P<track1>\\d+)?(?:-(?P<track2>\\d+)?)?(?:[\\s\\-]+|\\.\\s+)?(?P<title>.*)(?:\\s+)?\\.\\w+")
 
 
 def album_display_name(ctx: Context, album: Album) -> str:
-    return ctx.config.library.name if album.path == "." else escape(album.path + " ").strip()
+    return path_display_name(ctx, album.path)
+
+
+def path_display_name(ctx: Context, path: str) -> str:
+    return ctx.config.library.name if path == "." else escape(path + " ").strip()
 
 
 def get_tracks_by_disc(tracks: Sequence[Track]) -> Mapping[int, List[Track]] | None:
@@ -81,9 +90,9 @@ def format_field_values(values: Sequence[str] | None) -> str:
     return escape(str(values))
 
 
+@lru_cache(maxsize=4096)
 def parse_filename(filename: str) -> Tuple[int | None, int | None, str | None]:
-    filename_parser = "(?P<track1>\\d+)?(?:-(?P<track2>\\d+)?)?(?:[\\s\\-]+|\\.\\s+)?(?P<title>.*)(?:\\s+)?\\.\\w+"
-    match = re.fullmatch(filename_parser, filename)
+    match = _FILENAME_PARSER.fullmatch(filename)
     if not match:
         return (None, None, None)
     title = str(match.group("title"))
@@ -103,6 +112,25 @@ def parse_filename(filename: str) -> Tuple[int | None, int | None, str | None]:
     return (disc, track, title if title else None)
 
 
+@lru_cache(maxsize=4096)
+def filename_issue(filename: str, platform: str) -> str | None:
+    """Describe why a filename is not valid on the platform, or None if it is valid.
+
+    Results are cached because checks validate and generate the same filenames many times while checking and fixing an album.
+    """
+    try:
+        validate_filename(filename, platform=platform)
+        return None
+    except ValidationError as ex:
+        return repr(ex)
+
+
+@lru_cache(maxsize=4096)
+def sanitized_filename(filename: str, replacement_text: str, platform: str) -> str:
+    """Cached ``pathvalidate.sanitize_filename``, see ``filename_issue``."""
+    return sanitize_filename(filename, replacement_text=replacement_text, platform=platform)
+
+
 def delete_files_except(ctx: Context, keep_filename: str | None, album: Album, filenames: Collection[str]):
     if keep_filename is not None and keep_filename not in filenames:
         raise ValueError(f"invalid option {keep_filename} is not one of {filenames}")
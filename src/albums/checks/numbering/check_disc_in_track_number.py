@@ -5,7 +5,8 @@ from typing import Final, Sequence
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
+from albums.checks.helpers import NUMBERING_FIELDS
 from albums.entities import Album, Track
 from albums.tagger import AlbumTagger, BasicField, Cap
 
@@ -15,10 +16,14 @@ logger: Final = logging.getLogger(__name__)
 
 
 OPTION_USE_PROPOSED: Final = ">> Split track number into disc number and track number"
+_DISC_DASH_TRACK: Final = re.compile("\\d+-\\d+")
 
 
 class CheckDiscInTrackNumber(Check):
     name = "disc-in-track-number"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = NUMBERING_FIELDS
     default_config = {"enabled": True}
 
     def check(self, album: Album):
@@ -57,5 +62,5 @@ class CheckDiscInTrackNumber(Check):
 
 def all_tracks_discnumber_in_tracknumber(tracks: Sequence[Track]):
     any_discnumber = any(track.has(BasicField.DISCNUMBER) for track in tracks)
-    all_tracknumber_with_dashes = all(re.fullmatch("\\d+-\\d+", "|".join(track.get(BasicField.TRACKNUMBER, default=[]))) for track in tracks)
+    all_tracknumber_with_dashes = all(_DISC_DASH_TRACK.fullmatch("|".join(track.get(BasicField.TRACKNUMBER, default=[]))) for track in tracks)
     return not any_discnumber and all_tracknumber_with_dashes
@@ -4,9 +4,9 @@ from typing import Any, Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.field_policy import Policy, check_policy
-from albums.checks.helpers import describe_track_number, get_tracks_by_disc, ordered_tracks
+from albums.checks.helpers import NUMBERING_FIELDS, describe_track_number, get_tracks_by_disc, ordered_tracks
 from albums.entities import Album
 from albums.tagger import AlbumTagger, BasicField, Cap
 from albums.words import pluralize
@@ -20,6 +20,9 @@ OPTION_SET_DISC_TOTAL: Final = ">> Set disc total"
 
 class CheckDiscNumbering(Check):
     name = "disc-numbering"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = NUMBERING_FIELDS
     default_config = {"enabled": True, "discs_in_separate_folders": True, "disctotal_policy": "consistent", "remove_redundant_discnumber": False}
     must_pass_checks = {"legacy-fields", "invalid-track-or-disc-number"}
 
@@ -4,7 +4,8 @@ from typing import Collection, Final, Mapping, Sequence
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
+from albums.checks.helpers import NUMBERING_FIELDS
 from albums.entities import Album, Track
 from albums.tagger import AlbumTagger, BasicField, Cap
 
@@ -18,6 +19,9 @@ SINGLE_POSITIVE_NUMBER_FIELDS: Final = [BasicField.TRACKNUMBER, BasicField.TRACK
 
 class CheckInvalidTrackOrDiscNumber(Check):
     name = "invalid-track-or-disc-number"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = NUMBERING_FIELDS
     default_config = {"enabled": True}
     must_pass_checks = {"disc-in-track-number"}
 
@@ -7,9 +7,9 @@ from rich.markup import escape
 
 from albums.app import Context
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.field_policy import Policy, check_policy
-from albums.checks.helpers import describe_track_number, get_tracks_by_disc, ordered_tracks, parse_filename
+from albums.checks.helpers import NUMBERING_FIELDS, describe_track_number, get_tracks_by_disc, ordered_tracks, parse_filename
 from albums.entities import Album, Track
 from albums.tagger import AlbumTagger, BasicField, Cap
 from albums.words import plural, pluralize
@@ -87,6 +87,9 @@ class TrackTotalFixer(Fixer):
 
 class CheckTrackNumbering(Check):
     name = "track-numbering"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = NUMBERING_FIELDS
     default_config = {"enabled": True, "ignore_folders": ["misc"], "tracktotal_policy": "consistent"}
     must_pass_checks = {"disc-numbering"}
 
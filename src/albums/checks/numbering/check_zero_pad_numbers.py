@@ -6,8 +6,8 @@ from rich.console import RenderableType
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
-from albums.checks.helpers import get_tracks_by_disc
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
+from albums.checks.helpers import NUMBERING_FIELDS, get_tracks_by_disc
 from albums.entities import Album, Track
 from albums.tagger import AlbumTagger, BasicField, Cap
 
@@ -51,6 +51,9 @@ def apply_pad_policy(number_str: str, policy: ZeroPadPolicy, total_item_count: i
 
 class CheckZeroPadNumbers(Check):
     name = "zero-pad-numbers"
+    tag_writes_only = True
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = NUMBERING_FIELDS
     default_config = {
         "enabled": True,
         "tracknumber_pad": "two_digit_minimum",
@@ -1,24 +1,42 @@
+from typing import Final
+
 from sqlalchemy import and_, func, select
+from sqlalchemy.orm import aliased
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult
+from albums.checks.check_types import CheckInput, CheckResult
 from albums.checks.helpers import album_display_name
 from albums.entities import Album
 from albums.words import a_plural, is_plural
 
+# sorts after any path that starts with the same prefix
+MAX_CHAR: Final = "\U0010ffff"
+
 
 class CheckAlbumUnderAlbum(Check):
     name = "album-under-album"
+    inputs = frozenset({CheckInput.FILES, CheckInput.LIBRARY})
     default_config = {"enabled": True}
 
-    def check(self, album: Album):
-        path = album.path
-        like_path = path.replace("|", "||").replace("%", "|%").replace("_", "|_") + "%"
-        (matches,) = (
-            self.session.execute(select(func.count("*")).select_from(Album).filter(and_(Album.path != path, Album.path.like(like_path, "|"))))
-            .tuples()
-            .one()
+    _albums_under: dict[str, int] | None = None
+
+    def prepare(self):
+        # paths under an album path are a range of the album.path index. The comparison is case-sensitive, unlike the LIKE
+        # query this replaced, so Foo/qux/ is not under foo/ on a case-sensitive file system
+        parent = aliased(Album)
+        child = aliased(Album)
+        stmt = (
+            select(parent.path, func.count())
+            .select_from(parent)
+            .join(child, and_(child.path > parent.path, child.path < parent.path + MAX_CHAR))
+            .group_by(parent.path)
         )
+        self._albums_under = {path: count for (path, count) in self.session.execute(stmt).tuples()}
+
+    def check(self, album: Album):
+        if self._albums_under is None:
+            self.prepare()
+        matches = self._albums_under.get(album.path, 0) if self._albums_under else 0
 
         if matches > 0:
             return CheckResult(
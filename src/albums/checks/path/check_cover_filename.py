@@ -7,7 +7,7 @@ from PIL import Image
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.tagger import PictureType
 from albums.utility import read_binary_file
@@ -15,6 +15,7 @@ from albums.utility import read_binary_file
 
 class CheckCoverFilename(Check):
     name = "cover-filename"
+    inputs = frozenset({CheckInput.FILES, CheckInput.PICTURES})
     default_config = {"enabled": True, "filename": "cover.*", "jpeg_quality": 90}
 
     def init(self, check_config: dict[str, Any]):
@@ -2,7 +2,7 @@ import logging
 from collections import defaultdict
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult
+from albums.checks.check_types import CheckInput, CheckResult
 from albums.entities import Album
 
 logger = logging.getLogger(__name__)
@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 class CheckDuplicatePathname(Check):
     name = "duplicate-pathname"
+    inputs = frozenset({CheckInput.FILES})
     default_config = {"enabled": True}
 
     def check(self, album: Album):
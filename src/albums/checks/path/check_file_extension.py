@@ -7,7 +7,7 @@ from typing import Final, Sequence, Tuple, override
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckConfiguration, CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckConfiguration, CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.tagger import AUDIO_FILE_SUFFIXES
 from albums.words import pluralize
@@ -17,6 +17,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckFileExtension(Check):
     name = "file-extension"
+    inputs = frozenset({CheckInput.FILES})
     default_config = {"enabled": True, "lowercase_all": False}
     must_pass_checks = {"illegal-pathname"}
 
@@ -5,11 +5,11 @@ from pathlib import Path
 from string import Template
 from typing import Any, Final
 
-from pathvalidate import sanitize_filename
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
+from albums.checks.helpers import sanitized_filename
 from albums.entities import Album
 from albums.tagger import BasicField
 from albums.utility import get_album_name_from_tracks, get_artist_from_tracks
@@ -19,6 +19,9 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckFolderName(Check):
     name = "folder-name"
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = frozenset({BasicField.ALBUM, BasicField.ARTIST, BasicField.ALBUMARTIST})
+    input_settings = frozenset({"path_compatibility", "path_replace_slash", "path_replace_invalid"})
     default_config = {"enabled": True, "format": "$album", "ignore_folders": ["misc"]}
     must_pass_checks = {"album", "artist"}
 
@@ -93,7 +96,4 @@ class CheckFolderName(Check):
         album_name = get_album_name_from_tracks(album)
         folder_name = self.format.safe_substitute({"artist": artist, "album": album_name})
         folder_name = folder_name.replace("/", self.ctx.config.path_replace_slash)
-        folder_name = sanitize_filename(
-            folder_name, replacement_text=self.ctx.config.path_replace_invalid, platform=self.ctx.config.path_compatibility
-        )
-        return folder_name
+        return sanitized_filename(folder_name, self.ctx.config.path_replace_invalid, self.ctx.config.path_compatibility)
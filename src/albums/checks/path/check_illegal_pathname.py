@@ -2,11 +2,11 @@ import logging
 from os import rename
 from typing import Final
 
-from pathvalidate import ValidationError, sanitize_filename, validate_filename
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
+from albums.checks.helpers import filename_issue, sanitized_filename
 from albums.entities import Album
 from albums.words import pluralize
 
@@ -15,6 +15,8 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckIllegalPathname(Check):
     name = "illegal-pathname"
+    inputs = frozenset({CheckInput.FILES})
+    input_settings = frozenset({"path_compatibility"})
     default_config = {"enabled": True}
 
     def check(self, album: Album):
@@ -39,14 +41,11 @@ class CheckIllegalPathname(Check):
             )
 
     def _check(self, filename: str) -> set[str]:
-        try:
-            validate_filename(filename, platform=self.ctx.config.path_compatibility)
-            return set()
-        except ValidationError as ex:
-            return {f"{repr(ex)}"}
+        issue = filename_issue(filename, self.ctx.config.path_compatibility)
+        return {issue} if issue else set()
 
     def _sanitize(self, filename: str) -> str:
-        return sanitize_filename(filename, replacement_text=self.ctx.config.path_replace_invalid, platform=self.ctx.config.path_compatibility)
+        return sanitized_filename(filename, self.ctx.config.path_replace_invalid, self.ctx.config.path_compatibility)
 
     def _fix_sanitize_filenames(self, album: Album):
         changed = False
@@ -3,12 +3,12 @@ from pathlib import Path
 from string import Template
 from typing import Any, Literal, Sequence
 
-from pathvalidate import sanitize_filename
 from rich.console import RenderableType
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
+from albums.checks.helpers import NUMBERING_FIELDS, sanitized_filename
 from albums.checks.numbering.check_zero_pad_numbers import CheckZeroPadNumbers, ZeroPadPolicy, apply_pad_policy
 from albums.entities import Album, Track
 from albums.tagger import BasicField, Cap
@@ -16,6 +16,10 @@ from albums.tagger import BasicField, Cap
 
 class CheckTrackFilename(Check):
     name = "track-filename"
+    inputs = frozenset({CheckInput.FIELDS, CheckInput.FILES})
+    input_fields = NUMBERING_FIELDS | {BasicField.TITLE, BasicField.ARTIST, BasicField.ALBUMARTIST}
+    input_settings = frozenset({"path_compatibility", "path_replace_slash", "path_replace_invalid"})
+    input_check_configs = frozenset({CheckZeroPadNumbers.name})
     default_config = {"enabled": True, "format": "$track_auto $title_auto", "join_multiple": ", "}
     must_pass_checks = {"album-artist", "artist", "track-numbering", "track-title"}
 
@@ -97,10 +101,7 @@ class CheckTrackFilename(Check):
             }
         )
         filename = filename.replace("/", self.ctx.config.path_replace_slash)
-        filename = sanitize_filename(
-            filename + Path(track.filename).suffix, replacement_text=self.ctx.config.path_replace_invalid, platform=self.ctx.config.path_compatibility
-        )
-        return filename
+        return sanitized_filename(filename + Path(track.filename).suffix, self.ctx.config.path_replace_invalid, self.ctx.config.path_compatibility)
 
     def _fix_use_generated(self, album: Album):
         album_path = self.ctx.config.library / album.path
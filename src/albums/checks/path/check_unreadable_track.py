@@ -5,7 +5,7 @@ from typing import Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.words import plural
 
@@ -17,6 +17,7 @@ OPTION_RENAME_UNREADABLE: Final = ">> Rename unreadable tracks to <filename>.unr
 
 class CheckUnreadableTrack(Check):
     name = "unreadable-track"
+    inputs = frozenset({CheckInput.STREAM})
     default_config = {"enabled": True}
 
     def check(self, album: Album):
@@ -7,7 +7,7 @@ import humanize
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import FRONT_COVER_FILENAME
 from albums.entities import Album
 from albums.interactive import render_image_table
@@ -18,6 +18,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckAlbumArt(Check):
     name = "album-art"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {
         "enabled": True,
         "embedded_size_max": 4 * 1024 * 1024,  # up to 16 MB is OK in ID3v2
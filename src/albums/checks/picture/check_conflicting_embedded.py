@@ -5,7 +5,7 @@ from typing import Any
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult
+from albums.checks.check_types import CheckInput, CheckResult
 from albums.entities import Album
 from albums.tagger import Picture, PictureType
 from albums.words import is_plural
@@ -13,6 +13,7 @@ from albums.words import is_plural
 
 class CheckConflictingEmbedded(Check):
     name = "conflicting-embedded"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {"enabled": True, "cover_only": False}
     must_pass_checks = {"duplicate-image"}
 
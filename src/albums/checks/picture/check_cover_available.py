@@ -12,7 +12,7 @@ from typing import Any, Dict, Final, List, Mapping, Sequence
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import FRONT_COVER_FILENAME
 from albums.checks.picture.check_cover_dimensions import CheckCoverDimensions
 from albums.entities import Album
@@ -28,6 +28,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckCoverAvailable(Check):
     name = "cover-available"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {"enabled": True, "cover_required": False, "get_cover_command": ""}
     must_pass_checks = {"duplicate-image"}
 
@@ -9,7 +9,7 @@ from PIL import Image
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album, PictureFile
 from albums.interactive import render_image_table
 from albums.picture import SUPPORTED_IMAGE_MIME_TYPES, PictureInfo, format_to_mime_type, get_depth_bpp, mime_type_to_format
@@ -20,6 +20,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckCoverDimensions(Check):
     name = "cover-dimensions"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {
         "enabled": True,
         "min_pixels": 100,
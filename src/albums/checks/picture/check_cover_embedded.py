@@ -8,7 +8,7 @@ from rich.console import RenderableType
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import FRONT_COVER_FILENAME
 from albums.entities import Album, PictureFile
 from albums.interactive import render_image_table
@@ -22,6 +22,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckCoverEmbedded(Check):
     name = "cover-embedded"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {
         "enabled": True,
         "max_height_width": 1000,
@@ -7,7 +7,7 @@ from typing import Collection, Final, Sequence
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.checks.helpers import delete_files_except
 from albums.entities import Album
 from albums.interactive import render_image_table
@@ -22,6 +22,7 @@ OPTION_SELECT_COVER_IMAGE: Final = ">> Mark as front cover source: "
 
 class CheckCoverUnique(Check):
     name = "cover-unique"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {"enabled": True}
     must_pass_checks = {"duplicate-image"}
 
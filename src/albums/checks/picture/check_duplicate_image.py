@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any, Final
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer
+from albums.checks.check_types import CheckInput, CheckResult, Fixer
 from albums.checks.helpers import delete_files_except
 from albums.entities import Album
 from albums.interactive import render_image_table
@@ -16,6 +16,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckDuplicateImage(Check):
     name = "duplicate-image"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {"enabled": True, "cover_only": False}
     must_pass_checks = {"invalid-image"}
 
@@ -7,7 +7,7 @@ from rich.console import RenderableType
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.picture import SUPPORTED_IMAGE_SUFFIXES
 from albums.tagger import Cap
@@ -18,6 +18,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckInvalidImage(Check):
     name = "invalid-image"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {"enabled": True}
 
     def check(self, album: Album) -> CheckResult | None:
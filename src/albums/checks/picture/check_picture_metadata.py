@@ -7,7 +7,7 @@ from typing import Final
 from rich.markup import escape
 
 from albums.checks.base_check import Check
-from albums.checks.check_types import CheckResult, Fixer, FixResult
+from albums.checks.check_types import CheckInput, CheckResult, Fixer, FixResult
 from albums.entities import Album
 from albums.tagger import AlbumTagger, Cap, Picture
 from albums.words import plural, pluralize
@@ -17,6 +17,7 @@ logger: Final = logging.getLogger(__name__)
 
 class CheckPictureMetadata(Check):
     name = "picture-metadata"
+    inputs = frozenset({CheckInput.PICTURES, CheckInput.FILES})
     default_config = {"enabled": True}
     must_pass_checks = {"invalid-image"}
 
@@ -0,0 +1,103 @@
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Generator
+
+from rich.console import Console
+from rich.table import Table
+from sqlalchemy import Engine, event
+
+from albums.tagger import AlbumTaggerProvider
+
+
+@dataclass
+class CheckProfile:
+    """Totals for one kind of call to one check.
+
+    Attributes:
+        calls: Number of calls.
+        seconds: Wall time spent in the calls.
+        statements: Number of SQL statements executed during the calls.
+        files_opened: Number of files opened by the tagger during the calls.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    statements: int = 0
+    files_opened: int = 0
+
+
+class CheckProfiler:
+    """Measure time, SQL statements and tagger file opens of each check, per kind of call: ``prepare``, ``check``,
+    ``fix`` (automatic fixes only, since interactive fixes wait for the user) and ``rescan`` after a fix.
+
+    SQL statements are counted with a SQLAlchemy event on the engine while the profiler is attached.
+    """
+
+    profiles: dict[tuple[str, str], CheckProfile]
+    _engine: Engine | None = None
+    _tagger: AlbumTaggerProvider | None = None
+    _statements: int
+
+    def __init__(self):
+        self.profiles = {}
+        self._statements = 0
+
+    def attach(self, engine: Engine, tagger: AlbumTaggerProvider):
+        self.detach()
+        self._engine = engine
+        self._tagger = tagger
+        event.listen(engine, "before_cursor_execute", self._count_statement)
+
+    def detach(self):
+        if self._engine is not None and event.contains(self._engine, "before_cursor_execute", self._count_statement):
+            event.remove(self._engine, "before_cursor_execute", self._count_statement)
+        self._engine = None
+
+    @contextmanager
+    def measure(self, check_name: str, kind: str) -> Generator[None, Any, None]:
+        statements = self._statements
+        files_opened = self._files_opened()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile = self.profiles.setdefault((check_name, kind), CheckProfile())
+            profile.calls += 1
+            profile.seconds += time.perf_counter() - start
+            profile.statements += self._statements - statements
+            profile.files_opened += self._files_opened() - files_opened
+
+    def print_summary(self, console: Console):
+        """Print a table of profiles, slowest check first."""
+        table = Table("check", "call", "calls", "ms", "avg ms", "SQL", "files")
+        for (check_name, kind), profile in self._by_time():
+            table.add_row(
+                check_name,
+                kind,
+                str(profile.calls),
+                f"{profile.seconds * 1000:.1f}",
+                f"{profile.seconds * 1000 / profile.calls:.3f}",
+                str(profile.statements),
+                str(profile.files_opened),
+            )
+        console.print(table)
+
+    def write_json(self, path: Path):
+        """Write profiles to a JSON file, slowest check first."""
+        profiles = [{"check": check_name, "call": kind, **asdict(profile)} for (check_name, kind), profile in self._by_time()]
+        path.write_text(json.dumps(profiles, indent=4), encoding="utf-8")
+
+    def _by_time(self) -> list[tuple[tuple[str, str], CheckProfile]]:
+        check_seconds: dict[str, float] = {}
+        for (check_name, _), profile in self.profiles.items():
+            check_seconds[check_name] = check_seconds.get(check_name, 0.0) + profile.seconds
+        return sorted(self.profiles.items(), key=lambda item: (-check_seconds[item[0][0]], item[0][0], -item[1].seconds))
+
+    def _files_opened(self) -> int:
+        return self._tagger.files_opened if self._tagger is not None else 0
+
+    def _count_statement(self, *_: Any):
+        self._statements += 1
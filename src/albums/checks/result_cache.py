@@ -0,0 +1,92 @@
+import hashlib
+import json
+import logging
+from datetime import UTC, datetime
+from typing import Collection, Final, Iterable
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+import albums
+from albums.app import Context
+from albums.entities import CheckPassEntity
+
+from .base_check import Check
+from .scheduler import depends_on_library
+
+logger: Final = logging.getLogger(__name__)
+
+
+def config_hash(check_config: object) -> str:
+    """Hash of check configuration. The application version is included so that changes to checks invalidate the cache."""
+    serialized = json.dumps([albums.__version__, check_config], sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+
+
+def check_config_hash(ctx: Context, check: type[Check]) -> str:
+    """Hash of everything in the configuration that the check reads: its own configuration, and any global settings and
+    configuration of other checks it declares (see ``Check.input_settings`` and ``Check.input_check_configs``)."""
+    check_config = ctx.config.checks[check.name]
+    if not check.input_settings and not check.input_check_configs:
+        return config_hash(check_config)
+    settings = {name: getattr(ctx.config, name) for name in check.input_settings}
+    other_configs = {name: ctx.config.checks[name] for name in check.input_check_configs}
+    return config_hash([check_config, settings, other_configs])
+
+
+class CheckResultCache:
+    """Remembers which checks passed on each album, so that they don't need to run again until the album changes.
+
+    Only passing checks are recorded, since they display nothing. A recorded pass is valid while the album's
+    ``modified_at`` and ``scanner`` values and the configuration the check reads are the same. Checks that depend on other
+    albums are never recorded (see ``CheckInput.LIBRARY``).
+    """
+
+    _session: Session
+    _hashes: dict[str, str]
+    _enabled: bool
+
+    def __init__(self, ctx: Context, session: Session, checks: Iterable[type[Check]], enabled: bool = True):
+        self._session = session
+        self._hashes = {check.name: check_config_hash(ctx, check) for check in checks if not depends_on_library(check)}
+        # in-memory databases are discarded, so there is nothing to gain
+        self._enabled = enabled and ctx.is_persistent and bool(self._hashes)
+
+    def passed(self, album_id: int | None, modified_at: int, scanner: int) -> set[str]:
+        """Names of checks that passed on this album, if the album and the check configuration are unchanged since then."""
+        if not self._enabled or album_id is None:
+            return set()
+        rows = self._session.execute(
+            select(CheckPassEntity.check_name, CheckPassEntity.config_hash, CheckPassEntity.modified_at, CheckPassEntity.scanner).where(
+                CheckPassEntity.album_id == album_id
+            )
+        ).tuples()
+        return {
+            check_name
+            for (check_name, hash, pass_modified_at, pass_scanner) in rows
+            if self._hashes.get(check_name) == hash and pass_modified_at == modified_at and pass_scanner == scanner
+        }
+
+    def save(self, album_id: int | None, modified_at: int, scanner: int, checks_passed: Collection[str], cached: Collection[str] = ()):
+        """Record the checks that passed on an album, replacing older results.
+
+        Args:
+            album_id: album that was checked
+            modified_at: ``Album.modified_at`` when the checks ran
+            scanner: ``Album.scanner`` when the checks ran
+            checks_passed: names of checks that passed, including any that were skipped because they passed before
+            cached: result of ``passed()`` for the album when it was checked, to avoid writing if nothing is new
+        """
+        if not self._enabled or album_id is None:
+            return
+        if modified_at >= int(datetime.now(UTC).timestamp()):
+            # the album could be changed again without a different modified_at value, check it again next time
+            return
+        passes = {name for name in checks_passed if name in self._hashes}
+        if passes == set(cached):
+            return
+        self._session.execute(delete(CheckPassEntity).where(CheckPassEntity.album_id == album_id))
+        self._session.add_all(
+            CheckPassEntity(album_id=album_id, check_name=name, config_hash=self._hashes[name], modified_at=modified_at, scanner=scanner)
+            for name in sorted(passes)
+        )
@@ -0,0 +1,24 @@
+from typing import Sequence
+
+from .base_check import Check
+from .check_types import CheckInput
+
+
+def depends_on_library(check: Check | type[Check]) -> bool:
+    """Whether the result of a check may depend on other albums."""
+    return CheckInput.LIBRARY in check.inputs
+
+
+def schedule_checks(checks: Sequence[type[Check]]) -> list[type[Check]]:
+    """Order checks to run on each album.
+
+    Checks that only read the album run first, in the given order. Checks that query other albums in the library are
+    the most expensive and their result is never remembered, so they run last, when other checks have already been fixed
+    and the album is less likely to change again. Checks that depend on those checks run after them. Otherwise the
+    given order is kept, so dependencies still run first.
+    """
+    deferred: set[str] = set()
+    for check in checks:
+        if depends_on_library(check) or check.must_pass_checks & deferred:
+            deferred.add(check.name)
+    return [check for check in checks if check.name not in deferred] + [check for check in checks if check.name in deferred]
@@ -1,9 +1,13 @@
+import os
+from pathlib import Path
+
 import rich_click as click
 from sqlalchemy.orm import Session
 
 from albums.app import Context
 from albums.checks.all import ALL_CHECK_NAMES
 from albums.checks.checker import Checker
+from albums.checks.profiler import CheckProfiler
 from albums.config import RescanOption, default_checks_config
 from albums.library import run_scan
 
@@ -20,10 +24,32 @@ from .cli_context import pass_context, require_library, require_real_context
 @click.option("--preview", "-p", is_flag=True, help="preview the automatic fixes that would be made with -a")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--fix", "-f", is_flag=True, help="prompt when there is a selectable fix available")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--interactive", "-i", is_flag=True, help="ask what to do even if the only options are manual (implies -f)")  # pyright: ignore[reportUnknownMemberType]
+@click.option(  # pyright: ignore[reportUnknownMemberType]
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    help="when only reporting issues, check albums with this many processes (0 = number of CPUs)",
+)
+@click.option("--recheck", is_flag=True, help="run checks that passed before, even if the album has not changed")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--profile", is_flag=True, help="show time, SQL statements and files opened by each check")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--profile-json", "profile_file", metavar="FILE", help="write check profile to JSON file (implies --profile)")  # pyright: ignore[reportUnknownMemberType]
 @click.argument("checks", nargs=-1)  # pyright: ignore[reportUnknownMemberType]
 @click.help_option("--help", "-h", help="show this message and exit")  # pyright: ignore[reportUnknownMemberType]
 @pass_context
-def check(ctx: Context, default: bool, automatic: bool, preview: bool, fix: bool, interactive: bool, checks: list[str]):
+def check(
+    ctx: Context,
+    default: bool,
+    automatic: bool,
+    preview: bool,
+    fix: bool,
+    interactive: bool,
+    jobs: int,
+    recheck: bool,
+    profile: bool,
+    profile_file: str | None,
+    checks: list[str],
+):
     require_real_context(ctx)
     require_library(ctx)
     if ctx.config.rescan == RescanOption.AUTO and ctx.is_persistent:
@@ -34,7 +60,10 @@ def check(ctx: Context, default: bool, automatic: bool, preview: bool, fix: bool
         ctx.console.print("using default check config")
         ctx.config.checks = default_checks_config()
 
-    checker = Checker(ctx, automatic, preview, fix, interactive, show_ignore_option=ctx.is_persistent)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    profiler = CheckProfiler() if profile or profile_file else None
+    checker = Checker(ctx, automatic, preview, fix, interactive, show_ignore_option=ctx.is_persistent, jobs=jobs, recheck=recheck, profiler=profiler)
     if len(checks) > 0:
         # validate check names
         for check_name in checks:
@@ -57,3 +86,8 @@ def check(ctx: Context, default: bool, automatic: bool, preview: bool, fix: bool
 
     if issues_displayed == 0:
         ctx.console.print("no issues")
+
+    if profiler:
+        profiler.print_summary(ctx.console)
+        if profile_file:
+            profiler.write_json(Path(profile_file))
@@ -12,7 +12,7 @@ from rich.logging import RichHandler
 
 from albums.app import Context
 from albums.config import PLATFORM_DIRS, RescanOption, config_load
-from albums.database import MEMORY, Comparator, Match, db_open, load_album_entities
+from albums.database import MEMORY, Comparator, Match, db_open, load_album_entities, schema_is_current, select_album_ids
 
 logger: Final = logging.getLogger(__name__)
 
@@ -22,6 +22,9 @@ pass_context: Final = click.make_pass_decorator(Context, ensure=True)
 
 DEFAULT_DB_LOCATION: Final = str(PLATFORM_DIRS.user_config_path / "albums.db")
 
+# commands that only read the database, so they can use a read-only connection that never takes a lock another process waits for
+READ_ONLY_COMMANDS: Final = frozenset(("export", "list", "search"))
+
 
 @dataclass(frozen=True)
 class FilterCriteria:
@@ -76,7 +79,7 @@ def setup(
 
     app_context.db_path = _get_albums_db_path(db_file)
     if app_context.db_path.is_file():
-        app_context.db = _open_db_and_set_context_config(ctx, app_context)
+        app_context.db = _open_db_and_set_context_config(ctx, app_context, read_only=ctx.invoked_subcommand in READ_ONLY_COMMANDS)
         has_database = True
     else:
         has_database = False
@@ -87,12 +90,15 @@ def setup(
     filter: defaultdict[str, List[Match]] = defaultdict(list)
     filter = reduce(lambda acc, kv: acc[kv.field].append(Match(kv.value, kv.comparator)) or acc, filter_criteria, filter)
     app_context.select_album_entities = lambda session: load_album_entities(session, filter, invert=invert)
+    app_context.selected_album_ids = select_album_ids(filter, invert=invert)
     if dir:
         if "path" in filter:
             del filter["path"]
+            app_context.selected_album_ids = select_album_ids(filter, invert=invert)
         enter_folder_context(app_context, dir)
         # create selector for folder context
         app_context.select_album_entities = lambda session: load_album_entities(session)
+        app_context.selected_album_ids = select_album_ids()
     elif not has_database:
         # it's simpler to always give app_context a database than to allow it to be Engine | None
         app_context.is_persistent = False
@@ -133,11 +139,16 @@ def _get_albums_db_path(db_file: str | None):
     return Path(album_db_file)
 
 
-def _open_db_and_set_context_config(ctx: click.Context, app_context: Context):
+def _open_db_and_set_context_config(ctx: click.Context, app_context: Context, read_only: bool = False):
     logger.info(f"using database {str(app_context.db_path)}")
-    db = db_open(app_context.db_path, echo=app_context.verbose > 1)
+    db = db_open(app_context.db_path, echo=app_context.verbose > 1, read_only=read_only)
+    if read_only and (not schema_is_current(db) or config_load(db, save_valid=False).rescan == RescanOption.ALWAYS):
+        logger.debug("opening database for writing, to migrate it or scan the library")
+        db.dispose()
+        db = db_open(app_context.db_path, echo=app_context.verbose > 1)
+        read_only = False
     ctx.call_on_close(lambda: db.dispose())
-    app_context.config = config_load(db)
+    app_context.config = config_load(db, save_valid=not read_only)
     return db
 
 
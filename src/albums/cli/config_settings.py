@@ -91,6 +91,12 @@ def set_setting(ctx: Context, setting_name: str, value: str) -> bool:
         elif name == "rescan":
             ctx.config.rescan = RescanOption(value)
             config_save(ctx.db, ctx.config)
+        elif name == "tag_padding":
+            if not str.isdecimal(value):
+                ctx.console.print(f"{setting_name} must be a non-negative integer")
+                return False
+            ctx.config.tag_padding = int(value)
+            config_save(ctx.db, ctx.config)
         elif name == "tagger":
             ctx.config.tagger = value
             config_save(ctx.db, ctx.config)
@@ -0,0 +1,34 @@
+import rich_click as click
+
+from albums.app import Context
+from albums.database import database_space, maintain
+
+from .cli_context import pass_context, require_configured, require_persistent_context
+from .ordered_group import OrderedGroup
+
+
+@click.group("db", cls=OrderedGroup, help="manage the albums database", add_help_option=False)
+@click.help_option("--help", "-h", help="show this message and exit")  # pyright: ignore[reportUnknownMemberType]
+def db():
+    pass
+
+
+@db.command(
+    "maintain",
+    help="remove unused data and compact the database",
+    epilog="this also enables incremental auto-vacuum, so that automatic maintenance can reclaim space without rewriting the database",
+    add_help_option=False,
+)
+@click.help_option("--help", "-h", help="show this message and exit")  # pyright: ignore[reportUnknownMemberType]
+@pass_context
+def db_maintain(ctx: Context):
+    require_configured(ctx)
+    require_persistent_context(ctx)
+
+    with ctx.db.connect() as conn:
+        before = database_space(conn)
+    ctx.console.print(f"database size {before.describe()}")
+    maintain(ctx.db, full=True)
+    with ctx.db.connect() as conn:
+        after = database_space(conn)
+    ctx.console.print(f"after maintenance {after.describe()}")
@@ -1,29 +1,26 @@
-import rich.traceback
+import sys
+from types import TracebackType
+
 import rich_click as click
 
 import albums
 from albums import app
 from albums.database import Comparator
-from albums.library import run_scan
 
-from .check import check
-from .checks_ignore import checks_ignore
-from .checks_notice import checks_notice
 from .cli_context import DEFAULT_DB_LOCATION, FilterCriteria, pass_context, setup
 from .click_custom import InvisibleCountParam
-from .collections_add import collections_add
-from .collections_remove import collections_remove
-from .collections_select import collections_select
-from .config import config
-from .import_command import import_command
-from .init import init
-from .list_albums import list_albums
 from .ordered_group import OrderedGroup
-from .scan import scan
-from .sql import sql
-from .sync import sync
 
-rich.traceback.install(show_locals=True, locals_max_string=150, locals_max_length=10)
+
+def _excepthook(exc_type: type[BaseException], exc_value: BaseException, traceback: TracebackType | None):
+    """Install the rich traceback handler when it is first needed, since importing it slows down every command."""
+    import rich.traceback
+
+    rich.traceback.install(show_locals=True, locals_max_string=150, locals_max_length=10)
+    sys.excepthook(exc_type, exc_value, traceback)
+
+
+sys.excepthook = _excepthook
 
 
 @click.group(cls=OrderedGroup, epilog=f"if --db-file is not specified, albums will use {DEFAULT_DB_LOCATION}", add_help_option=False)
@@ -31,6 +28,7 @@ rich.traceback.install(show_locals=True, locals_max_string=150, locals_max_lengt
 @click.option("--invert", "-n", is_flag=True, help="invert match (return albums that DO NOT match)")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--collection", "-c", "collections", metavar="NAME", multiple=True, help="match collection name (same as -m collection=...)")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--path", "-p", "paths", metavar="PATH", multiple=True, help="match album path (same as -m path=...)")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--search", "-s", "searches", metavar="TEXT", multiple=True, help="match albums with all words in path or tags (same as -m search=...)")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--regex", "-r", is_flag=True, help="enable regex/partial match for -c and -p")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--dir", "-d", metavar="PATH", help="operate on a directory outside of the library")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--db-file", metavar="PATH", help="specify path to albums.db (advanced)")  # pyright: ignore[reportUnknownMemberType]
@@ -44,6 +42,7 @@ def albums_group(
     app_context: app.Context,
     collections: list[str],
     paths: list[str],
+    searches: list[str],
     matchers: list[str],
     dir: str,
     regex: bool,
@@ -55,28 +54,35 @@ def albums_group(
     filter_criteria = (
         [FilterCriteria("collection", c, default_cmp) for c in (collections or [])]
         + [FilterCriteria("path", p, default_cmp) for p in (paths or [])]
+        + [FilterCriteria("search", s) for s in (searches or [])]
         + [FilterCriteria.from_expr(matcher) for matcher in matchers]
     )
     initial_scan = setup(ctx, app_context, verbose, filter_criteria, dir, invert, db_file)
 
     if initial_scan:
+        from albums.library import run_scan
+
         run_scan(app_context)
         app_context.prescanned = True
 
 
-albums_group.add_command(scan)
-albums_group.add_command(list_albums)
-albums_group.add_command(import_command)
-albums_group.add_command(check)
+# commands are imported when used, so that e.g. "albums sql" does not load the checks or image libraries
+albums_group.add_lazy_command("scan", ".scan:scan")
+albums_group.add_lazy_command("list", ".list_albums:list_albums")
+albums_group.add_lazy_command("search", ".search:search")
+albums_group.add_lazy_command("import", ".import_command:import_command")
+albums_group.add_lazy_command("check", ".check:check")
 
-albums_group.add_command(collections_add)
-albums_group.add_command(collections_remove)
-albums_group.add_command(collections_select)
-albums_group.add_command(sync)
+albums_group.add_lazy_command("add", ".collections_add:collections_add")
+albums_group.add_lazy_command("remove", ".collections_remove:collections_remove")
+albums_group.add_lazy_command("select", ".collections_select:collections_select")
+albums_group.add_lazy_command("sync", ".sync:sync")
 
-albums_group.add_command(checks_ignore)
-albums_group.add_command(checks_notice)
+albums_group.add_lazy_command("ignore", ".checks_ignore:checks_ignore")
+albums_group.add_lazy_command("notice", ".checks_notice:checks_notice")
 
-albums_group.add_command(init)
-albums_group.add_command(config)
-albums_group.add_command(sql)
+albums_group.add_lazy_command("init", ".init:init")
+albums_group.add_lazy_command("config", ".config:config")
+albums_group.add_lazy_command("sql", ".sql:sql")
+albums_group.add_lazy_command("export", ".export:export")
+albums_group.add_lazy_command("db", ".db:db")
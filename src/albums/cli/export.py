@@ -0,0 +1,30 @@
+from importlib.util import find_spec
+from pathlib import Path
+
+import rich_click as click
+
+from albums.app import Context
+from albums.database.export import EXPORT_FORMATS, export_catalog
+
+from .cli_context import pass_context, require_real_context
+
+
+@click.command(
+    "export",
+    help="export stored details of matching albums to files in DIRECTORY",
+    epilog="writes album, track, track_field and track_picture files with the stored columns of those tables, and a track_wide file with one column per tag field. parquet and arrow formats need the pyarrow package",
+    add_help_option=False,
+)
+@click.argument("directory", type=click.Path(file_okay=False, path_type=Path))  # pyright: ignore[reportUnknownMemberType]
+@click.option("--format", "-f", "format_", type=click.Choice(EXPORT_FORMATS), default="csv", show_default=True, help="file format")  # pyright: ignore[reportUnknownMemberType]
+@click.help_option("--help", "-h", help="show this message and exit")  # pyright: ignore[reportUnknownMemberType]
+@pass_context
+def export(ctx: Context, directory: Path, format_: str):
+    require_real_context(ctx)
+    if format_ != "csv" and find_spec("pyarrow") is None:
+        ctx.console.print(f"[bold]Error:[/bold] {format_} export needs pyarrow, install with: pip install 'albums\\[arrow]'")
+        raise SystemExit(1)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, rows in export_catalog(ctx.db, ctx.selected_album_ids, directory, format_).items():
+        ctx.console.print(f"exported {rows} rows to {directory / f'{name}.{format_}'}", highlight=False)
@@ -1,29 +1,45 @@
 from datetime import UTC, datetime
-from functools import reduce
-from json import dumps
-from typing import Callable, List, Tuple
+from json import JSONEncoder, dumps
+from typing import Callable, Final, List, Tuple
 
 import humanize
 import rich_click as click
 from rich.table import Table
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
 
 from albums.app import Context
-from albums.checks.helpers import album_display_name
+from albums.checks.helpers import path_display_name
+from albums.database import load_selected_albums
+from albums.entities import Album, AlbumCollectionAssociation, Track
 
 from .cli_context import pass_context, require_real_context
 
+# everything serialized by Album.to_dict, loaded for a page of albums at a time instead of with several queries per album
+_EXPORT_LOADER_OPTIONS: Final = (
+    selectinload(Album.tracks).selectinload(Track.fields),
+    selectinload(Album.tracks).selectinload(Track.pictures),
+    selectinload(Album.picture_files),
+    selectinload(Album.other_files),
+    selectinload(Album.collection_associations).joinedload(AlbumCollectionAssociation.collection),
+    selectinload(Album.ignore_check_entities),
+)
+
+# compact output for piping to other tools, check_circular=False skips bookkeeping that to_dict() output doesn't need
+_COMPACT_ENCODER: Final = JSONEncoder(check_circular=False, separators=(",", ":"))
+
 
 @click.command("list", help="print matching albums", add_help_option=False)
 @click.option("--json", "-j", is_flag=True, help="output all stored details in JSON")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--json-lines", "-l", is_flag=True, help="output all stored details in JSON, one line per album")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--order", "-o", metavar="COLUMN", help="order by specified column name (not with --json)")  # pyright: ignore[reportUnknownMemberType]
 @click.option("--reverse", "-r", is_flag=True, help="reverse sort order")  # pyright: ignore[reportUnknownMemberType]
 @click.help_option("--help", "-h", help="show this message and exit")  # pyright: ignore[reportUnknownMemberType]
 @pass_context
-def list_albums(ctx: Context, json: bool, order: str, reverse: bool):
+def list_albums(ctx: Context, json: bool, json_lines: bool, order: str, reverse: bool):
     require_real_context(ctx)
 
-    columns: List[Tuple[str, Callable[[str | int], str]]] = [
+    columns: List[Tuple[str, Callable[[str | int | float], str]]] = [
         ("path", lambda p: str(p)),
         ("tracks", lambda len_tracks: str(len_tracks)),
         ("length", lambda tracks_length: "{:02}:{:02}".format(*divmod(int(tracks_length) // 60, 60))),
@@ -32,53 +48,75 @@ def list_albums(ctx: Context, json: bool, order: str, reverse: bool):
         ("changed", _render_date),
     ]
     column_names = [name for name, _ in columns]
-    if json and (order or reverse):
-        ctx.console.print("[bold]cannot combine --json option with --order or --reverse[/bold]")
+    if (json or json_lines) and (order or reverse):
+        ctx.console.print("[bold]cannot combine --json or --json-lines option with --order or --reverse[/bold]")
         raise SystemExit(1)
     if order and order not in column_names:
         ctx.console.print(f"[bold]invalid column name for --order (must be one of {', '.join(column_names)})[/bold]")
         raise SystemExit(1)
     if reverse and not order:
         order = columns[0][0]
-    sort_column_ix = column_names.index(order) if order else 0
+    if json and json_lines:
+        ctx.console.print("[bold]cannot combine --json option with --json-lines[/bold]")
+        raise SystemExit(1)
     total_size = 0
-    total_length = 0
-    table = Table(*(name for name, _ in columns))
-    rows: List[Tuple[str | int, ...]] = []
+    total_length = 0.0
     with Session(ctx.db) as session:
-        for album in ctx.select_album_entities(session):
-            tracks_size = reduce(lambda sum, track: sum + track.file_size, album.tracks, 0)
-            tracks_length = reduce(
-                lambda sum, track: sum + (track.stream.length if track.stream and hasattr(track.stream, "length") else 0), album.tracks, 0
-            )
-            if json:
-                ctx.console.print("[" if total_size == 0 else ",")  # an album can't be 0 bytes
-                if ctx.console.is_terminal:
-                    ctx.console.print_json(dumps(album.to_dict()))  # pretty for terminal
-                else:
-                    ctx.console.print(dumps(album.to_dict()), end="", highlight=False, markup=False, soft_wrap=True)  # otherwise compact
-            else:
-                row = (album_display_name(ctx, album), len(album.tracks), int(tracks_length), tracks_size, album.created_at, album.modified_at)
-                if order:
-                    rows.append(row)
-                else:
-                    table.add_row(*(render(row[ix]) for ix, (_, render) in enumerate(columns)))
-            total_size += tracks_size
-            total_length += tracks_length
-        if json:
-            if total_size == 0:
-                ctx.console.print("[]")
-            else:
-                ctx.console.print("]")
+        if json_lines or (json and not ctx.console.is_terminal):
+            _write_json(ctx, session, json_lines)
+        elif json:
+            first = True
+            for album in load_selected_albums(session, ctx.selected_album_ids, _EXPORT_LOADER_OPTIONS):
+                ctx.console.print("[" if first else ",")
+                first = False
+                ctx.console.print_json(dumps(album.to_dict()))  # pretty for terminal
+            ctx.console.print("[]" if first else "]")
         else:
-            if order:
-                for row in sorted(rows, key=lambda row: row[sort_column_ix], reverse=reverse):
-                    table.add_row(*(render(row[ix]) for ix, (_, render) in enumerate(columns)))
+            table = Table(*column_names)
+            for path, *row in session.execute(_summary_statement(ctx, order, reverse)).tuples():
+                table.add_row(*(render(value) for (_, render), value in zip(columns, (path_display_name(ctx, path), *row))))
+                total_size += row[2]
+                total_length += row[1]
             ctx.console.print(table)
             ctx.console.print(f"total: {humanize.naturalsize(total_size, binary=True)}, length = {humanize.naturaldelta(total_length)}")
 
 
-def _render_date(timestamp: str | int):
+def _write_json(ctx: Context, session: Session, json_lines: bool):
+    """Write compact JSON directly to the console's output file, without rich rendering."""
+    out = ctx.console.file
+    albums = load_selected_albums(session, ctx.selected_album_ids, _EXPORT_LOADER_OPTIONS)
+    if json_lines:
+        for album in albums:
+            out.write(_COMPACT_ENCODER.encode(album.to_dict()) + "\n")
+    else:
+        out.write("[")
+        for index, album in enumerate(albums):
+            out.write(("," if index else "") + _COMPACT_ENCODER.encode(album.to_dict()))
+        out.write("]\n")
+    out.flush()
+
+
+def _summary_statement(ctx: Context, order: str | None, reverse: bool):
+    """Select one row per album with the columns of the table. Totals are calculated and sorted by SQLite."""
+    columns = {
+        "path": Album.path,
+        "tracks": func.count(Track.track_id),
+        "length": func.coalesce(func.sum(Track.stream_length), 0.0),
+        "size": func.coalesce(func.sum(Track.file_size), 0),
+        "added": Album.created_at,
+        "changed": Album.modified_at,
+    }
+    sort_column = columns[order or "path"]
+    return (
+        select(*columns.values())
+        .outerjoin(Track, Track.album_id == Album.album_id)
+        .where(Album.album_id.in_(ctx.selected_album_ids))
+        .group_by(Album.album_id)
+        .order_by(sort_column.desc() if reverse else sort_column, Album.path)
+    )
+
+
+def _render_date(timestamp: str | int | float):
     if timestamp:
         return datetime.fromtimestamp(int(timestamp), UTC).astimezone().strftime("%Y-%m-%d")
     return "[italic]not set[/italic]"
@@ -1,9 +1,36 @@
+from importlib import import_module
 from typing import override
 
-from rich_click import Context, RichGroup
+from rich_click import Command, Context, RichGroup
 
 
 class OrderedGroup(RichGroup):
+    """Command group that lists commands in the order they were added.
+
+    Commands added with ``add_lazy_command`` are imported the first time they are used, so starting the CLI does not
+    load the modules (and their dependencies) of every command.
+    """
+
+    _lazy_commands: dict[str, str]
+
+    def __init__(self, *args, **kwargs):  # pyright: ignore[reportMissingParameterType, reportUnknownParameterType]
+        super().__init__(*args, **kwargs)  # pyright: ignore[reportUnknownArgumentType]
+        self._lazy_commands = {}
+
+    def add_lazy_command(self, name: str, import_path: str):
+        """Add a command by name and ``module:attribute`` path, relative to this package if the module starts with a dot."""
+        self._lazy_commands[name] = import_path
+
     @override
     def list_commands(self, ctx: Context):
-        return list(self.commands.keys())
+        return list(dict.fromkeys([*self._lazy_commands, *self.commands]))
+
+    @override
+    def get_command(self, ctx: Context, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in self._lazy_commands:
+            module_name, attribute = self._lazy_commands[cmd_name].split(":")
+            command = getattr(import_module(module_name, __package__), attribute)
+            if not isinstance(command, Command):
+                raise TypeError(f"{self._lazy_commands[cmd_name]} is not a command")
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -0,0 +1,50 @@
+from itertools import groupby
+from operator import itemgetter
+from typing import Tuple
+
+import rich_click as click
+from rich.text import Text
+from sqlalchemy.orm import Session
+
+from albums.app import Context
+from albums.checks.helpers import path_display_name
+from albums.database.search import HIGHLIGHT_END, HIGHLIGHT_START, search_matches, search_terms
+from albums.words import plural
+
+from .cli_context import pass_context, require_real_context
+
+
+@click.command(
+    "search",
+    help="search paths and tags of matching albums for WORDS",
+    epilog="finds albums with every word in the path or tags, ignoring case and accents. A word ending with * matches words that start with it, like beat*",
+    add_help_option=False,
+)
+@click.argument("words", nargs=-1, required=True)  # pyright: ignore[reportUnknownMemberType]
+@click.help_option("--help", "-h", help="show this message and exit")  # pyright: ignore[reportUnknownMemberType]
+@pass_context
+def search(ctx: Context, words: Tuple[str, ...]):
+    require_real_context(ctx)
+
+    search_text = " ".join(words)
+    if not search_terms(search_text):
+        ctx.console.print("[bold]search text must contain a word or number[/bold]")
+        raise SystemExit(1)
+
+    count = 0
+    with Session(ctx.db) as session:
+        for path, matches in groupby(search_matches(session, ctx.selected_album_ids, search_text), key=itemgetter(0)):
+            count += 1
+            first = next(matches)
+            (_, field, value) = first
+            ctx.console.print(_highlighted(value) if field is None else Text.from_markup(path_display_name(ctx, path)))
+            for _, field, value in matches if field is None else (first, *matches):
+                ctx.console.print(Text.assemble(f"  {field}: ", _highlighted(value)))
+    ctx.console.print(f"found {plural(count, 'album')}", highlight=False)
+
+
+def _highlighted(value: str) -> Text:
+    text = Text()
+    for ix, part in enumerate(value.replace(HIGHLIGHT_END, HIGHLIGHT_START).split(HIGHLIGHT_START)):
+        text.append(part, style="bold" if ix % 2 else "")
+    return text
@@ -1,4 +1,7 @@
-from json import dumps
+import csv
+from itertools import chain, islice
+from json import JSONEncoder
+from typing import IO, Any, Final, Iterable, Iterator, Sequence
 
 import rich_click as click
 from rich.markup import escape
@@ -11,39 +14,101 @@ from albums.app import Context
 
 from .cli_context import pass_context, require_real_context
 
+# rows fetched from SQLite at a time, so that output starts right away and memory use does not grow with the result
+SQL_BATCH_SIZE: Final = 10000
 
-@click.command(help="run a SQL command against albums db", add_help_option=False)
+_FORMATS: Final = ["table", "json", "jsonl", "csv", "tsv"]
+
+_COMPACT_ENCODER: Final = JSONEncoder(check_circular=False, separators=(",", ":"))
+
+
+@click.command(
+    help="run a SQL command against albums db",
+    epilog="table output is read into memory before it is shown, other formats are written as rows are read. Binary values are shown as hex.",
+    add_help_option=False,
+)
 @click.argument("sql-command", required=True)  # pyright: ignore[reportUnknownMemberType]
-@click.option("--json", "-j", is_flag=True, help="output result as JSON object")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--json", "-j", is_flag=True, help="output result as JSON (same as --format json)")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--format", "-f", "format_", type=click.Choice(_FORMATS), help="output format, table by default")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--limit", "-l", type=click.IntRange(min=0), help="output at most this many rows")  # pyright: ignore[reportUnknownMemberType]
+@click.option("--pager", "-P", is_flag=True, help="show table output in a pager")  # pyright: ignore[reportUnknownMemberType]
 @click.help_option("--help", "-h", help="show this message and exit")  # pyright: ignore[reportUnknownMemberType]
 @pass_context
-def sql(ctx: Context, sql_command: str, json: bool):
+def sql(ctx: Context, sql_command: str, json: bool, format_: str | None, limit: int | None, pager: bool):
     require_real_context(ctx)
+    if json and format_ not in (None, "json"):
+        ctx.console.print("[bold]cannot combine --json option with --format[/bold]")
+        raise SystemExit(1)
+    format_ = "json" if json else format_ or "table"
+    if pager and format_ != "table":
+        ctx.console.print("[bold]--pager can only be used with table output[/bold]")
+        raise SystemExit(1)
+
     try:
         with ctx.db.begin() as connection:
-            cursor = connection.execute(text(sql_command))
-            if cursor.returns_rows:
-                if json:
-                    json_dump = dumps([[v for v in row] for row in cursor.fetchall()])
-                    ctx.console.print_json(json_dump)
-                    # more compact: ctx.console.print(dumps(json_dump))
+            result = connection.execute(text(sql_command))
+            if result.returns_rows and result.cursor:
+                columns = list(result.keys())
+                # plain tuples from the DBAPI cursor, which are much faster to write than rows
+                cursor = result.cursor
+                batches = (_hex_blobs(batch) for batch in iter(lambda: cursor.fetchmany(SQL_BATCH_SIZE), []))
+                if format_ == "table":
+                    _print_table(ctx, columns, chain.from_iterable(batches), limit, pager)
                 else:
-                    column_names = list(
-                        [
-                            str(description[0])
-                            for description in (cursor.cursor.description if cursor.cursor and cursor.cursor.description else [("results",)])
-                        ]
-                    )
-                    table = Table(*column_names)
-                    for row in cursor:
-                        table.add_row(*[escape(str(v) + " ").strip() for v in row])
-                    ctx.console.print(table)
-            elif json:
+                    _write_rows(ctx.console.file, format_, columns, batches if limit is None else _limit_rows(batches, limit))
+            elif format_ == "json":
                 ctx.console.print("[]")
-            else:
+            elif format_ == "table":
                 ctx.console.print("(no rows returned)")
 
             connection.commit()
     except OperationalError as err:
         ctx.console.print(Panel(f"[bold]SQL error | [red]{escape(str(err.orig))}", expand=False))
         raise SystemExit(1)
+
+
+def _hex_blobs(batch: Sequence[Sequence[Any]]) -> Sequence[Sequence[Any]]:
+    """Convert binary values to hex, so that every output format can show them."""
+    if bytes not in map(type, chain.from_iterable(batch)):  # checked without running Python code for each value
+        return batch
+    return [tuple(v.hex() if isinstance(v, bytes) else v for v in row) for row in batch]
+
+
+def _limit_rows(batches: Iterable[Sequence[Sequence[Any]]], limit: int) -> Iterator[Sequence[Sequence[Any]]]:
+    for batch in batches:
+        if limit <= 0:
+            return
+        yield batch[:limit]
+        limit -= len(batch)
+
+
+def _print_table(ctx: Context, columns: Sequence[str], rows: Iterator[Sequence[Any]], limit: int | None, pager: bool):
+    table = Table(*(columns or ["results"]))
+    for row in rows if limit is None else islice(rows, limit):
+        table.add_row(*[escape(str(v) + " ").strip() for v in row])
+    if pager:
+        with ctx.console.pager():
+            ctx.console.print(table)
+    else:
+        ctx.console.print(table)
+    if limit is not None and next(rows, None) is not None:
+        ctx.console.print(f"(showing the first {limit} rows)")
+
+
+def _write_rows(out: IO[str], format_: str, columns: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]):
+    """Write batches of rows to the output file as they are read, without rich rendering."""
+    if format_ == "json":
+        separator = "["
+        for batch in batches:
+            out.write("".join(f"{separator if ix == 0 else ','}\n{_COMPACT_ENCODER.encode(row)}" for ix, row in enumerate(batch)))
+            separator = ","
+        out.write("[]\n" if separator == "[" else "\n]\n")
+    elif format_ == "jsonl":
+        for batch in batches:
+            out.write("".join(_COMPACT_ENCODER.encode(dict(zip(columns, row))) + "\n" for row in batch))
+    else:
+        writer = csv.writer(out, dialect="excel-tab" if format_ == "tsv" else "excel", lineterminator="\n")
+        writer.writerow(columns)
+        for batch in batches:
+            writer.writerows(batch)
+    out.flush()
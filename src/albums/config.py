@@ -20,7 +20,7 @@ from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from albums.database import Base, SerializableValueAsJson
-from albums.tagger import ID3v1Policy
+from albums.tagger import DEFAULT_PADDING_RESERVE, ID3v1Policy
 
 from .checks.check_types import CheckConfiguration
 
@@ -204,6 +204,7 @@ class Configuration:
         rescan: Automatic scan policy whenever a command is about to be invoked.
         tagger: Shell command to invoke to run an external tagger on a folder.
         id3v1: Policy for legacy ID3v1 tags when saving MP3 files.
+        tag_padding: Padding in bytes to reserve when saving tags requires rewriting a file.
         sync_destinations: Destination folders to which albums can be synced.
     """
 
@@ -222,6 +223,7 @@ class Configuration:
     rescan: RescanOption = RescanOption.AUTO
     tagger: str = ""
     id3v1: ID3v1Policy = ID3v1Policy.UPDATE
+    tag_padding: int = DEFAULT_PADDING_RESERVE
     sync_destinations: List[SyncDestination] = field(default_factory=list[SyncDestination])
 
     def to_values(self) -> Mapping[str, SettingValueType]:
@@ -249,6 +251,7 @@ class Configuration:
             "settings.rescan": str(self.rescan),
             "settings.tagger": self.tagger,
             "settings.id3v1": self.id3v1.value,
+            "settings.tag_padding": self.tag_padding,
             "settings.sync_destinations": [dest.to_dict() for dest in self.sync_destinations],
         }
         defaults = default_checks_config()
@@ -325,6 +328,13 @@ class Configuration:
                     config.tagger = str(value)
                 elif name == "id3v1":
                     config.id3v1 = ID3v1Policy(value)
+                elif name == "tag_padding":
+                    tag_padding = str(value)
+                    if str.isdecimal(tag_padding):
+                        config.tag_padding = int(tag_padding)
+                    else:
+                        logger.warning(f"ignoring {k}={tag_padding}, not a number - using default {config.tag_padding}")
+                        ignored_values = True
                 elif name == "sync_destinations":
                     if isinstance(value, list) and all(isinstance(item, dict) for item in value):
                         config.sync_destinations = [SyncDestination.from_dict(dest) for dest in value]  # pyright: ignore[reportArgumentType]
@@ -357,14 +367,15 @@ def config_save(db: Engine, configuration: Configuration):
         session.commit()
 
 
-def config_load(db: Engine) -> Configuration:
+def config_load(db: Engine, save_valid: bool = True) -> Configuration:
     """Load configuration from the database.
 
-    Returns valid settings and discards any unknown keys with a warning.
+    Returns valid settings and discards any unknown keys with a warning. If *save_valid*, the valid settings are saved
+    so that the warning is only shown once (not possible with a read-only connection).
     """
     with Session(db) as session:
         (config, ignored_values) = Configuration.from_values(((setting.name, setting.value)) for setting in session.scalars(select(SettingEntity)))
 
-    if ignored_values:
+    if ignored_values and save_valid:
         config_save(db, config)  # showed warnings, now save valid config
     return config
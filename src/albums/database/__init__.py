@@ -1,7 +1,8 @@
 """Database package providing connection, configuration, schema management and query helpers."""
 
 from albums.database.connection import MEMORY, db_open
-from albums.database.migrations import get_init_schema, migrate
+from albums.database.maintain import DatabaseSpace, database_space, maintain
+from albums.database.migrations import get_init_schema, migrate, schema_is_current
 from albums.database.orm import (
     NO_DEFAULT_VALUE_LIST_STR,
     Base,
@@ -11,11 +12,12 @@ from albums.database.orm import (
     SafeStringEnum,
     SerializableValueAsJson,
 )
-from albums.database.selector import Comparator, Match, collections_by_name, load_album_entities
+from albums.database.selector import Comparator, Match, collections_by_name, load_album_entities, load_selected_albums, select_album_ids
 
 __all__ = [
     "Base",
     "Comparator",
+    "DatabaseSpace",
     "IntEnumAsInt",
     "LoadIssuesAsJson",
     "LoadIssuesType",
@@ -25,8 +27,13 @@ __all__ = [
     "SafeStringEnum",
     "SerializableValueAsJson",
     "collections_by_name",
+    "database_space",
     "db_open",
     "get_init_schema",
     "load_album_entities",
+    "load_selected_albums",
+    "maintain",
     "migrate",
+    "schema_is_current",
+    "select_album_ids",
 ]
@@ -1,14 +1,16 @@
 import logging
+import sqlite3
 import sys
 from pathlib import Path
 from sqlite3 import Connection as SQLite3Connection
 from typing import Any, Final
+from urllib.parse import quote
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 
 # don't put any relative imports here, will make this file not runnable
-from albums.database.maintain import maintain
+from albums.database.maintain import maintain_if_due
 from albums.database.migrations import get_init_schema, migrate
 
 logger: Final = logging.getLogger(__name__)
@@ -16,6 +18,9 @@ logger: Final = logging.getLogger(__name__)
 # Sentinel for in-memory database
 MEMORY: Final = ":memory:"
 
+# seconds to wait for another albums process that is writing to the database before failing with "database is locked"
+BUSY_TIMEOUT: Final = 30.0
+
 
 @event.listens_for(Engine, "connect")
 def enable_foreign_keys(connection: Any, _):
@@ -25,20 +30,42 @@ def enable_foreign_keys(connection: Any, _):
         cursor.close()
 
 
-def db_open(filename: str | Path, echo: bool = False, version: int | None = None):
+def _synchronous_normal(connection: Any, _: Any):
+    # in WAL mode, commits don't wait for the disk and the database is still safe from corruption if power is lost
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA synchronous = NORMAL;")
+    cursor.close()
+
+
+def db_open(filename: str | Path, echo: bool = False, version: int | None = None, read_only: bool = False):
     """Open or create a database.
 
+    Database files use write-ahead logging (WAL), so that albums processes reading the database are not blocked by one
+    that is writing to it and do not block it. A process waits up to ``BUSY_TIMEOUT`` seconds for another one to finish
+    writing.
+
     Args:
         filename: Database file path, or MEMORY for in-memory.
         echo: Enable SQLAlchemy query logging.
         version: If specified, create/migrate the database to this version instead of the latest.
             Useful for tests that need to test specific migrations.
+        read_only: Open an existing database file for reading only, without migration or maintenance.
+
+    When a database file is opened, maintenance runs if it has not run for a day (see ``maintain_if_due``).
 
     Returns:
         SQLAlchemy Engine.
     """
+    if read_only:
+        uri = f"file:{quote(str(Path(filename).absolute()))}?mode=ro"
+        return create_engine("sqlite://", echo=echo, creator=lambda: sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT))
+
     existing_db = Path(filename).exists()
-    db = create_engine("sqlite://" if filename == MEMORY else f"sqlite:///{filename}", echo=echo)
+    if filename == MEMORY:
+        db = create_engine("sqlite://", echo=echo)
+    else:
+        db = create_engine(f"sqlite:///{filename}", echo=echo, connect_args={"timeout": BUSY_TIMEOUT})
+        event.listen(db, "connect", _synchronous_normal)
     try:
         if filename == MEMORY:
             with db.begin() as conn:
@@ -51,10 +78,15 @@ def db_open(filename: str | Path, echo: bool = False, version: int | None = None
                 print(f"creating database {filename}")
                 with db.begin() as conn:
                     connection = conn.connection
+                    # must be set before creating tables, so that maintenance can reclaim space without rewriting the file
+                    connection.execute("PRAGMA auto_vacuum = INCREMENTAL;")
                     connection.executescript(get_init_schema())
+            with db.connect() as conn:
+                conn.exec_driver_sql("PRAGMA journal_mode = WAL;")  # stored in the database file, no change if already set
 
             migrate(db, False, target_version=version)
-            maintain(db)
+            if version is None:
+                maintain_if_due(db)
         return db
     except Exception as ex:
         # Ensure all connections are disposed on error to prevent resource warnings
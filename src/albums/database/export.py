@@ -0,0 +1,198 @@
+import csv
+from itertools import batched, chain, groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, Iterable, Sequence, Tuple
+
+from sqlalchemy import ColumnElement, Float, FromClause, Integer, LargeBinary, Select, Text, TypeDecorator, func, select, type_coerce
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.types import NullType, TypeEngine
+
+from albums.entities import Album, FieldV, Track, TrackPicture
+from albums.tagger import BasicField
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# rows fetched from SQLite and written to a file at a time
+EXPORT_BATCH_SIZE: Final = 10000
+
+# file formats, also used as file extensions. Parquet and Arrow (IPC file format) need the optional pyarrow package.
+EXPORT_FORMATS: Final = ("csv", "parquet", "arrow")
+
+# separates the values of a field with more than one value in the wide per-track file
+MULTIPLE_VALUE_SEPARATOR: Final = "\n"
+
+WIDE_TRACK_FILE: Final = "track_wide"
+
+_WIDE_FIELDS: Final = [field for field in BasicField if field != BasicField.UNKNOWN]
+
+# column of each field in the wide per-track file, after track_id, album_id, path and filename
+_WIDE_COLUMNS: Final = {str(field): column for column, field in enumerate(_WIDE_FIELDS, 4)}
+_WIDE_HEADER: Final[Sequence[Tuple[str, TypeEngine[Any]]]] = [
+    ("track_id", Integer()),
+    ("album_id", Integer()),
+    ("path", Text()),
+    ("filename", Text()),
+    *((str(field), Text()) for field in _WIDE_FIELDS),
+]
+
+
+def export_catalog(db: Engine, album_ids: Select[Tuple[int | None]], directory: Path, format_: str = "csv") -> dict[str, int]:
+    """Export the selected albums to files in *directory*, one file per table plus a wide per-track file.
+
+    The ``album``, ``track``, ``track_field`` and ``track_picture`` files contain the stored columns of those tables. The
+    ``track_wide`` file has one row per track and one column per :class:`~.tagger.types.BasicField`, with multiple values
+    of a field separated by ``MULTIPLE_VALUE_SEPARATOR``.
+
+    In CSV files, binary values are hex and a field that a track does not have is empty. Parquet and Arrow files have typed
+    columns, binary values and nulls. Those formats need pyarrow, which is imported only when they are used.
+
+    Rows are ordered by album, following the ``album_id`` indexes. They are read and written ``EXPORT_BATCH_SIZE`` at a time,
+    so memory use does not grow with the size of the library.
+
+    Args:
+        db: SQLAlchemy engine connected to the albums database.
+        album_ids: Statement selecting the IDs of albums to export, like ``select_album_ids``.
+        directory: Existing directory to write files to. Existing files are replaced.
+        format_: One of ``EXPORT_FORMATS``, also used as the file extension.
+
+    Returns:
+        Number of rows written to each file, by file name without extension.
+
+    Raises:
+        ValueError: If the format is not supported.
+        ImportError: If the format needs pyarrow and it is not installed.
+    """
+    if format_ not in EXPORT_FORMATS:
+        raise ValueError(f"unsupported export format {format_}")
+    csv_format = format_ == "csv"
+    tables: dict[str, Tuple[FromClause, Select[Any]]] = {
+        "album": (Album.__table__, _select_table(Album.__table__, csv_format).where(Album.album_id.in_(album_ids)).order_by(Album.album_id)),
+        "track": (
+            Track.__table__,
+            _select_table(Track.__table__, csv_format).where(Track.album_id.in_(album_ids)).order_by(Track.album_id, Track.track_id),
+        ),
+        "track_field": (
+            FieldV.__table__,
+            _select_table(FieldV.__table__, csv_format)
+            .join(Track, Track.track_id == FieldV.track_id)
+            .where(Track.album_id.in_(album_ids))
+            .order_by(Track.album_id, Track.track_id, FieldV.track_field_id),
+        ),
+        "track_picture": (
+            TrackPicture.__table__,
+            _select_table(TrackPicture.__table__, csv_format)
+            .join(Track, Track.track_id == TrackPicture.track_id)
+            .where(Track.album_id.in_(album_ids))
+            .order_by(Track.album_id, Track.track_id, TrackPicture.track_picture_id),
+        ),
+    }
+    counts: dict[str, int] = {}
+    with db.connect() as conn:
+        for name, (table, stmt) in tables.items():
+            header = [(column.name, column.type) for column in table.columns]
+            counts[name] = _write_file(directory / f"{name}.{format_}", format_, header, _execute(conn, stmt).partitions())
+
+        result = _execute(conn, _select_track_fields(album_ids))
+        tracks = _pivot_fields(chain.from_iterable(result.partitions()), "" if csv_format else None)
+        path = directory / f"{WIDE_TRACK_FILE}.{format_}"
+        counts[WIDE_TRACK_FILE] = _write_file(path, format_, _WIDE_HEADER, batched(tracks, EXPORT_BATCH_SIZE))
+    return counts
+
+
+def _select_table(table: FromClause, hex_binary: bool) -> Select[Any]:
+    """Select all columns as stored, without converting values to Python types like enums."""
+    columns: list[ColumnElement[Any]] = [
+        func.hex(column).label(column.name)
+        if hex_binary and isinstance(column.type, LargeBinary)
+        else type_coerce(column, NullType()).label(column.name)
+        for column in table.columns
+    ]
+    return select(*columns)
+
+
+def _select_track_fields(album_ids: Select[Tuple[int | None]]) -> Select[Any]:
+    """Select tracks with their field values, one row per value (or one row for a track without fields) grouped by track."""
+    return (
+        select(Track.track_id, Track.album_id, Album.path, Track.filename, type_coerce(FieldV.field, NullType()), FieldV.value)
+        .join(Album, Album.album_id == Track.album_id)
+        .outerjoin(FieldV, FieldV.track_id == Track.track_id)
+        .where(Track.album_id.in_(album_ids))
+        .order_by(Track.album_id, Track.track_id, FieldV.track_field_id)
+    )
+
+
+def _pivot_fields(rows: Iterable[Sequence[Any]], missing: str | None) -> Iterable[Sequence[Any]]:
+    """Combine the rows of each track from ``_select_track_fields`` into one row with a column per field, or *missing*."""
+    no_fields = (missing,) * len(_WIDE_FIELDS)
+    for _, track_rows in groupby(rows, key=itemgetter(0)):
+        first = next(track_rows)
+        track = [*first[:4], *no_fields]
+        for *_, field, value in chain((first,), track_rows):
+            column = _WIDE_COLUMNS.get(field)
+            if column is not None:
+                track[column] = f"{track[column]}{MULTIPLE_VALUE_SEPARATOR}{value}" if track[column] else value
+        yield track
+
+
+def _execute(conn: Connection, stmt: Select[Any]):
+    return conn.execution_options(yield_per=EXPORT_BATCH_SIZE).execute(stmt)
+
+
+def _write_file(path: Path, format_: str, header: Sequence[Tuple[str, TypeEngine[Any]]], batches: Iterable[Sequence[Sequence[Any]]]) -> int:
+    if format_ == "csv":
+        return _write_csv(path, [name for (name, _) in header], batches)
+    return _write_columnar(path, format_, header, batches)
+
+
+def _write_csv(path: Path, header: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        for batch in batches:
+            writer.writerows(batch)
+            count += len(batch)
+    return count
+
+
+def _write_columnar(path: Path, format_: str, header: Sequence[Tuple[str, TypeEngine[Any]]], batches: Iterable[Sequence[Sequence[Any]]]) -> int:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    types = [_arrow_type(column_type) for (_, column_type) in header]
+    schema = pa.schema([(name, type_) for (name, _), type_ in zip(header, types)])
+    record_batches = (
+        pa.RecordBatch.from_arrays(  # pyright: ignore[reportUnknownMemberType]
+            [pa.array(values, type=type_) for values, type_ in zip(zip(*batch), types)], schema=schema
+        )
+        for batch in batches
+    )
+    count = 0
+    if format_ == "parquet":
+        with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+            for record_batch in record_batches:
+                writer.write_batch(record_batch)
+                count += record_batch.num_rows
+    else:
+        with pyarrow.ipc.new_file(str(path), schema) as writer:
+            for record_batch in record_batches:
+                writer.write_batch(record_batch)  # pyright: ignore[reportUnknownMemberType]
+                count += record_batch.num_rows
+    return count
+
+
+def _arrow_type(column_type: TypeEngine[Any]) -> "pyarrow.DataType":
+    import pyarrow as pa
+
+    if isinstance(column_type, TypeDecorator):
+        column_type = column_type.impl_instance
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, LargeBinary):
+        return pa.binary()
+    return pa.string()
@@ -1,30 +1,110 @@
 import logging
+import time
+from dataclasses import dataclass
 from typing import Final
 
 import humanize
-from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy import select, text, update
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 
+from albums.database.orm import schema_table
+
 logger: Final = logging.getLogger(__name__)
 
 SQL_CLEANUP: Final = "DELETE FROM collection WHERE collection_id NOT IN (SELECT collection_id FROM album_collection);"
 
+# automatic maintenance runs when a database is opened, at most this often
+MAINTENANCE_INTERVAL: Final = 24 * 60 * 60
+
+# automatic maintenance reclaims at most this many free pages, so that it never takes long
+INCREMENTAL_VACUUM_MAX_PAGES: Final = 16384
+
+AUTO_VACUUM_INCREMENTAL: Final = 2  # value of PRAGMA auto_vacuum
+
+# ANALYZE reads about this many rows of each index, which gives the query planner good enough statistics quickly
+ANALYSIS_LIMIT: Final = 1000
+
+
+@dataclass(frozen=True)
+class DatabaseSpace:
+    """Size of a database file.
+
+    Attributes:
+        size: Total size in bytes.
+        free: Bytes in unused pages, which can be reclaimed by vacuuming.
+        auto_vacuum: Value of ``PRAGMA auto_vacuum`` (0 = none, 1 = full, 2 = incremental).
+    """
+
+    size: int
+    free: int
+    auto_vacuum: int
+
+    def describe(self) -> str:
+        return f"{humanize.naturalsize(self.size, binary=True)} (unused space {humanize.naturalsize(self.free, binary=True)})"
+
+
+def database_space(connection: Connection | Session) -> DatabaseSpace:
+    (page_size, page_count, freelist_count, auto_vacuum) = connection.execute(
+        text(
+            "SELECT page_size, page_count, freelist_count, auto_vacuum FROM pragma_page_size, pragma_page_count, pragma_freelist_count, pragma_auto_vacuum;"
+        )
+    ).one()
+    return DatabaseSpace(page_size * page_count, page_size * freelist_count, auto_vacuum)
+
+
+def maintain_if_due(db: Engine) -> bool:
+    """Run automatic maintenance if it has not run for ``MAINTENANCE_INTERVAL`` seconds.
 
-def maintain(db: Engine):
+    Returns:
+        Whether maintenance ran.
+    """
+    with Session(db) as session:
+        maintained_at = session.scalar(select(schema_table.c.maintained_at))
+    if maintained_at is not None and time.time() - maintained_at < MAINTENANCE_INTERVAL:
+        return False
+    maintain(db)
+    return True
+
+
+def maintain(db: Engine, full: bool = False):
+    """Remove unused collections, update query planner statistics and reclaim unused space in the database.
+
+    Automatic maintenance (not *full*) never rewrites the whole database. If the database uses incremental auto-vacuum,
+    it reclaims up to ``INCREMENTAL_VACUUM_MAX_PAGES`` free pages when a lot of space is unused. Otherwise it only logs
+    a suggestion to run full maintenance.
+
+    Full maintenance switches the database to incremental auto-vacuum if needed, then runs ``VACUUM``, which rewrites
+    the whole database file and may take a while for a large library.
+
+    Args:
+        db: SQLAlchemy engine connected to the SQLite database file.
+        full: Run ``VACUUM`` even if little space would be reclaimed.
+    """
     with Session(db) as session:
         session.execute(text(SQL_CLEANUP))
+        session.execute(update(schema_table).values(maintained_at=int(time.time())))
+        session.commit()
 
-        # determine wasted space in db
-        (page_size, page_count, freelist_count) = session.execute(
-            text("SELECT page_size, page_count, freelist_count FROM pragma_page_size, pragma_page_count, pragma_freelist_count;")
-        ).one()
-        size = page_size * page_count
-        wasted = page_size * freelist_count
-        logger.debug(
-            f"database size approx {humanize.naturalsize(size, binary=True)} (wasted space approx {humanize.naturalsize(wasted, binary=True)})"
-        )
-        # if wasted space is > 10 MB or 20% of the total size, vacuum
-        if wasted > max(10 * 1024 * 1024, 0.2 * size):
+    # VACUUM and changing auto_vacuum are not allowed in a transaction
+    with db.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        # without statistics, SQLite may not choose the best index, e.g. for case-insensitive field lookups
+        conn.exec_driver_sql(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT};")
+        conn.exec_driver_sql("ANALYZE;")
+
+        space = database_space(conn)
+        logger.debug(f"database size approx {space.describe()}")
+        if full:
+            if space.auto_vacuum != AUTO_VACUUM_INCREMENTAL:
+                logger.debug("enabling incremental auto-vacuum")
+                conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL;")
             logger.debug("vacuuming database")
-            session.execute(text("VACUUM;"))
+            conn.exec_driver_sql("VACUUM;")
+        elif space.free > max(10 * 1024 * 1024, 0.2 * space.size):  # if unused space is > 10 MB or 20% of the total size
+            if space.auto_vacuum == AUTO_VACUUM_INCREMENTAL:
+                logger.debug("incremental vacuum")
+                cursor = conn.connection.cursor()
+                cursor.execute(f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_MAX_PAGES});").fetchall()  # frees one page per row
+                cursor.close()
+            else:
+                logger.info("the database has a lot of unused space, run albums db maintain to reclaim it")
@@ -0,0 +1,11 @@
+-- v19: Add album_check_pass table to remember checks that passed on unchanged albums
+
+CREATE TABLE album_check_pass (
+    album_check_pass_id INTEGER PRIMARY KEY,
+    album_id REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    check_name TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    modified_at INTEGER NOT NULL,
+    scanner INTEGER NOT NULL
+);
+CREATE INDEX idx_album_check_pass_album_id ON album_check_pass(album_id);
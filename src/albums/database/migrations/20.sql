@@ -0,0 +1,8 @@
+-- v20: Add album_name_key table with the artist and album name of each album, for finding duplicate albums
+
+CREATE TABLE album_name_key (
+    album_id INTEGER PRIMARY KEY REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    artist TEXT,
+    album_name TEXT
+);
+CREATE INDEX idx_album_name_key_names ON album_name_key(artist, album_name);
@@ -0,0 +1,15 @@
+-- v21: Add normalized album names and name trigrams to album_name_key, for finding similar album names
+
+-- names are found again when they are needed
+DELETE FROM album_name_key;
+ALTER TABLE album_name_key ADD COLUMN normal_artist TEXT;
+ALTER TABLE album_name_key ADD COLUMN normal_album_name TEXT;
+ALTER TABLE album_name_key ADD COLUMN trigram_count INTEGER NOT NULL DEFAULT 0;
+CREATE INDEX idx_album_name_key_normal_names ON album_name_key(normal_artist, normal_album_name);
+
+CREATE TABLE album_name_trigram (
+    trigram TEXT NOT NULL,
+    album_id INTEGER NOT NULL REFERENCES album_name_key(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    PRIMARY KEY (trigram, album_id)
+) WITHOUT ROWID;
+CREATE INDEX idx_album_name_trigram_album_id ON album_name_trigram(album_id);
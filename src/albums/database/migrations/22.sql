@@ -0,0 +1,3 @@
+-- v22: Record when database maintenance last ran, so it does not run on every invocation
+
+ALTER TABLE _schema ADD COLUMN maintained_at INTEGER NOT NULL DEFAULT 0;
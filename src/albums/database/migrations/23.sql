@@ -0,0 +1,144 @@
+-- v23: Declare foreign key columns as INTEGER and index track_field by name and value
+--
+-- Foreign key columns were declared without a type, so they have no type affinity. SQLite cannot use their indexes
+-- when they are compared with an INTEGER column like album.album_id, so filters like "-m field:artist=Foo" or
+-- "-c collection" scanned a whole table for every album. Tables are recreated to change the column types.
+
+PRAGMA foreign_keys = OFF;
+BEGIN;
+
+CREATE TABLE new_track (
+    track_id INTEGER PRIMARY KEY,
+    album_id INTEGER REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    filename TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    modify_timestamp INTEGER NOT NULL,
+    stream_bitrate INTEGER NOT NULL,
+    stream_channels INTEGER NOT NULL,
+    stream_codec TEXT NOT NULL,
+    stream_length REAL NOT NULL,
+    stream_sample_rate INTEGER NOT NULL,
+    stream_error TEXT NOT NULL DEFAULT '',
+    stream_bits_per_sample INTEGER NOT NULL DEFAULT 0
+);
+INSERT INTO new_track SELECT
+    track_id, album_id, filename, file_size, modify_timestamp, stream_bitrate, stream_channels, stream_codec, stream_length,
+    stream_sample_rate, stream_error, stream_bits_per_sample
+FROM track;
+DROP TABLE track;
+ALTER TABLE new_track RENAME TO track;
+CREATE INDEX idx_track_album_id ON track(album_id);
+
+CREATE TABLE new_track_field (
+    track_field_id INTEGER PRIMARY KEY,
+    track_id INTEGER REFERENCES track(track_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+INSERT INTO new_track_field SELECT track_field_id, track_id, name, value FROM track_field;
+DROP TABLE track_field;
+ALTER TABLE new_track_field RENAME TO track_field;
+CREATE INDEX idx_track_field_track_id ON track_field(track_id);
+-- finds the tracks with a field value without reading the table
+CREATE INDEX idx_track_field_name_value ON track_field(name, value, track_id);
+
+CREATE TABLE new_track_legacy_field (
+    track_legacy_field_id INTEGER PRIMARY KEY,
+    track_id INTEGER REFERENCES track(track_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    field_name TEXT NOT NULL
+);
+INSERT INTO new_track_legacy_field SELECT track_legacy_field_id, track_id, field_name FROM track_legacy_field;
+DROP TABLE track_legacy_field;
+ALTER TABLE new_track_legacy_field RENAME TO track_legacy_field;
+CREATE INDEX idx_legacy_field_track_id ON track_legacy_field(track_id);
+
+CREATE TABLE new_track_picture (
+    track_picture_id INTEGER PRIMARY KEY,
+    track_id INTEGER REFERENCES track(track_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    picture_type INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    file_hash BLOB NOT NULL,
+    load_issue TEXT NULL,
+    embed_ix INTEGER NOT NULL DEFAULT 0,
+    description TEXT NOT NULL DEFAULT '',
+    depth_bpp INTEGER NOT NULL DEFAULT 0
+);
+INSERT INTO new_track_picture SELECT
+    track_picture_id, track_id, picture_type, format, width, height, file_size, file_hash, load_issue, embed_ix, description, depth_bpp
+FROM track_picture;
+DROP TABLE track_picture;
+ALTER TABLE new_track_picture RENAME TO track_picture;
+CREATE INDEX idx_track_picture_track_id ON track_picture(track_id);
+
+CREATE TABLE new_album_collection (
+    album_collection_id INTEGER PRIMARY KEY,
+    album_id INTEGER REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    collection_id INTEGER REFERENCES collection(collection_id) ON UPDATE CASCADE ON DELETE CASCADE
+);
+INSERT INTO new_album_collection SELECT album_collection_id, album_id, collection_id FROM album_collection;
+DROP TABLE album_collection;
+ALTER TABLE new_album_collection RENAME TO album_collection;
+CREATE INDEX idx_collection_by_album_id ON album_collection(album_id);
+CREATE INDEX idx_collection_by_collection_id ON album_collection(collection_id);
+
+CREATE TABLE new_album_ignore_check (
+    album_ignore_check_id INTEGER PRIMARY KEY,
+    album_id INTEGER REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    check_name TEXT NOT NULL
+);
+INSERT INTO new_album_ignore_check SELECT album_ignore_check_id, album_id, check_name FROM album_ignore_check;
+DROP TABLE album_ignore_check;
+ALTER TABLE new_album_ignore_check RENAME TO album_ignore_check;
+CREATE INDEX idx_ignore_check_album_id ON album_ignore_check(album_id);
+
+CREATE TABLE new_album_picture_file (
+    album_picture_file_id INTEGER PRIMARY KEY,
+    album_id INTEGER REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    filename TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    modify_timestamp INTEGER NOT NULL,
+    file_hash BLOB NOT NULL,
+    format TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    cover_source INTEGER NOT NULL DEFAULT 0,
+    depth_bpp INTEGER NOT NULL DEFAULT 0,
+    load_issue TEXT NULL
+);
+INSERT INTO new_album_picture_file SELECT
+    album_picture_file_id, album_id, filename, file_size, modify_timestamp, file_hash, format, width, height, cover_source, depth_bpp, load_issue
+FROM album_picture_file;
+DROP TABLE album_picture_file;
+ALTER TABLE new_album_picture_file RENAME TO album_picture_file;
+CREATE INDEX idx_album_picture_file_album_id ON album_picture_file(album_id);
+
+CREATE TABLE new_album_other_file (
+    album_other_file_id INTEGER PRIMARY KEY,
+    album_id INTEGER REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    filename TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    modify_timestamp INTEGER NOT NULL
+);
+INSERT INTO new_album_other_file SELECT album_other_file_id, album_id, filename, file_size, modify_timestamp FROM album_other_file;
+DROP TABLE album_other_file;
+ALTER TABLE new_album_other_file RENAME TO album_other_file;
+CREATE INDEX idx_album_other_file_album_id ON album_other_file(album_id);
+
+CREATE TABLE new_album_check_pass (
+    album_check_pass_id INTEGER PRIMARY KEY,
+    album_id INTEGER REFERENCES album(album_id) ON UPDATE CASCADE ON DELETE CASCADE,
+    check_name TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    modified_at INTEGER NOT NULL,
+    scanner INTEGER NOT NULL
+);
+INSERT INTO new_album_check_pass SELECT album_check_pass_id, album_id, check_name, config_hash, modified_at, scanner FROM album_check_pass;
+DROP TABLE album_check_pass;
+ALTER TABLE new_album_check_pass RENAME TO album_check_pass;
+CREATE INDEX idx_album_check_pass_album_id ON album_check_pass(album_id);
+
+COMMIT;
+PRAGMA foreign_keys = ON;
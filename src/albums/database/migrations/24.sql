@@ -0,0 +1,3 @@
+-- v24: Index lowercase track field values, to look up albums by artist and album name ignoring case
+
+CREATE INDEX idx_track_field_name_lower_value ON track_field(name, lower(value));
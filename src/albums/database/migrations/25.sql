@@ -0,0 +1,37 @@
+-- v25: Full-text search index of track field values and album paths
+--
+-- The search tables are external content FTS5 tables: they only store the index, and read values from track_field and
+-- album. Triggers keep them up to date whenever a value is written. Case and accents are ignored, and prefix indexes
+-- make searches for the start of a word like "beat*" fast.
+
+CREATE VIRTUAL TABLE track_field_search USING fts5(
+    value, content='track_field', content_rowid='track_field_id', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+INSERT INTO track_field_search(track_field_search) VALUES ('rebuild');
+
+CREATE TRIGGER track_field_search_insert AFTER INSERT ON track_field BEGIN
+    INSERT INTO track_field_search(rowid, value) VALUES (new.track_field_id, new.value);
+END;
+CREATE TRIGGER track_field_search_delete AFTER DELETE ON track_field BEGIN
+    INSERT INTO track_field_search(track_field_search, rowid, value) VALUES ('delete', old.track_field_id, old.value);
+END;
+CREATE TRIGGER track_field_search_update AFTER UPDATE OF track_field_id, value ON track_field BEGIN
+    INSERT INTO track_field_search(track_field_search, rowid, value) VALUES ('delete', old.track_field_id, old.value);
+    INSERT INTO track_field_search(rowid, value) VALUES (new.track_field_id, new.value);
+END;
+
+CREATE VIRTUAL TABLE album_search USING fts5(
+    path, content='album', content_rowid='album_id', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+INSERT INTO album_search(album_search) VALUES ('rebuild');
+
+CREATE TRIGGER album_search_insert AFTER INSERT ON album BEGIN
+    INSERT INTO album_search(rowid, path) VALUES (new.album_id, new.path);
+END;
+CREATE TRIGGER album_search_delete AFTER DELETE ON album BEGIN
+    INSERT INTO album_search(album_search, rowid, path) VALUES ('delete', old.album_id, old.path);
+END;
+CREATE TRIGGER album_search_update AFTER UPDATE OF album_id, path ON album BEGIN
+    INSERT INTO album_search(album_search, rowid, path) VALUES ('delete', old.album_id, old.path);
+    INSERT INTO album_search(rowid, path) VALUES (new.album_id, new.path);
+END;
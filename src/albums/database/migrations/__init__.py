@@ -4,7 +4,7 @@ import logging
 from pathlib import Path
 from typing import Final
 
-from .migrate import migrate
+from .migrate import migrate, schema_is_current
 
 logger: Final = logging.getLogger(__name__)
 
@@ -15,4 +15,4 @@ def get_init_schema() -> str:
         return f.read()
 
 
-__all__ = ["get_init_schema", "migrate"]
+__all__ = ["get_init_schema", "migrate", "schema_is_current"]
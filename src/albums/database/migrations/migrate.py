@@ -1,4 +1,5 @@
 import logging
+from functools import cache
 from pathlib import Path
 from typing import Final
 
@@ -10,29 +11,31 @@ from albums.database.orm import schema_table
 logger: Final = logging.getLogger(__name__)
 
 
-def _load_migrations() -> dict[int, str]:
-    """Load all migration SQL files keyed by version number."""
-    result: dict[int, str] = {}
-    for sql_file in sorted(Path(__file__).parent.iterdir()):
-        stem = sql_file.stem
-        if not stem.isdigit():
-            continue
-        version = int(stem)
-        with sql_file.open("r") as f:
-            result[version] = f.read()
-    return result
+@cache
+def _migration_files() -> dict[int, Path]:
+    """Find all migration SQL files keyed by version number."""
+    return {int(sql_file.stem): sql_file for sql_file in sorted(Path(__file__).parent.iterdir()) if sql_file.stem.isdigit()}
+
+
+def schema_is_current(db: Engine) -> bool:
+    """Check whether the database schema is the one this version of albums uses, so that it does not need to be migrated."""
+    with Session(db) as session:
+        db_version = int(str(session.scalar(select(schema_table.c.version))))
+    return db_version == max(_migration_files().keys())
 
 
 def migrate(db: Engine, quiet: bool = False, target_version: int | None = None) -> None:
     """Run all required migrations up to *target_version* (or the latest). Some schema must be present.
 
+    If the database is already up to date, this only reads the schema version.
+
     Args:
         db: SQLAlchemy engine connected to the SQLite database.
         quiet: Suppress migration log messages.
         target_version: Target schema version.  Pass ``None`` (default) for
             the latest available version.
     """
-    migrations = _load_migrations()
+    migrations = _migration_files()
     current_schema_version = max(migrations.keys())
     effective_target = target_version if target_version is not None else current_schema_version
 
@@ -53,7 +56,7 @@ def migrate(db: Engine, quiet: bool = False, target_version: int | None = None)
         if not quiet:
             logger.info("migrating database: v%d", version)
         with db.begin() as conn:
-            conn.connection.executescript(migrations[version])
+            conn.connection.executescript(migrations[version].read_text())
 
     with Session(db) as session:
         session.execute(update(schema_table), {"version": effective_target})
@@ -13,7 +13,12 @@ class Base(DeclarativeBase):
     """SQLAlchemy declarative base for all database models."""
 
 
-schema_table: Final = Table("_schema", Base.metadata, Column("version", Integer, nullable=False, unique=True))
+schema_table: Final = Table(
+    "_schema",
+    Base.metadata,
+    Column("version", Integer, nullable=False, unique=True),
+    Column("maintained_at", Integer, nullable=False, default=0),  # since v22
+)
 NO_DEFAULT_VALUE_LIST_STR: Final = [
     "".join(["!", "NO DEFAULT VALUE"])
 ]  # Sentinel default for Track.get() - never a real field value, used to detect caller omitting default
@@ -24,6 +29,8 @@ class IntEnumAsInt[EnumType](TypeDecorator[EnumType]):
 
     impl = Integer
 
+    cache_ok = True
+
     @override
     def __init__(self, enum_type: type, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
@@ -0,0 +1,120 @@
+import re
+from typing import Final, Iterator, List, Tuple
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Integer,
+    Select,
+    Text,
+    and_,
+    column,
+    func,
+    literal_column,
+    null,
+    select,
+    table,
+    type_coerce,
+    union,
+)
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.types import NullType
+
+from albums.entities import Album, FieldV, Track
+
+# full-text search indexes created by migration 25, kept up to date by triggers
+track_field_search: Final = table("track_field_search", column("rowid", Integer), column("value", Text))
+album_search: Final = table("album_search", column("rowid", Integer), column("path", Text))
+
+# search_matches looks up the values of at most this many albums one at a time, instead of reading every match
+SEARCH_LOOKUP_MAX_ALBUMS: Final = 1000
+
+# marks the start and end of matched words in values from search_matches
+HIGHLIGHT_START: Final = "\x02"
+HIGHLIGHT_END: Final = "\x03"
+
+# a word or number to search for, optionally followed by * to match words starting with it
+_TERM: Final = re.compile(r"(\w+)(\*?)")
+
+
+def search_terms(search_text: str) -> List[str]:
+    """Convert free text to full-text search terms, one per word. Other characters, such as FTS5 query syntax, are ignored.
+
+    Returns:
+        Quoted terms like ``"beatles"`` or ``"abb"*`` for a prefix search. Empty if the text has no words.
+    """
+    return [f'"{word}"{star}' for word, star in _TERM.findall(search_text)]
+
+
+def search_clause(search_text: str) -> ColumnElement[bool]:
+    """Match albums that contain every word of *search_text* in the path or tags of any track, ignoring case and accents.
+
+    The words may be in different fields. A word ending with ``*`` matches words that start with it.
+
+    Raises:
+        ValueError: If the search text has no words.
+    """
+    terms = search_terms(search_text)
+    if not terms:
+        raise ValueError(f'search text "{search_text}" does not contain a word to search for')
+    return and_(*(Album.album_id.in_(_albums_matching(term)) for term in terms))
+
+
+def search_matches(session: Session, album_ids: Select[Tuple[int | None]], search_text: str) -> Iterator[Tuple[str, str | None, str]]:
+    """Find the selected albums that match *search_text* (see ``search_clause``), and the values in them that match any word.
+
+    Matched words are between ``HIGHLIGHT_START`` and ``HIGHLIGHT_END``. If a few albums match, their values are looked up in
+    the search index one at a time. Otherwise every match in the index is read once, which is faster for many albums.
+
+    Args:
+        session: Database session.
+        album_ids: Statement selecting the IDs of albums to search, like ``select_album_ids``.
+        search_text: Words to search for.
+
+    Returns:
+        Distinct ``(path, field, value)`` rows ordered by album path then field, where field is the stored field name or
+        ``None`` for the album path.
+    """
+    matching = album_ids.where(search_clause(search_text))
+    ids = list(session.scalars(matching))
+    query = " OR ".join(search_terms(search_text))
+    fields = (
+        select(
+            Track.album_id,
+            type_coerce(FieldV.field, NullType()).label("field"),  # field name as stored, NULL for paths
+            func.highlight(literal_column("track_field_search"), 0, HIGHLIGHT_START, HIGHLIGHT_END).label("value"),
+        )
+        .select_from(track_field_search)
+        .join(FieldV, FieldV.track_field_id == track_field_search.c.rowid)
+        .join(Track, Track.track_id == FieldV.track_id)
+        .where(literal_column("track_field_search").match(query))
+    )
+    if len(ids) <= SEARCH_LOOKUP_MAX_ALBUMS:
+        album_field = aliased(FieldV)
+        album_track = aliased(Track)
+        album_field_ids = select(album_field.track_field_id).join(album_track, album_track.track_id == album_field.track_id)
+        fields = fields.where(track_field_search.c.rowid.in_(album_field_ids.where(album_track.album_id.in_(ids))))
+        selected = select(Album.album_id).where(Album.album_id.in_(ids))
+    else:
+        fields = fields.where(Track.album_id.in_(matching))
+        selected = matching
+    paths = select(album_search.c.rowid, null(), func.highlight(literal_column("album_search"), 0, HIGHLIGHT_START, HIGHLIGHT_END)).where(
+        literal_column("album_search").match(query), album_search.c.rowid.in_(selected)
+    )
+    matches = union(fields, paths).subquery()
+    stmt = (
+        select(Album.path, matches.c.field, matches.c.value)
+        .join(matches, matches.c.album_id == Album.album_id)
+        .order_by(Album.path, matches.c.field, matches.c.value)
+    )
+    return session.execute(stmt).tuples()
+
+
+def _albums_matching(term: str) -> CompoundSelect[Tuple[int | None]]:
+    return union(
+        select(album_search.c.rowid).where(literal_column("album_search").match(term)),
+        select(Track.album_id)
+        .join(FieldV, FieldV.track_id == Track.track_id)
+        .join(track_field_search, track_field_search.c.rowid == FieldV.track_field_id)
+        .where(literal_column("track_field_search").match(term)),
+    )
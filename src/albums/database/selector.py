@@ -1,16 +1,25 @@
 import logging
+import sys
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Final, Generator, List, Mapping, Sequence, Tuple
 
-from sqlalchemy import ScalarSelect, and_, exists, not_, or_, select
+from sqlalchemy import ColumnElement, ScalarSelect, Select, and_, exists, func, not_, or_, select
 from sqlalchemy.orm import InstrumentedAttribute, Session, aliased
+from sqlalchemy.orm.interfaces import ORMOption
 
+from albums.database.search import search_clause
 from albums.entities import Album, AlbumCollectionAssociation, CollectionEntity, FieldV, IgnoreCheckEntity, Track
 from albums.tagger import BasicField
 
 logger: Final = logging.getLogger(__name__)
 
+# Number of albums loaded from the database at a time by load_album_entities and load_selected_albums.
+ALBUM_PAGE_SIZE: Final = 256
+
+# characters that are not literal in a regular expression, unless escaped
+_REGEX_SPECIAL: Final = frozenset(".^$*+?{}[]\\|()")
+
 
 class Comparator(StrEnum):
     """Comparison operators for database queries."""
@@ -41,39 +50,69 @@ _TRACK_COLUMNS: Final = {
 }
 
 
-def load_album_entities(session: Session, filter: Mapping[str, List[Match]] = {}, invert: bool = False) -> Generator[Album, None, None]:
-    """Load albums matching the given filters.
+def load_album_entities(
+    session: Session, filter: Mapping[str, List[Match]] = {}, invert: bool = False, page_size: int = ALBUM_PAGE_SIZE
+) -> Generator[Album, None, None]:
+    """Load albums matching the given filters, in order of path.
 
-    Filters support keys like ``path``, ``collection``, ``ignore_check``, track columns (``bitrate``, ``codec``, etc.), and ``field:artist``.
+    Filters support keys like ``path``, ``collection``, ``ignore_check``, track columns (``bitrate``, ``codec``, etc.), ``field:artist``,
+    and ``search`` for words in the path or tags (see ``search_clause``).
+
+    The IDs of matching albums are selected first, then albums are loaded a page at a time. The session only keeps weak
+    references to unchanged albums, so albums that the caller is done with can be freed and memory use does not grow with
+    the size of the library. Albums that are renamed or deleted while iterating are not affected by paging.
 
     Args:
         session: Database session.
         filter: Mapping of filter keys to list of match criteria.
         invert: If true, return albums that don't match any filter.
+        page_size: Number of albums to load at a time.
+    """
+    return load_selected_albums(session, select_album_ids(filter, invert), page_size=page_size)
+
+
+def load_selected_albums(
+    session: Session, album_ids: Select[Tuple[int | None]], options: Sequence[ORMOption] = (), page_size: int = ALBUM_PAGE_SIZE
+) -> Generator[Album, None, None]:
+    """Load the albums selected by a statement like ``select_album_ids``, a page at a time in order of path.
+
+    Args:
+        session: Database session.
+        album_ids: Statement selecting album IDs.
+        options: Loader options for each page query, e.g. ``selectinload(Album.tracks)`` to load the tracks of every album
+            in a page with one more query instead of one query per album.
+        page_size: Number of albums to load at a time.
+    """
+    ids = list(session.scalars(album_ids.order_by(Album.path)))
+    for start in range(0, len(ids), page_size):
+        page = ids[start : start + page_size]
+        albums = {album.album_id: album for album in session.scalars(select(Album).where(Album.album_id.in_(page)).options(*options))}
+        yield from (albums[album_id] for album_id in page if album_id in albums)
+
+
+def select_album_ids(filter: Mapping[str, List[Match]] = {}, invert: bool = False) -> Select[Tuple[int | None]]:
+    """Build a statement selecting the IDs of albums matching the given filters, see ``load_album_entities``.
+
+    Use it in a subquery to query matching albums without loading them, e.g. ``Album.album_id.in_(select_album_ids(filter))``.
     """
-    stmt = select(Album)
+    stmt = select(Album.album_id)
     fields: list[Tuple[str, List[Match]]] = [(k.partition(":")[2], matches) for k, matches in filter.items() if k.startswith("field:")]
     if fields:
-        track_match = select(Track.track_id).where(Album.album_id == Track.album_id)
+        # albums with a track matching every field filter, found once with the track_field name/value index rather than per album
+        matching_albums = select(Track.album_id)
         for field_name, matches in fields:
             entity = aliased(FieldV)
             clauses = [or_(*(_compare(entity.value, m.comparator, m.value) for m in matches))] if matches else []  # empty = field exists, any value
-            track_match = track_match.join(entity, and_(Track.track_id == entity.track_id, entity.field == BasicField(field_name), *clauses))
-        stmt = stmt.where(not_(exists(track_match))) if invert else stmt.where(exists(track_match))
+            matching_albums = matching_albums.join(entity, and_(Track.track_id == entity.track_id, entity.field == BasicField(field_name), *clauses))
+        stmt = stmt.where(Album.album_id.not_in(matching_albums)) if invert else stmt.where(Album.album_id.in_(matching_albums))
 
     for key, matches in ((k, v) for k, v in filter.items() if not k.startswith("field:")):
         if key == "collection":
             # TODO: make this consistent, maybe everything should be "and" instead of some being "or"
-            clause = (
-                select(AlbumCollectionAssociation)
+            clause = Album.album_id.in_(
+                select(AlbumCollectionAssociation.album_id)
                 .join(CollectionEntity, AlbumCollectionAssociation.collection_id == CollectionEntity.collection_id)
-                .where(
-                    and_(
-                        AlbumCollectionAssociation.album_id == Album.album_id,
-                        or_(*(_compare(CollectionEntity.collection_name, m.comparator, m.value) for m in matches)),
-                    )
-                )
-                .exists()
+                .where(or_(*(_compare(CollectionEntity.collection_name, m.comparator, m.value) for m in matches)))
             )
         elif key == "ignore_check":
             clause = (
@@ -88,6 +127,10 @@ def load_album_entities(session: Session, filter: Mapping[str, List[Match]] = {}
             )
         elif key == "path":
             clause = or_(*(_compare(Album.path, m.comparator, m.value) for m in matches))
+        elif key == "search":
+            if any(m.comparator != Comparator.EQ for m in matches):
+                raise ValueError(f"search filter must use {Comparator.EQ.value}")
+            clause = or_(*(search_clause(m.value) for m in matches))
         elif key in _TRACK_COLUMNS:
             (column, cls) = _TRACK_COLUMNS[key]
             track_matchers = (_compare(column, m.comparator, cls(m.value)) for m in matches)
@@ -95,8 +138,7 @@ def load_album_entities(session: Session, filter: Mapping[str, List[Match]] = {}
         else:
             raise ValueError(f"invalid filter key {key}")
         stmt = stmt.where(not_(clause)) if invert else stmt.where(clause)
-
-    yield from (album[0] for album in session.execute(stmt.order_by(Album.path)))
+    return stmt
 
 
 def _compare(
@@ -108,7 +150,7 @@ def _compare(
         case Comparator.NEQ:
             return value != target
         case Comparator.MATCH_REGEX:
-            return value.regexp_match(str(target))
+            return _match_regex(value, target) if isinstance(target, str) else value.regexp_match(str(target))
         case Comparator.LT:
             return value < target
         case Comparator.LTE:
@@ -119,6 +161,49 @@ def _compare(
             return value >= target
 
 
+def _match_regex(value: InstrumentedAttribute[str] | InstrumentedAttribute[int] | ScalarSelect[str] | ScalarSelect[int], pattern: str):
+    """Match a regular expression with SQLite string functions where possible, since ``regexp_match`` calls Python for every row.
+
+    A literal pattern like ``Foo`` is a substring search. A pattern starting with a literal like ``^Foo`` or ``^Foo.*Bar`` is a range
+    of values that an index on the column can find, and the range is only checked against the full pattern if there is more to it.
+    """
+    anchored = pattern.startswith("^")
+    (prefix, literal) = _regex_literal_prefix(pattern[1:] if anchored else pattern)
+    if not prefix:
+        return value.regexp_match(pattern)
+    if not anchored:
+        return func.instr(value, prefix) > 0 if literal else value.regexp_match(pattern)
+
+    # values starting with prefix sort before prefix with its last character incremented
+    after = ord(prefix[-1]) + 1
+    if after > sys.maxunicode:
+        return value.regexp_match(pattern)
+    if 0xD800 <= after <= 0xDFFF:  # surrogates can't be stored, the next character that can is U+E000
+        after = 0xE000
+    in_range: ColumnElement[bool] = and_(value >= prefix, value < prefix[:-1] + chr(after))
+    return in_range if literal else and_(in_range, value.regexp_match(pattern))
+
+
+def _regex_literal_prefix(pattern: str) -> Tuple[str, bool]:
+    """Get the literal text that every match of a regular expression starts with, and whether that is the whole expression."""
+    if "|" in pattern:  # alternatives may not start with the same text
+        return ("", False)
+    literal: list[str] = []
+    ix = 0
+    while ix < len(pattern):
+        if pattern[ix] == "\\" and ix + 1 < len(pattern) and not pattern[ix + 1].isalnum():  # escaped punctuation is literal
+            literal.append(pattern[ix + 1])
+            ix += 2
+        elif pattern[ix] in _REGEX_SPECIAL:
+            break
+        else:
+            literal.append(pattern[ix])
+            ix += 1
+    if ix < len(pattern) and pattern[ix] in "*?{" and literal:  # the last character is optional or repeated any number of times
+        literal.pop()
+    return ("".join(literal), ix == len(pattern))
+
+
 # It shouldn't be (and isn't strictly) necessary to look up collections or explicitly create them. But the association_proxy creator implementation
 # in Album creates a duplicate CollectionEntity if the collection already exists, causing the following warning even though the operation succeeds:
 # SAWarning: Identity map already had an identity for (<class 'albums.types.CollectionEntity'>, (1,), None), replacing it with newly flushed object.
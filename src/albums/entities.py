@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import Any, List, Mapping, Optional, Sequence, overload
+from typing import Any, Final, List, Mapping, Optional, Sequence, overload
+from weakref import WeakKeyDictionary
 
-from sqlalchemy import REAL, Boolean, ForeignKey, Index, Integer, LargeBinary, Text
+from sqlalchemy import REAL, Boolean, ForeignKey, Index, Integer, LargeBinary, Text, event, func, inspect, text
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, composite, mapped_column, relationship
 
@@ -28,7 +29,11 @@ class FieldV(Base):
     """
 
     __tablename__ = "track_field"
-    __table_args__ = (Index("idx_track_field_track_id", "track_id"),)
+    __table_args__ = (
+        Index("idx_track_field_track_id", "track_id"),
+        Index("idx_track_field_name_value", "name", "value", "track_id"),
+        Index("idx_track_field_name_lower_value", "name", func.lower(text("value"))),
+    )
 
     track_field_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=False, primary_key=True)
     track_id: Mapped[Optional[int]] = mapped_column(ForeignKey("track.track_id"), nullable=False)
@@ -164,10 +169,7 @@ class Track(Base):
         Returns:
             Mapping where each value is a list of frame text for that field.
         """
-        map_fields: dict[BasicField, List[str]] = {}
-        for tag_entity in self.fields:
-            map_fields.setdefault(tag_entity.field, []).append(tag_entity.value)
-        return map_fields
+        return {field: list(values) for field, values in self._field_values().items()}
 
     def has(self, field: BasicField) -> bool:
         """Return ``True`` when at least one value for *field* exists.
@@ -175,7 +177,7 @@ class Track(Base):
         Args:
             field: The :class:`~.tagger.types.BasicField` to check for.
         """
-        return any(v.field == field for v in self.fields)
+        return field in self._field_values()
 
     @overload
     def get(self, field: BasicField, default: None) -> Sequence[str] | None: ...
@@ -193,13 +195,24 @@ class Track(Base):
         Returns:
             Tuple of decoded text values or the provided fallback sequence.
         """
-        result = tuple(t.value for t in self.fields if t.field == field)
-        if len(result) == 0:
+        result = self._field_values().get(field)
+        if result is None:
             if default is NO_DEFAULT_VALUE_LIST_STR:
                 raise KeyError(f"{field.value} is not in fields")
             return default
         return result
 
+    def _field_values(self) -> Mapping[BasicField, tuple[str, ...]]:
+        # checks look up fields many times per track, so values are grouped once until the fields change
+        values = _track_field_values.get(self)
+        if values is None:
+            grouped: dict[BasicField, list[str]] = {}
+            for tag_entity in self.fields:
+                grouped.setdefault(tag_entity.field, []).append(tag_entity.value)
+            values = {field: tuple(field_values) for field, field_values in grouped.items()}
+            _track_field_values[self] = values
+        return values
+
     def __init__(self, **kw: Any):
         """Construct a track row, accepting ``fields`` entity list or (for tests/convenience) a BasicField->List mapping"""
         if "fields" not in kw and "tag" in kw and isinstance(kw["tag"], Mapping):
@@ -423,6 +436,75 @@ class IgnoreCheckEntity(Base):
         self.check_name = check_name
 
 
+class CheckPassEntity(Base):
+    """Row recording that a check passed on an album, so it can be skipped until the album or the check config changes.
+
+    Attributes:
+        album_check_pass_id: Primary key.
+        album_id: Foreign key linking to the ``album`` row.
+        check_name: Name of the check that passed.
+        config_hash: Hash of the check configuration (and application version) when the check passed.
+        modified_at: Value of :attr:`Album.modified_at` when the check passed.
+        scanner: Value of :attr:`Album.scanner` when the check passed.
+    """
+
+    __tablename__ = "album_check_pass"
+    __table_args__ = (Index("idx_album_check_pass_album_id", "album_id"),)
+
+    album_check_pass_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=False, primary_key=True)
+    album_id: Mapped[int] = mapped_column(ForeignKey("album.album_id"), nullable=False)
+
+    check_name: Mapped[str] = mapped_column(Text, nullable=False)
+    config_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    modified_at: Mapped[int] = mapped_column(Integer, nullable=False)
+    scanner: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class AlbumNameKeyEntity(Base):
+    """Lowercase and normalized artist and album name of an album, used to find albums that are probably duplicates.
+
+    The scanner deletes the row when the album changes, so that the names are found again.
+
+    Attributes:
+        album_id: Primary key and foreign key linking to the ``album`` row.
+        artist: Most frequent artist or album artist value in the album's tracks, in lowercase.
+        album_name: Most frequent album value in the album's tracks, in lowercase.
+        normal_artist: ``artist`` without case, accents, punctuation, articles or parenthetical text.
+        normal_album_name: ``album_name`` without case, accents, punctuation, articles or parenthetical text.
+        trigram_count: Number of distinct :class:`AlbumNameTrigramEntity` rows for this album.
+    """
+
+    __tablename__ = "album_name_key"
+    __table_args__ = (
+        Index("idx_album_name_key_names", "artist", "album_name"),
+        Index("idx_album_name_key_normal_names", "normal_artist", "normal_album_name"),
+    )
+
+    album_id: Mapped[int] = mapped_column(ForeignKey("album.album_id"), primary_key=True)
+    artist: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    album_name: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    normal_artist: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    normal_album_name: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    trigram_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class AlbumNameTrigramEntity(Base):
+    """One three-character substring of the normalized artist and album name of an album, to find similar names.
+
+    Rows are deleted with the :class:`AlbumNameKeyEntity` row of the album.
+
+    Attributes:
+        trigram: Three characters from a word of the normalized names, with words padded by spaces.
+        album_id: Foreign key linking to the ``album_name_key`` row.
+    """
+
+    __tablename__ = "album_name_trigram"
+    __table_args__ = (Index("idx_album_name_trigram_album_id", "album_id"),)
+
+    trigram: Mapped[str] = mapped_column(Text, primary_key=True)
+    album_id: Mapped[int] = mapped_column(ForeignKey("album_name_key.album_id", ondelete="CASCADE"), primary_key=True)
+
+
 class ScanHistoryEntity(Base):
     """Per-full-scan audit row. Can be used to decide whether a full rescan is needed on next launch.
 
@@ -441,3 +523,31 @@ class ScanHistoryEntity(Base):
     timestamp: Mapped[int] = mapped_column(Integer, nullable=False)
     folders_scanned: Mapped[int] = mapped_column(Integer, nullable=False)
     albums_total: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+# field values of each track by field, see Track.get (cleared when fields of the track may have changed)
+_track_field_values: Final[WeakKeyDictionary[Track, Mapping[BasicField, tuple[str, ...]]]] = WeakKeyDictionary()
+
+
+@event.listens_for(Track.fields, "append")
+@event.listens_for(Track.fields, "remove")
+@event.listens_for(Track.fields, "bulk_replace")
+def track_fields_changed(target: Track, *_: Any):
+    _track_field_values.pop(target, None)
+
+
+@event.listens_for(Track, "expire")
+@event.listens_for(Track, "refresh")
+def track_reloaded(target: Track | None, *_: Any):
+    if target is not None:  # None if the track was already garbage collected
+        _track_field_values.pop(target, None)
+
+
+@event.listens_for(FieldV.field, "set")
+@event.listens_for(FieldV.value, "set")
+def field_value_changed(target: FieldV, *_: Any):
+    track = inspect(target).attrs.track.loaded_value  # don't load the track from the database
+    if isinstance(track, Track):
+        _track_field_values.pop(track, None)
+    elif target.track_id is not None:
+        _track_field_values.clear()  # track is not known without a query
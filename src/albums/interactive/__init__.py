@@ -1,12 +1,30 @@
-from .configurator import interactive_config
-from .image_table import render_image_table
-from .interact import interact, prompt_ignore_checks
-from .setup_settings import set_library
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from .configurator import interactive_config
+    from .image_table import render_image_table
+    from .interact import prompt_ignore_checks
+    from .setup_settings import set_library
 
 __all__ = [
-    "interact",
     "interactive_config",
     "prompt_ignore_checks",
     "render_image_table",
     "set_library",
 ]
+
+# modules are imported on first use, e.g. checks that show images do not need the configurator. The interact()
+# function is not exported lazily because its module has the same name: import it from albums.interactive.interact
+_MODULES: Final = {
+    "interactive_config": "configurator",
+    "prompt_ignore_checks": "interact",
+    "render_image_table": "image_table",
+    "set_library": "setup_settings",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{_MODULES[name]}"), name)
@@ -1,18 +1,19 @@
 import io
 import logging
 from math import sqrt
-from typing import Any, Dict, Final, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Final, List, Sequence, Tuple
 
 import humanize
-import numpy
 from PIL import Image
 from rich.console import RenderableType
 from rich_pixels import Pixels
-from skimage.metrics import mean_squared_error  # pyright: ignore[reportUnknownVariableType]
 
 from albums.app import Context
 from albums.tagger import AlbumTagger, Picture
 
+if TYPE_CHECKING:
+    import numpy
+
 logger: Final = logging.getLogger(__name__)
 
 
@@ -26,7 +27,7 @@ def render_image_table(
     target_width = int((ctx.console.width - 3) / len(pictures))
     target_height = (ctx.console.height - 10) * 2
     captions: list[RenderableType] = []
-    reference_image: numpy.ndarray[Any] | None = None
+    reference_image: "numpy.ndarray[Any] | None" = None
     reference_width = reference_height = 0
     for cover_ref in pictures:
         if isinstance(cover_ref, Picture):
@@ -46,6 +47,10 @@ def render_image_table(
             pixels_images.append(pixels)
             caption = f"[{cover.picture_info.width} x {cover.picture_info.height}] {humanize.naturalsize(len(image_data), binary=True)}"
             if len(pictures) > 1:
+                # numpy and scikit-image take most of a second to import, only load them to compare images
+                import numpy
+                from skimage.metrics import mean_squared_error  # pyright: ignore[reportUnknownVariableType]
+
                 image = image.convert("RGB")
                 aspect = image.width / image.height
                 if reference_image is not None:
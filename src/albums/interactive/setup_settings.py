@@ -35,6 +35,7 @@ def configure_settings(ctx: Context):
                 ("more_import_paths", f"more_import_paths ({','.join(t.template for t in ctx.config.more_import_paths)})"),
                 ("import_scan_max_paths", f"import_scan_max_paths ({ctx.config.import_scan_max_paths})"),
                 ("id3v1", f"id3v1 ({ctx.config.id3v1.name})"),
+                ("tag_padding", f"tag_padding ({humanize.naturalsize(ctx.config.tag_padding, binary=True)})"),
                 ("transcoder_cache", f"transcoder_cache ({str(ctx.config.transcoder_cache)}"),
                 ("transcoder_cache_size", f"transcoder_cache_size ({humanize.naturalsize(ctx.config.transcoder_cache_size, binary=True)})"),
                 ("back", "<< go back"),
@@ -67,6 +68,7 @@ def _configure_setting(
         "more_import_paths",
         "import_scan_max_paths",
         "id3v1",
+        "tag_padding",
         "transcoder_cache",
         "transcoder_cache_size",
     ],
@@ -132,6 +134,13 @@ def _configure_setting(
             )
             ctx.config.id3v1 = ID3v1Policy(option)
             config_save(ctx.db, ctx.config)
+        case "tag_padding":
+            while not str.isdecimal(
+                tag_padding := prompt("Padding in bytes to reserve when a file must be rewritten to save tags: ", default=str(ctx.config.tag_padding))
+            ):
+                pass
+            ctx.config.tag_padding = int(tag_padding)
+            config_save(ctx.db, ctx.config)
         case "transcoder_cache":
             path_completer = PathCompleter()
             cache = Path(prompt("Location/path for transcoder cache: ", completer=path_completer, default=str(ctx.config.transcoder_cache)))
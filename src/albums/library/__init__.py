@@ -1,13 +1,34 @@
-from albums.library.duplicates import DuplicateFinder
-from albums.library.importer import Importer
-from albums.library.paths import show_template_path_help
-from albums.library.scanner import run_scan
-from albums.library.synchronizer import Synchronizer
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from albums.library.duplicates import DuplicateFinder, NameMatch
+    from albums.library.importer import Importer
+    from albums.library.paths import show_template_path_help
+    from albums.library.scanner import run_scan
+    from albums.library.synchronizer import Synchronizer
 
 __all__ = [
     "DuplicateFinder",
     "Importer",
+    "NameMatch",
     "Synchronizer",
     "run_scan",
     "show_template_path_help",
 ]
+
+# modules are imported on first use, e.g. the scanner does not need prompt_toolkit or the transcoder
+_MODULES: Final = {
+    "DuplicateFinder": "duplicates",
+    "Importer": "importer",
+    "NameMatch": "duplicates",
+    "Synchronizer": "synchronizer",
+    "run_scan": "scanner",
+    "show_template_path_help": "paths",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{_MODULES[name]}"), name)
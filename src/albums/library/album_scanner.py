@@ -5,7 +5,7 @@ from typing import List, Tuple
 from albums.app import Context
 from albums.entities import Album, OtherFile, PictureFile, Track
 from albums.picture import PictureScannerCache
-from albums.tagger import AlbumTagger
+from albums.tagger import AlbumTagger, WriteSet
 
 from .file_scanner import scan_file
 from .folder import MiniStat, stat_dir
@@ -33,16 +33,30 @@ def picture_cache(album: Album | None) -> PictureScannerCache:
 def _needs_rescan(scanner: int, file: Track | PictureFile | OtherFile) -> TargetRescan | None:
     if scanner < 6:
         return TargetRescan(file, fields=True, images=True, streams=True)
+    # v10 replaced xxh32 picture hash with xxh3-128
+    images = scanner < 10 and (isinstance(file, PictureFile) or (isinstance(file, Track) and bool(file.pictures)))
     if scanner < 7:
-        return TargetRescan(file, fields=False, images=False, streams=True)  # v7 added more stream info
+        return TargetRescan(file, fields=False, images=images, streams=True)  # v7 added more stream info
     if scanner < 8:
-        return TargetRescan(file, fields=True, images=False, streams=False)  # v7 tags are sus due to orm issues
+        return TargetRescan(file, fields=True, images=images, streams=False)  # v7 tags are sus due to orm issues
     if scanner == 8:
-        return TargetRescan(file, fields=False, images=False, streams=True)  # v8 could incorrectly treat video as track after rescan
+        return TargetRescan(file, fields=False, images=images, streams=True)  # v8 could incorrectly treat video as track after rescan
+    if images:
+        return TargetRescan(file, fields=False, images=True, streams=False)
     return None
 
 
-def scan_album(ctx: Context, tagger: AlbumTagger, album: Album, reread: bool = False) -> AlbumScanResult:
+def _target_rescan(scanner: int, file: Track | PictureFile | OtherFile, write_set: WriteSet | None) -> TargetRescan | None:
+    target = _needs_rescan(scanner, file)
+    if write_set is None or file.filename not in write_set.files:
+        return target
+    # tags were written, which does not change the audio stream
+    if target is None:
+        return TargetRescan(file, fields=True, images=write_set.pictures, streams=False)
+    return TargetRescan(file, fields=True, images=target.images or write_set.pictures, streams=target.streams)
+
+
+def scan_album(ctx: Context, tagger: AlbumTagger, album: Album, reread: bool = False, write_set: WriteSet | None = None) -> AlbumScanResult:
     album_path = ctx.config.library / album.path
     stored_files_list: List[Tuple[str, Tuple[MiniStat, PictureFile | Track | OtherFile]]] = [
         (t.filename, (MiniStat(t.file_size, t.modify_timestamp), t)) for t in album.tracks
@@ -56,7 +70,7 @@ def scan_album(ctx: Context, tagger: AlbumTagger, album: Album, reread: bool = F
         if path.name in stored_files:
             (stored_stat, file) = stored_files[path.name]
             targeted = None
-            if reread or stat != stored_stat or path.name in duplicate_files or (targeted := _needs_rescan(album.scanner, file)):
+            if reread or stat != stored_stat or path.name in duplicate_files or (targeted := _target_rescan(album.scanner, file, write_set)):
                 logger.debug(f"re-scanning file: {str(path)}")
                 scan_file(album, tagger, path, stat, targeted)
                 updated = True  # TODO if reread==True, check whether file actually changed
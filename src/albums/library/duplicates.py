@@ -1,15 +1,22 @@
-from collections import defaultdict
-from typing import Sequence
+import re
+import unicodedata
+from enum import Enum, auto
+from math import ceil
+from typing import Any, Final, Sequence
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, bindparam, case, func, insert, or_, select
 from sqlalchemy.orm import Session, aliased
 
 from albums.app import Context
-from albums.entities import Album, FieldV
+from albums.entities import Album, AlbumNameKeyEntity, AlbumNameTrigramEntity, FieldV, Track
 from albums.tagger import BasicField
 
 from ..utility import get_album_name_from_tracks, get_artist_from_tracks
 
+_PARENTHETICAL = re.compile(r"[(\[{][^)\]}]*[)\]}]")
+_WORD = re.compile(r"\w+")
+_ARTICLES = frozenset(("a", "an", "the"))
+
 
 def album_in_library(ctx: Context, album: Album) -> str | None:
     library_ctx = ctx.parent if ctx.parent is not None else ctx
@@ -18,14 +25,15 @@ def album_in_library(ctx: Context, album: Album) -> str | None:
     if album_name and artist:
         with Session(library_ctx.db) as session:
             FieldV2 = aliased(FieldV)
+            # both sides are lowercased by SQLite, which matches idx_track_field_name_lower_value
             stmt = (
                 select(FieldV)
-                .filter(and_(FieldV.field == BasicField.ALBUM, func.lower(FieldV.value) == str.lower(album_name)))
+                .filter(and_(FieldV.field == BasicField.ALBUM, func.lower(FieldV.value) == func.lower(album_name)))
                 .join(
                     FieldV2,
                     and_(
                         FieldV.track_id == FieldV2.track_id,
-                        func.lower(FieldV2.value) == str.lower(artist),
+                        func.lower(FieldV2.value) == func.lower(artist),
                         or_(FieldV2.field == BasicField.ARTIST, FieldV2.field == BasicField.ALBUMARTIST),
                     ),
                 )
@@ -36,43 +44,228 @@ def album_in_library(ctx: Context, album: Album) -> str | None:
     return None
 
 
+class NameMatch(Enum):
+    EXACT = auto()
+    NORMALIZED = auto()
+    SIMILAR = auto()
+
+    @classmethod
+    def from_str(cls, selection: str):
+        for match in cls:
+            if str.lower(match.name) == str.lower(selection):
+                return match
+        raise ValueError(f'invalid name match "{selection}"')
+
+
 class DuplicateFinder:
-    _duplicates: dict[tuple[str, str], list[int]] = {}
-
-    def start(self, session: Session):  # TODO make initializing DuplicateFinder faster
-        # this takes several seconds on a large library, but when checking the whole library, this way is 6x faster than querying per album
-        albums: defaultdict[tuple[str, str], list[int]] = defaultdict(list[int])
-        for (album,) in session.execute(select(Album).order_by(Album.path)).tuples():
-            add_album_name = get_album_name_from_tracks(album)
-            add_artist = get_artist_from_tracks(album)
-            if add_album_name and add_artist and album.album_id is not None:
-                albums[(str.lower(add_artist), str.lower(add_album_name))].append(album.album_id)
-        self._duplicates = dict((k, ids) for k, ids in albums.items() if len(ids) > 1)
+    """Find albums in the library with the same artist and album name.
+
+    ``EXACT`` compares lowercase names. ``NORMALIZED`` also ignores accents, punctuation, articles and parenthetical text
+    such as "(Remastered)". ``SIMILAR`` also matches normalized names that share at least ``min_similarity`` of their
+    trigrams (Jaccard index), using the stored trigram index, so each album is looked up with indexed queries instead of
+    being compared to every other album.
+    """
+
+    match: NameMatch
+    min_similarity: float
+    _session: Session | None = None
+    _trigram_frequency: dict[str, int]
+    _removed: set[int]
+
+    def __init__(self, match: NameMatch = NameMatch.NORMALIZED, min_similarity: float = 0.8):
+        if not 0 < min_similarity <= 1:
+            raise ValueError(f"min_similarity must be greater than 0 and at most 1 (got {min_similarity})")
+        self.match = match
+        self.min_similarity = min_similarity
+        self._trigram_frequency = {}
+        self._removed = set()
+
+    def start(self, session: Session):
+        """Store names of new and changed albums, then look up albums in this session."""
+        update_name_keys(session)
+        if self.match == NameMatch.SIMILAR:
+            stmt = select(AlbumNameTrigramEntity.trigram, func.count()).group_by(AlbumNameTrigramEntity.trigram)
+            self._trigram_frequency = {trigram: count for trigram, count in session.execute(stmt).tuples()}
+        self._session = session
+        self._removed = set()
         return self
 
     def find(self, album: Album) -> Sequence[int] | None:
-        album_name = get_album_name_from_tracks(album)
-        artist = get_artist_from_tracks(album)
-        if not artist or not album_name:
+        """Find duplicates of an album in the library. Only the first of a set of duplicates by path has duplicates, so
+        the set is reported once."""
+        candidates = [(album_id, path) for album_id, path in self.candidates(album) if album_id != album.album_id]
+        if not candidates or candidates[0][1] < album.path:
             return None
+        return [album_id for album_id, _ in candidates]
 
-        # TODO: try variants (without parenthetical, without articles) and/or match "similar" strings
-        ids = self._duplicates.get((str.lower(artist), str.lower(album_name)))
+    def candidates(self, album: Album, session: Session | None = None) -> list[tuple[int, str]]:
+        """Find albums in the library that may be duplicates of an album, which does not need to be in the library.
 
-        # only the first album in the list fails the check
-        if ids is None or ids[0] != album.album_id:
-            return None
-        return ids[1:]
+        Args:
+            album: The album, whose tracks are read to find its names.
+            session: Library session, if not the one given to ``start``.
 
-    def remove(self, album: Album):
+        Returns:
+            ``(album_id, path)`` of matching albums in the library, in order of path.
+        """
+        session = session if session is not None else self._session
+        if session is None:
+            raise RuntimeError("DuplicateFinder.start must be called first")
         album_name = get_album_name_from_tracks(album)
         artist = get_artist_from_tracks(album)
-        if artist is None or album_name is None or album.album_id is None:
-            raise RuntimeError(f'remove: target not fully identified (album="{album_name}", artist="{artist}", album_id={album.album_id})')
+        if not artist or not album_name:
+            return []
 
-        # artist: str, album_name: str, album_id: int
-        ids = self._duplicates.get((str.lower(artist), str.lower(album_name)), [])
-        if album.album_id in ids:
-            ids.remove(album.album_id)
+        if self.match == NameMatch.EXACT:
+            params: dict[str, Any] = {"artist": str.lower(artist), "album_name": str.lower(album_name)}
         else:
-            raise ValueError(f"error, cannot remove duplicate album {album.album_id} ({artist}/{album_name}) because it was not found")
+            params = {"artist": normalize_name(artist), "album_name": normalize_name(album_name)}
+            if self.match == NameMatch.SIMILAR:
+                params |= self._similar_params(name_trigrams(params["artist"], params["album_name"]))
+        rows = session.execute(_FIND_STATEMENTS[self.match], params).tuples()
+        return [(album_id, path) for album_id, path in rows if album_id is not None and album_id not in self._removed]
+
+    def remove(self, album: Album):
+        """Do not find an album that was deleted, though it is still in the library until the next scan."""
+        if album.album_id is None:
+            raise RuntimeError(f'remove: album "{album.path}" is not in the library')
+        self._removed.add(album.album_id)
+
+    def _similar_params(self, trigrams: set[str]) -> dict[str, Any]:
+        min_shared = max(1, ceil(self.min_similarity * len(trigrams) - 1e-9))
+        # an album sharing min_shared of the trigrams shares at least one of any (count - min_shared + 1) of them, so only
+        # albums with one of the least frequent trigrams need to be counted
+        rarest = sorted(trigrams, key=lambda trigram: (self._trigram_frequency.get(trigram, 0), trigram))[: len(trigrams) - min_shared + 1]
+        return {
+            "trigrams": list(trigrams),
+            "rarest": rarest,
+            "trigram_count": len(trigrams),
+            "min_shared": min_shared,
+            "min_similarity": self.min_similarity,
+        }
+
+
+def _find_statements():
+    same_names = select(Album.album_id, Album.path).join(AlbumNameKeyEntity, AlbumNameKeyEntity.album_id == Album.album_id).order_by(Album.path)
+    exact = same_names.where(AlbumNameKeyEntity.artist == bindparam("artist"), AlbumNameKeyEntity.album_name == bindparam("album_name"))
+    normal = and_(AlbumNameKeyEntity.normal_artist == bindparam("artist"), AlbumNameKeyEntity.normal_album_name == bindparam("album_name"))
+
+    # albums with a Jaccard index of trigrams of at least min_similarity
+    trigram = aliased(AlbumNameTrigramEntity)
+    rare_trigram = aliased(AlbumNameTrigramEntity)
+    other_key = aliased(AlbumNameKeyEntity)
+    shared = func.count()
+    similar = (
+        select(trigram.album_id)
+        .join(other_key, other_key.album_id == trigram.album_id)
+        .where(
+            trigram.trigram.in_(bindparam("trigrams", expanding=True)),
+            trigram.album_id.in_(select(rare_trigram.album_id).where(rare_trigram.trigram.in_(bindparam("rarest", expanding=True)))),
+        )
+        .group_by(trigram.album_id)
+        .having(
+            shared >= bindparam("min_shared"),
+            shared * 1.0 / (bindparam("trigram_count") + func.max(other_key.trigram_count) - shared) >= bindparam("min_similarity"),
+        )
+    )
+    return {
+        NameMatch.EXACT: exact,
+        NameMatch.NORMALIZED: same_names.where(normal),
+        NameMatch.SIMILAR: same_names.where(or_(normal, AlbumNameKeyEntity.album_id.in_(similar))),
+    }
+
+
+# statements are built once so that each album is looked up with a cached query
+_FIND_STATEMENTS: Final = _find_statements()
+
+
+def update_name_keys(session: Session):
+    """Store the artist and album name of albums that don't have them yet. These are the most frequent values in the
+    album's tracks, the same as ``get_artist_from_tracks`` and ``get_album_name_from_tracks`` would find."""
+    missing = (
+        select(Album.album_id)
+        .outerjoin(AlbumNameKeyEntity, AlbumNameKeyEntity.album_id == Album.album_id)
+        .where(AlbumNameKeyEntity.album_id.is_(None))
+    )
+    album_ids = list(session.execute(missing).scalars())
+    if not album_ids:
+        return
+
+    # number each value in order of track and field, and ties are won by the value that appears first
+    kind = case((FieldV.field == BasicField.ALBUM, "album"), else_="artist")
+    values = (
+        select(
+            Track.album_id,
+            kind.label("kind"),
+            FieldV.value,
+            func.row_number()
+            .over(partition_by=(Track.album_id, kind), order_by=(Track.track_id, FieldV.field == BasicField.ALBUMARTIST, FieldV.track_field_id))
+            .label("position"),
+        )
+        .join(Track, Track.track_id == FieldV.track_id)
+        .where(FieldV.field.in_((BasicField.ALBUM, BasicField.ARTIST, BasicField.ALBUMARTIST)), Track.album_id.in_(missing))
+        .subquery()
+    )
+    counts = (
+        select(values.c.album_id, values.c.kind, values.c.value, func.count().label("count"), func.min(values.c.position).label("first"))
+        .group_by(values.c.album_id, values.c.kind, values.c.value)
+        .subquery()
+    )
+    ranked = select(
+        counts.c.album_id,
+        counts.c.kind,
+        counts.c.value,
+        func.row_number().over(partition_by=(counts.c.album_id, counts.c.kind), order_by=(counts.c.count.desc(), counts.c.first)).label("rank"),
+    ).subquery()
+
+    names: dict[int, dict[str, str]] = {album_id: {} for album_id in album_ids if album_id is not None}
+    for album_id, name_kind, value in session.execute(select(ranked.c.album_id, ranked.c.kind, ranked.c.value).where(ranked.c.rank == 1)).tuples():
+        names[album_id][name_kind] = value
+    keys: list[dict[str, Any]] = []
+    trigrams: list[dict[str, Any]] = []
+    for album_id, name in names.items():
+        artist = name.get("artist")
+        album_name = name.get("album")
+        key: dict[str, Any] = {"album_id": album_id, "artist": _lower(artist), "album_name": _lower(album_name)}
+        key |= {"normal_artist": None, "normal_album_name": None, "trigram_count": 0}
+        if artist and album_name:
+            key["normal_artist"] = normalize_name(artist)
+            key["normal_album_name"] = normalize_name(album_name)
+            album_trigrams = name_trigrams(key["normal_artist"], key["normal_album_name"])
+            key["trigram_count"] = len(album_trigrams)
+            trigrams.extend({"trigram": trigram, "album_id": album_id} for trigram in album_trigrams)
+        keys.append(key)
+    session.execute(insert(AlbumNameKeyEntity), keys)
+    if trigrams:
+        session.execute(insert(AlbumNameTrigramEntity.metadata.tables[AlbumNameTrigramEntity.__tablename__]), trigrams)  # core insert, for speed
+    session.flush()
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an artist or album name so that common variants are the same: ignore case, accents, punctuation,
+    parenthetical text like "(Deluxe Edition)" and the articles "a", "an" and "the". Parts are only ignored if something
+    is left."""
+    without_parenthetical = _PARENTHETICAL.sub(" ", name)
+    words = _words(without_parenthetical) or _words(name)
+    if not words:
+        return str.strip(str.casefold(name))
+    return " ".join([word for word in words if word not in _ARTICLES] or words)
+
+
+def name_trigrams(normal_artist: str, normal_album_name: str) -> set[str]:
+    """Three-character substrings of each word in normalized names, with two spaces before and one after each word so
+    that the start of a word counts most."""
+    trigrams: set[str] = set()
+    for word in f"{normal_artist} {normal_album_name}".split():
+        padded = f"  {word} "
+        trigrams.update(padded[ix : ix + 3] for ix in range(len(padded) - 2))
+    return trigrams
+
+
+def _words(name: str) -> list[str]:
+    decomposed = unicodedata.normalize("NFKD", str.casefold(name.replace("&", " and ")))
+    return _WORD.findall("".join(c for c in decomposed if not unicodedata.combining(c)))
+
+
+def _lower(value: str | None):
+    return str.lower(value) if value is not None else None
@@ -16,46 +16,48 @@ logger = logging.getLogger(__name__)
 
 
 def _scan_track(tagger: AlbumTagger, filename: str, stat: MiniStat, target_scan: TargetRescan | None) -> Track | None:
+    if target_scan is not None and not target_scan.streams and isinstance(target_scan.source, OtherFile):
+        return None
+
+    # parts of a stored track that are not targeted for rescan are kept, and not read from the file
+    stored = target_scan.source if target_scan is not None and isinstance(target_scan.source, Track) else None
     with tagger.open(filename) as file:
-        if target_scan is None or target_scan.streams:
-            if file.has_video():  # check file streams
-                return None
-        else:
-            if isinstance(target_scan.source, OtherFile):
-                return None
+        info = file.read_all(
+            fields=stored is None or target_scan is None or target_scan.fields,
+            pictures=stored is None or target_scan is None or target_scan.images,
+            stream=stored is None or target_scan is None or target_scan.streams,
+        )
 
-        if target_scan is not None and not target_scan.fields and isinstance(target_scan.source, Track):
-            fields = [FieldV(field=t.field, value=t.value) for t in target_scan.source.fields]
-            legacy_fields = list(target_scan.source.legacy_fields)
-        else:
-            fields = [FieldV(field=field, value=value) for field, values in file.get_fields() for value in values]
-            legacy_fields = [field_name for (field_name, _) in file.get_legacy_fields()]
-
-        if target_scan is not None and not target_scan.images and isinstance(target_scan.source, Track):
-            pictures = [
-                TrackPicture(picture_type=p.picture_type, picture_info=p.picture_info, description=p.description, embed_ix=p.embed_ix)
-                for p in target_scan.source.pictures
-            ]
-        else:
-            pictures = [
-                TrackPicture(picture_type=picture.type, picture_info=picture.picture_info, description=picture.description, embed_ix=embed_ix)
-                for embed_ix, picture in enumerate(picture for (picture, _data) in file.get_pictures())
-            ]
+    if info.has_video:  # check file streams
+        return None
 
-        if target_scan is not None and not target_scan.streams and isinstance(target_scan.source, Track):
-            stream = target_scan.source.stream
-        else:
-            stream = file.get_stream_info()
-
-        return Track(
-            filename=filename,
-            file_size=stat.file_size,
-            modify_timestamp=stat.modify_timestamp,
-            stream=stream,
-            pictures=pictures,
-            fields=fields,
-            legacy_fields=legacy_fields,
-        )
+    if stored is not None and (info.fields is None or info.legacy_fields is None):
+        fields = [FieldV(field=t.field, value=t.value) for t in stored.fields]
+        legacy_fields = list(stored.legacy_fields)
+    else:
+        fields = [FieldV(field=field, value=value) for field, values in info.fields or () for value in values]
+        legacy_fields = [field_name for (field_name, _) in info.legacy_fields or ()]
+
+    if stored is not None and info.pictures is None:
+        pictures = [
+            TrackPicture(picture_type=p.picture_type, picture_info=p.picture_info, description=p.description, embed_ix=p.embed_ix)
+            for p in stored.pictures
+        ]
+    else:
+        pictures = [
+            TrackPicture(picture_type=picture.type, picture_info=picture.picture_info, description=picture.description, embed_ix=embed_ix)
+            for embed_ix, picture in enumerate(info.pictures or ())
+        ]
+
+    return Track(
+        filename=filename,
+        file_size=stat.file_size,
+        modify_timestamp=stat.modify_timestamp,
+        stream=stored.stream if stored is not None and info.stream is None else info.stream,
+        pictures=pictures,
+        fields=fields,
+        legacy_fields=legacy_fields,
+    )
 
 
 def _scan_picture_file(tagger: AlbumTagger, filename: str, stat: MiniStat, scan_target: TargetRescan | None) -> PictureFile | None:
@@ -57,6 +57,7 @@ class Importer:
         with self.ctx.console.status("Initializing duplicate album finder", spinner="bouncingBar"):
             with Session(self._parent_context.db) as session:
                 self._duplicate_finder.start(session)
+                session.commit()  # keep album names found in the library
         return albums_total
 
     def run(self):
@@ -106,6 +107,9 @@ class Importer:
         existing = next((path for path in library_paths if (self._parent_context.config.library / path).exists()), None)
         if existing is None:
             existing = album_in_library(self.ctx, album)
+        if existing is None:
+            with Session(self._parent_context.db) as session:
+                existing = next((path for _, path in self._duplicate_finder.candidates(album, session)), None)
 
         if existing is not None:
             self.ctx.console.print(f"This album appears to be in the library: [bold]{escape(existing)}[/bold]")
@@ -4,7 +4,7 @@ import logging
 import time
 from collections import defaultdict
 from datetime import UTC, datetime
-from typing import Callable, Iterator, Mapping
+from typing import Callable, Final, Iterator, Mapping
 
 from rbloom import Bloom
 from rich.markup import escape
@@ -13,9 +13,9 @@ from sqlalchemy import delete, desc, select
 from sqlalchemy.orm import Session
 
 from albums.app import SCANNER_VERSION, Context
-from albums.entities import Album, ScanHistoryEntity
+from albums.entities import Album, AlbumNameKeyEntity, ScanHistoryEntity
 from albums.library.album_scanner import scan_album
-from albums.tagger import AlbumTagger
+from albums.tagger import AlbumTagger, AlbumTaggerProvider, WriteSet
 from albums.words import plural
 
 from .album_scanner import picture_cache
@@ -23,6 +23,9 @@ from .scanner_types import AlbumScanResult
 
 logger = logging.getLogger(__name__)
 
+# a full scan commits changes at least this often (seconds), so another albums process never waits long to write
+SCAN_COMMIT_INTERVAL: Final = 1.0
+
 
 def run_scan(
     ctx: Context,
@@ -30,11 +33,13 @@ def run_scan(
     scan_albums: Iterator[Album] | None = None,
     reread: bool = False,
     check_first_full_scan_path_count: Callable[[int], None] = lambda _: None,
+    tagger: AlbumTaggerProvider | None = None,
+    write_set: WriteSet | None = None,
 ) -> tuple[int, bool]:
     if session is None:
         with Session(ctx.db) as session:
             try:
-                (albums_total, any_changes) = run_scan(ctx, session, scan_albums, reread)
+                (albums_total, any_changes) = run_scan(ctx, session, scan_albums, reread, tagger=tagger, write_set=write_set)
                 if any_changes:
                     session.commit()
                 return (albums_total, any_changes)
@@ -67,7 +72,7 @@ def run_scan(
 
     def do_scan(update_progress: Callable[[], None] = lambda: None):
         if scan_albums:
-            return rescan_albums(ctx, session, scan_albums, update_progress, reread)
+            return rescan_albums(ctx, session, scan_albums, update_progress, reread, tagger, write_set)
         elif paths:
             return scan_library(ctx, session, paths, update_progress, reread)
         else:
@@ -106,6 +111,9 @@ def run_scan(
 def scan_library(
     ctx: Context, session: Session, paths: Iterator[str], update_progress: Callable[[], None], reread: bool = False
 ) -> Mapping[AlbumScanResult, int]:
+    """Scan every path in the library. Scanned albums are committed every ``SCAN_COMMIT_INTERVAL`` seconds instead of
+    in one long transaction, which would keep other processes from writing until the scan finished. Removing albums
+    that were not found is left for the caller to commit."""
     current_album_paths = Bloom(100000, 0.01)
     unvisited_album_ids: set[int] = set()
     for (
@@ -116,6 +124,7 @@ def scan_library(
             current_album_paths.add(path)
             unvisited_album_ids.add(album_id)
     scan_results: defaultdict[AlbumScanResult, int] = defaultdict(int)
+    committed_at = time.monotonic()
     for path in paths:
         if path in current_album_paths:  # 99% chance
             album_match = session.execute(select(Album).where(Album.path == path)).tuples().one_or_none() or (None,)
@@ -131,7 +140,7 @@ def scan_library(
                     if result == AlbumScanResult.REMOVED:
                         session.delete(album)
                     elif result != AlbumScanResult.UNCHANGED:
-                        album.modified_at = int(datetime.now(UTC).timestamp())
+                        _album_changed(session, album)
                     album.scanner = SCANNER_VERSION
                     path_scan_transaction.commit()
             else:
@@ -147,6 +156,9 @@ def scan_library(
             logger.info(f"{result.name} album {path}")
         scan_results[result] += 1
         update_progress()
+        if time.monotonic() - committed_at >= SCAN_COMMIT_INTERVAL:
+            session.commit()
+            committed_at = time.monotonic()
 
     for album_id in unvisited_album_ids:
         scan_results[AlbumScanResult.REMOVED] += 1
@@ -156,20 +168,36 @@ def scan_library(
 
 
 def rescan_albums(
-    ctx: Context, session: Session, scan_albums: Iterator[Album], update_progress: Callable[[], None], reread: bool = False
+    ctx: Context,
+    session: Session,
+    scan_albums: Iterator[Album],
+    update_progress: Callable[[], None],
+    reread: bool = False,
+    tagger: AlbumTaggerProvider | None = None,
+    write_set: WriteSet | None = None,
 ) -> Mapping[AlbumScanResult, int]:
     scan_results: defaultdict[AlbumScanResult, int] = defaultdict(int)
     for album in scan_albums:
-        tagger = AlbumTagger(ctx.config.library / album.path, preload={} if reread else picture_cache(album))
+        if tagger:
+            # shared tagger may have deferred writes that the scan should see
+            album_tagger = tagger.get(album.path)
+        else:
+            album_tagger = AlbumTagger(ctx.config.library / album.path, preload={} if reread else picture_cache(album))
         with session.begin_nested() as album_scan_transaction:
-            result = scan_album(ctx, tagger, album, reread)
+            result = scan_album(ctx, album_tagger, album, reread, write_set)
             scan_results[result] += 1
             if result != AlbumScanResult.UNCHANGED or album.scanner != SCANNER_VERSION:
                 if result == AlbumScanResult.REMOVED:
                     session.delete(album)
                 elif result != AlbumScanResult.UNCHANGED:
-                    album.modified_at = int(datetime.now(UTC).timestamp())
+                    _album_changed(session, album)
                 album.scanner = SCANNER_VERSION
                 album_scan_transaction.commit()
         update_progress()
     return scan_results
+
+
+def _album_changed(session: Session, album: Album):
+    album.modified_at = int(datetime.now(UTC).timestamp())
+    # names are found again when they are needed (name trigrams are deleted with the row)
+    session.execute(delete(AlbumNameKeyEntity).where(AlbumNameKeyEntity.album_id == album.album_id))
@@ -18,7 +18,7 @@ from rich.markup import escape
 
 from albums.app import Context
 from albums.entities import Album, Track
-from albums.tagger import AUDIO_FILE_SUFFIXES, AlbumTaggerProvider
+from albums.tagger import AUDIO_FILE_SUFFIXES, AlbumTaggerProvider, PaddingPolicy
 
 logger: Final = logging.getLogger(__name__)
 
@@ -50,7 +50,7 @@ class Transcoder:
         self.file_type = parts[-1]
         self._descriptor = profile
         self._ffmpeg_options = parts[:-1]
-        self._tagger = AlbumTaggerProvider(ctx.config.library, id3v1=ctx.config.id3v1)
+        self._tagger = AlbumTaggerProvider(ctx.config.library, id3v1=ctx.config.id3v1, padding=PaddingPolicy(ctx.config.tag_padding))
         self._this_cache = self.ctx.config.transcoder_cache / xxhash.xxh3_64_hexdigest(self._descriptor)
 
     def in_cache(self, album: Album, track: Track) -> Path | None:
@@ -2,9 +2,10 @@
 
 from .format import SUPPORTED_IMAGE_MIME_TYPES, SUPPORTED_IMAGE_SUFFIXES, format_to_mime_type, get_depth_bpp, mime_type_to_format
 from .info import LoadIssuesType, PictureInfo
-from .scan import PictureScanner, PictureScannerCache
+from .scan import PICTURE_HASH_SIZE, PictureScanner, PictureScannerCache, picture_hash
 
 __all__ = [
+    "PICTURE_HASH_SIZE",
     "PictureInfo",
     "PictureScanner",
     "PictureScannerCache",
@@ -14,4 +15,5 @@ __all__ = [
     "format_to_mime_type",
     "get_depth_bpp",
     "mime_type_to_format",
+    "picture_hash",
 ]
@@ -29,7 +29,7 @@ class PictureInfo:
         height: Image height in pixels, or 0 if unavailable.
         depth_bpp: Color depth in bits-per-pixel, or 0 if unavailable.
         file_size: Size of the image data in bytes.
-        file_hash: xxHash-32 fingerprint of the image content for deduplication.
+        file_hash: XXH3-128 fingerprint of the image content for deduplication (see ``picture_hash``).
         load_issue: Tuple of (category, message) describing any errors loading the image. Empty when valid.
     """
 
@@ -38,7 +38,7 @@ class PictureInfo:
     height: int
     depth_bpp: int
     file_size: int
-    file_hash: bytes  # xxhash.xxh32_digest(image_data)
+    file_hash: bytes  # picture_hash(image_data)
     load_issue: LoadIssuesType = ()
 
     def to_dict(self) -> dict[str, Any | str]:
@@ -59,7 +59,7 @@ def get_picture_info(image_data: bytes, file_hash: bytes) -> PictureInfo:
 
     Args:
         image_data: Raw binary content of the image to analyze.
-        file_hash: Precomputed xxHash fingerprint of *image_data*.
+        file_hash: Precomputed XXH3 fingerprint of *image_data*.
 
     Returns:
         A ``PictureInfo`` describing the loaded image, with any load warnings/errors recorded in ``load_issue``.
@@ -1,16 +1,34 @@
 """Image scanning utilities with caching for fast deduplication of album artwork."""
 
-from typing import Dict, Tuple
+from typing import Dict, Final, Tuple
 
 import xxhash
 from PIL import Image, UnidentifiedImageError
 
 from .info import PictureInfo, get_picture_info
 
+# Size in bytes of the fingerprint produced by ``picture_hash``. Older scanner versions stored 4-byte xxHash-32 values.
+PICTURE_HASH_SIZE: Final = 16
+
 # PictureScannerCache maps a tuple of ``(file_size, file_hash)`` to ``PictureInfo``.
 type PictureScannerCache = Dict[Tuple[int, bytes], PictureInfo]
 
 
+def picture_hash(image_data: bytes) -> bytes:
+    """Return the content fingerprint stored as ``PictureInfo.file_hash``.
+
+    Uses 128-bit XXH3 so that identical ``(file_size, file_hash)`` keys can be trusted to mean identical image data,
+    even in libraries with millions of embedded images.
+
+    Args:
+        image_data: Raw binary bytes of the image.
+
+    Returns:
+        A ``PICTURE_HASH_SIZE``-byte digest.
+    """
+    return xxhash.xxh3_128_digest(image_data)
+
+
 class PictureScanner:
     """Scan raw image data to extract metadata, with an in-memory cache keyed by size and hash.
 
@@ -29,7 +47,8 @@ class PictureScanner:
         Args:
             preload_cache: Existing ``PictureInfo`` records keyed by ``(file_size, file_hash)``.
                           Entries are normalized to retain only error-level issues so stale warnings
-                          from prior scans do not surface in newly-verified metadata.
+                          from prior scans do not surface in newly-verified metadata. Entries keyed by a
+                          legacy (pre-XXH3) hash are dropped.
         """
         self._cache = dict(
             (
@@ -47,6 +66,7 @@ class PictureScanner:
                 ),
             )
             for pic_key, info in preload_cache.items()
+            if len(pic_key[1]) == PICTURE_HASH_SIZE  # skip legacy xxHash-32 keys, they can never match and are not collision-safe
         )
 
     def scan(
@@ -71,7 +91,7 @@ class PictureScanner:
         Returns:
             A ``PictureInfo`` describing the scanned image, potentially augmented with mismatch notes.
         """
-        hash = xxhash.xxh32_digest(image_data)
+        hash = picture_hash(image_data)
         key = (len(image_data), hash)
         if key not in self._cache:
             try:
@@ -1,6 +1,7 @@
 """Tagger package for reading and writing audio file metadata."""
 
 from .folder import AUDIO_FILE_SUFFIXES, AlbumTagger, Cap
+from .padding import DEFAULT_PADDING_RESERVE, PaddingPolicy
 from .provider import AlbumTaggerProvider
 from .types import (
     BASIC_FIELDS,
@@ -10,6 +11,8 @@ from .types import (
     PictureType,
     StreamInfo,
     TaggerFile,
+    TaggerFileInfo,
+    WriteSet,
 )
 from .vorbis import LEGACY_VORBIS_FIELDS
 
@@ -20,10 +23,14 @@ __all__ = [
     "BASIC_FIELDS",
     "BasicField",
     "Cap",
+    "DEFAULT_PADDING_RESERVE",
     "ID3v1Policy",
     "LEGACY_VORBIS_FIELDS",
+    "PaddingPolicy",
     "Picture",
     "PictureType",
     "StreamInfo",
     "TaggerFile",
+    "TaggerFileInfo",
+    "WriteSet",
 ]
@@ -1,9 +1,10 @@
 import logging
+from pathlib import Path
 from typing import Any, Callable, Final, Generator, List, Tuple, override
 
 from mutagen._tags import PaddingInfo
 
-from .types import BasicField, MutagenFileType, Picture, StreamInfo, TaggerFile
+from .types import BasicField, MutagenFileType, Picture, StreamInfo, TaggerFile, WriteSet
 
 logger: Final = logging.getLogger(__name__)
 
@@ -14,9 +15,13 @@ MAX_BASIC_FIELD_VALUE_LENGTH: Final = 4096
 class AbstractMutagenTagger[_FT: MutagenFileType](TaggerFile):
     _changed = False
     _padding: Callable[[PaddingInfo], int]
+    _changed_fields: set[BasicField | str]  # changes not yet taken by take_changes()
+    _changed_pictures: bool
 
     def __init__(self, padding: Callable[[PaddingInfo], int]):
         self._padding = padding
+        self._changed_fields = set()
+        self._changed_pictures = False
 
     # subclass must implement
     def get_fields(self) -> Tuple[Tuple[BasicField, Tuple[str, ...]], ...]: ...
@@ -59,16 +64,28 @@ class AbstractMutagenTagger[_FT: MutagenFileType](TaggerFile):
     def set_field(self, field: BasicField | str, value: str | List[str] | None) -> None:
         self._set_field(field, value)
         self._changed = True
+        self._changed_fields.add(field)
 
     @override
     def add_picture(self, new_picture: Picture, image_data: bytes) -> None:
         self._add_picture(new_picture, image_data)
         self._changed = True
+        self._changed_pictures = True
 
     @override
     def remove_picture(self, remove_picture: Picture) -> None:
         self._remove_picture(remove_picture)
         self._changed = True
+        self._changed_pictures = True
+
+    @override
+    def take_changes(self) -> WriteSet:
+        if not self._changed_fields and not self._changed_pictures:
+            return WriteSet()
+        changes = WriteSet(frozenset({Path(self._get_file().filename).name}), frozenset(self._changed_fields), self._changed_pictures)  # pyright: ignore[reportArgumentType]
+        self._changed_fields = set()
+        self._changed_pictures = False
+        return changes
 
     @override
     def close(self):
@@ -1,11 +1,11 @@
 import logging
 from copy import copy
 from pathlib import Path
-from typing import Callable, Final, Generator, List, Tuple, override
+from typing import IO, Callable, Final, Generator, List, Tuple, override
 
-import av
 from mutagen._tags import PaddingInfo
 from mutagen.mp4 import MP4, AtomDataType, MP4Cover, MP4FreeForm, MP4Tags
+from mutagen.mp4._atom import Atoms
 
 from ...picture.scan import PictureScanner
 from ..base_mutagen import AbstractMutagenTagger
@@ -66,8 +66,10 @@ class Mp4Tagger(AbstractMutagenTagger[MP4]):
 
     def __init__(self, path: Path, picture_scanner: PictureScanner, padding: Callable[[PaddingInfo], int]):
         super().__init__(padding)
-        self._has_video = str.lower(path.suffix) == ".mp4" and _mp4_has_video(path)
-        self._file = MP4(path)
+        with open(path, "rb") as fileobj:
+            self._has_video = str.lower(path.suffix) == ".mp4" and _mp4_has_video(fileobj)
+            fileobj.seek(0)
+            self._file = MP4(filename=path, fileobj=fileobj)
         self._picture_scanner = picture_scanner
 
     @override
@@ -240,6 +242,18 @@ class Mp4Tagger(AbstractMutagenTagger[MP4]):
         fields["trkn"] = [(track_number if track_number else 0, track_total if track_total else 0)]
 
 
-def _mp4_has_video(path: Path) -> bool:
-    with av.open(path) as container:
-        return len(container.streams.video) > 0
+def _mp4_has_video(fileobj: IO[bytes]) -> bool:
+    # only reads atom headers and the small hdlr atom of each track, which is much cheaper than probing streams with a decoder
+    atoms = Atoms(fileobj)
+    if [b"moov"] not in atoms:
+        return False
+    for trak in atoms[b"moov"].findall(b"trak"):  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+        try:
+            hdlr = trak[b"mdia", b"hdlr"]  # pyright: ignore[reportUnknownVariableType]
+        except KeyError:
+            continue
+        (complete, data) = hdlr.read(fileobj)  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+        # hdlr payload: 1 byte version, 3 bytes flags, 4 bytes pre_defined, then 4 byte handler type
+        if complete and data[8:12] == b"vide":
+            return True
+    return False
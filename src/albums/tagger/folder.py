@@ -1,7 +1,8 @@
 from contextlib import contextmanager
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Collection, Final, Generator, List, Mapping, Set, Tuple
+from typing import Any, Callable, Collection, Dict, Final, Generator, List, Mapping, Set, Tuple
 
 from mutagen._tags import PaddingInfo
 
@@ -15,7 +16,7 @@ from .file_types.mp3 import Mp3Tagger
 from .file_types.mp4 import Mp4Tagger
 from .file_types.oggvorbis import OggVorbisTagger
 from .file_types.universal import UniversalTagger
-from .types import BasicField, ID3v1Policy, TaggerFile
+from .types import BasicField, ID3v1Policy, TaggerFile, WriteSet
 from .unreadable import UnreadableTagger
 
 
@@ -48,6 +49,12 @@ _SUFFIX_SUPPORT.update((suffix, {Cap.PICTURES}) for suffix in SUPPORTED_IMAGE_SU
 SUFFIX_SUPPORT: Final[Mapping[str, Set[Cap]]] = _SUFFIX_SUPPORT
 
 
+@lru_cache(maxsize=4096)
+def _filename_caps(filename: str) -> Set[Cap]:
+    # checks ask about the same filenames many times
+    return SUFFIX_SUPPORT.get(Path(filename).suffix, set())
+
+
 class AlbumTagger:
     """Handles reading and writing tags for media files within a single album folder."""
 
@@ -55,13 +62,16 @@ class AlbumTagger:
     def supports(filename: str, *needs: Cap) -> bool:
         if not needs:
             return False
-        caps = SUFFIX_SUPPORT.get(Path(filename).suffix, set())
+        caps = _filename_caps(filename)
         return all(need in caps for need in needs)
 
     _folder: Path
     _padding: Callable[[PaddingInfo], int]
     _picture_scanner: PictureScanner
     _id3v1: ID3v1Policy
+    _deferred: Dict[str, TaggerFile] | None  # if writes are deferred, files opened since last flush
+    _write_set: WriteSet  # changes since last take_write_set()
+    files_opened: int  # number of times a file was opened and read
 
     def __init__(
         self,
@@ -69,11 +79,15 @@ class AlbumTagger:
         padding: Callable[[PaddingInfo], int] = lambda info: info.get_default_padding(),
         id3v1: ID3v1Policy = ID3v1Policy.UPDATE,
         preload: PictureScannerCache = {},
+        defer_writes: bool = False,
     ):
         self._folder = folder
         self._padding = padding
         self._picture_scanner = PictureScanner(preload)
         self._id3v1 = id3v1
+        self._deferred = {} if defer_writes else None
+        self._write_set = WriteSet()
+        self.files_opened = 0
 
     @contextmanager
     def open(self, filename: str) -> Generator[TaggerFile, Any, None]:
@@ -81,14 +95,42 @@ class AlbumTagger:
         if str(file.parent) != ".":
             raise ValueError(f"parameter must be a filename only, this AlbumTagger only works in {str(self._folder)}")
 
+        if self._deferred is not None:
+            # reuse the open file, so later reads see pending changes and all changes are saved together
+            tagger_file = self._deferred.get(file.name)
+            if tagger_file is None:
+                tagger_file = self._get_tagger_file(Path(self._folder / file))
+                self._deferred[file.name] = tagger_file
+            try:
+                yield tagger_file
+            finally:
+                self._write_set = self._write_set.union(tagger_file.take_changes())
+            return
+
         tagger_file: TaggerFile | None = None
         try:
             tagger_file = self._get_tagger_file(Path(self._folder / file))
             yield tagger_file
         finally:
             if tagger_file is not None:
+                self._write_set = self._write_set.union(tagger_file.take_changes())
                 tagger_file.close()
 
+    def flush(self) -> None:
+        """Save pending changes to files opened since the last flush, if writes are deferred."""
+        if not self._deferred:
+            return
+        files = list(self._deferred.values())
+        self._deferred.clear()
+        for tagger_file in files:
+            tagger_file.close()
+
+    def take_write_set(self) -> WriteSet:
+        """Files changed through this tagger since the last call, and what changed in them. Changes may not be saved yet."""
+        write_set = self._write_set
+        self._write_set = WriteSet()
+        return write_set
+
     def get_picture_scanner(self) -> PictureScanner:
         return self._picture_scanner
 
@@ -104,6 +146,7 @@ class AlbumTagger:
 
     def _get_tagger_file(self, path: Path):
         suffix = str.lower(path.suffix)
+        self.files_opened += 1
         try:
             if suffix == ".flac":
                 tagger_file = FlacTagger(path, picture_scanner=self._picture_scanner, padding=self._padding)
@@ -0,0 +1,37 @@
+from typing import Final
+
+from mutagen._tags import PaddingInfo
+
+# Default padding in bytes to reserve when tags no longer fit and the file must be rewritten.
+DEFAULT_PADDING_RESERVE: Final = 16 * 1024
+
+
+class PaddingPolicy:
+    """Mutagen padding callback that avoids rewriting audio files when saving tags.
+
+    If the new tags fit in the space used by the old tags plus padding, all of the remaining padding is kept so that
+    the tags are updated in place. Mutagen's default would shrink large padding, which moves all of the audio data.
+    Otherwise the file must be rewritten anyway, and the reserve (or mutagen's default, if larger) is added for future
+    changes.
+
+    Attributes:
+        reserve: padding in bytes to reserve when the file is rewritten
+        in_place: number of saves that updated tags in place
+        rewrites: number of saves that rewrote the audio data
+    """
+
+    reserve: int
+    in_place: int
+    rewrites: int
+
+    def __init__(self, reserve: int = DEFAULT_PADDING_RESERVE):
+        self.reserve = reserve
+        self.in_place = 0
+        self.rewrites = 0
+
+    def __call__(self, info: PaddingInfo) -> int:
+        if info.padding >= 0:
+            self.in_place += 1
+            return info.padding
+        self.rewrites += 1
+        return max(self.reserve, info.get_default_padding())
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from .folder import AlbumTagger
+from .padding import PaddingPolicy
 from .types import ID3v1Policy
 
 
@@ -10,13 +11,36 @@ class AlbumTaggerProvider:
     _base_path: Path
     _tagger: AlbumTagger | None = None
     _id3v1: ID3v1Policy
+    _defer_writes: bool
+    _padding: PaddingPolicy
+    _files_opened: int  # by taggers for other folders
+    _folder: str | Path | None = None  # folder passed to get() for the current tagger
 
-    def __init__(self, base_path: Path, id3v1: ID3v1Policy):
+    def __init__(self, base_path: Path, id3v1: ID3v1Policy, defer_writes: bool = False, padding: PaddingPolicy | None = None):
         self._base_path = base_path
         self._id3v1 = id3v1
+        self._defer_writes = defer_writes
+        self._padding = padding if padding else PaddingPolicy()
+        self._files_opened = 0
 
     def get(self, folder: str | Path) -> AlbumTagger:
+        if self._tagger and folder == self._folder:
+            return self._tagger  # checks get the tagger for the same album many times
         path = self._base_path / folder
+        self._folder = folder
         if not self._tagger or self._tagger.path() != path:
-            self._tagger = AlbumTagger(path, id3v1=self._id3v1)
+            if self._tagger:
+                self._tagger.flush()
+                self._files_opened += self._tagger.files_opened
+            self._tagger = AlbumTagger(path, padding=self._padding, id3v1=self._id3v1, defer_writes=self._defer_writes)
         return self._tagger
+
+    def flush(self) -> None:
+        """Save any deferred changes in the current album folder."""
+        if self._tagger:
+            self._tagger.flush()
+
+    @property
+    def files_opened(self) -> int:
+        """Number of files opened by taggers from this provider."""
+        return self._files_opened + (self._tagger.files_opened if self._tagger else 0)
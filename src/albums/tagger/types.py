@@ -226,9 +226,65 @@ class StreamInfo:
         return result
 
 
+@dataclass(frozen=True)
+class TaggerFileInfo:
+    """Everything the scanner reads from a media file, collected from a single parse of the file. Parts that were not
+    requested from ``TaggerFile.read_all`` are ``None``.
+
+    Attributes:
+        has_video: ``True`` if the file contains a video stream (i.e. it is not an audio track). Read with the stream.
+        fields: Basic field values, as returned by ``TaggerFile.get_fields``.
+        legacy_fields: Legacy field names and their replacement, as returned by ``TaggerFile.get_legacy_fields``. Read
+            with the fields.
+        pictures: Embedded pictures in embed order, without image data.
+        stream: Audio stream properties.
+    """
+
+    has_video: bool | None
+    fields: Tuple[Tuple[BasicField, Tuple[str, ...]], ...] | None
+    legacy_fields: Tuple[Tuple[str, BasicField], ...] | None
+    pictures: Tuple[Picture, ...] | None
+    stream: StreamInfo | None
+
+
+@dataclass(frozen=True)
+class WriteSet:
+    """Changes made to files through a tagger.
+
+    Attributes:
+        files: Names of files that were changed.
+        fields: Fields that were set in any of those files. A ``str`` is a field name that is not a ``BasicField``, such as a
+            legacy field.
+        pictures: ``True`` if embedded pictures were added or removed in any of those files.
+    """
+
+    files: frozenset[str] = frozenset()
+    fields: frozenset[BasicField | str] = frozenset()
+    pictures: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.files)
+
+    def union(self, other: "WriteSet") -> "WriteSet":
+        return WriteSet(self.files | other.files, self.fields | other.fields, self.pictures or other.pictures)
+
+
 class TaggerFile:
     """Abstract interface for reading and writing tags/images on a single media file."""
 
+    def read_all(self, fields: bool = True, pictures: bool = True, stream: bool = True) -> TaggerFileInfo:
+        """Read fields, legacy fields, pictures and stream info from the already-parsed file at once.
+
+        Reading pictures hashes and decodes every embedded image, so a rescan of other parts should not request them.
+        """
+        return TaggerFileInfo(
+            self.has_video() if stream else None,
+            self.get_fields() if fields else None,
+            self.get_legacy_fields() if fields else None,
+            tuple(picture for (picture, _) in self.get_pictures()) if pictures else None,
+            self.get_stream_info() if stream else None,
+        )
+
     def get_fields(self) -> Tuple[Tuple[BasicField, Tuple[str, ...]], ...]: ...
     def get_stream_info(self) -> StreamInfo: ...
     def get_image_data(self, picture: Picture) -> bytes: ...
@@ -240,6 +296,11 @@ class TaggerFile:
     def remove_picture(self, remove_picture: Picture) -> None: ...
     def close(self) -> None: ...
 
+    # file types that can be changed should implement this, so that only changed data needs to be scanned again:
+    def take_changes(self) -> WriteSet:
+        """Changes made since the last call (or since the file was opened), which may not be saved yet."""
+        return WriteSet()
+
     # file types that may be video streams (e.g. mp4) should implement this:
     def has_video(self) -> bool:
         return False
@@ -0,0 +1,70 @@
+"""Compare loading files with mutagen through buffered file access and through a read-only memory map.
+
+AlbumTagger only uses buffered reads. Re-run this to see whether a memory map would help, e.g. on other storage.
+
+Run with: poetry run python -m tests.benchmarks.bench_scan_read [iterations]
+"""
+
+import io
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import mutagen
+from PIL import Image
+
+from albums.picture import PictureInfo
+from albums.tagger import AlbumTagger, BasicField, Picture, PictureType
+
+from ..fixtures.empty_files import EMPTY_FLAC_FILE_BYTES, EMPTY_M4A_FILE_BYTES, EMPTY_MP3_FILE_BYTES
+
+AUDIO_BYTES = 32 * 1024 * 1024  # appended to each file to simulate a large lossless file
+FILES = (("1.flac", EMPTY_FLAC_FILE_BYTES), ("2.mp3", EMPTY_MP3_FILE_BYTES), ("3.m4a", EMPTY_M4A_FILE_BYTES))
+
+
+def _create_files(folder: Path):
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", (1000, 1000), os.urandom(1000 * 1000 * 3)).save(buffer, "PNG")  # noise does not compress, about 3 MB
+    image_data = buffer.getvalue()
+    picture = Picture(PictureInfo("image/png", 1000, 1000, 24, len(image_data), b""), PictureType.COVER_FRONT, "")
+    for filename, empty_file in FILES:
+        (folder / filename).write_bytes(empty_file)
+        with AlbumTagger(folder).open(filename) as file:
+            file.set_field(BasicField.TITLE, "Title")
+            file.add_picture(picture, image_data)
+        with open(folder / filename, "ab") as file:
+            if filename.endswith(".m4a"):
+                file.write(struct.pack(">I4s", AUDIO_BYTES + 8, b"free"))  # top level atom that mutagen will skip
+            file.write(os.urandom(AUDIO_BYTES))
+
+
+def _load_buffered(path: Path):
+    mutagen.File(path)
+
+
+def _load_mapped(path: Path):
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        mutagen.File(mapped)
+
+
+def main(folder: Path, iterations: int):
+    _create_files(folder)
+    print(f"{'file':<8} {'buffered':>12} {'mmap':>12}")
+    for filename, _ in FILES:
+        results: list[float] = []
+        for load in (_load_buffered, _load_mapped):
+            load(folder / filename)  # warm up page cache
+            start = time.perf_counter()
+            for _ in range(iterations):
+                load(folder / filename)
+            results.append((time.perf_counter() - start) / iterations * 1000)
+        print(f"{filename.split('.')[-1]:<8} {results[0]:>10.3f}ms {results[1]:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        main(Path(temp_dir), int(sys.argv[1]) if len(sys.argv) > 1 else 100)
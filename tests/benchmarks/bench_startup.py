@@ -0,0 +1,62 @@
+"""Measure CLI startup time of small commands, and which imports it is spent on.
+
+Run with: poetry run python -m tests.benchmarks.bench_startup [iterations]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Sequence
+
+TOP_IMPORTS = 5
+
+
+def _commands(library: Path) -> dict[str, list[str]]:
+    db = ["--db-file", str(library / "albums.db")]
+    return {
+        "--help": ["--help"],
+        "list": db + ["list"],
+        "sql": db + ["sql", "SELECT COUNT(*) FROM album"],
+        "config": db + ["config", "settings.library"],
+    }
+
+
+def _run(args: Sequence[str], python_options: Sequence[str] = ()) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "COLUMNS": "120"}
+    return subprocess.run([sys.executable, *python_options, "-m", "albums", *args], capture_output=True, text=True, env=env, check=True)
+
+
+def _top_level_imports(importtime_output: str) -> list[tuple[str, int]]:
+    """Cumulative microseconds of each module imported directly by ``-X importtime`` output, slowest first."""
+    imports: list[tuple[str, int]] = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not name.startswith("  "):  # nested imports are indented
+            imports.append((name.strip(), int(cumulative)))
+    return sorted(imports, key=lambda module: -module[1])
+
+
+def main(library: Path, iterations: int):
+    _run(["--db-file", str(library / "albums.db"), "init", str(library)])
+    print(f"{'command':<8} {'median':>10} {'imports':>10}  slowest imports")
+    for name, args in _commands(library).items():
+        times: list[float] = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            _run(args)
+            times.append((time.perf_counter() - start) * 1000)
+        imports = _top_level_imports(_run(args, ["-X", "importtime"]).stderr)
+        total = sum(cumulative for _, cumulative in imports) / 1000
+        slowest = ", ".join(f"{module} {cumulative / 1000:.0f}ms" for module, cumulative in imports[:TOP_IMPORTS])
+        print(f"{name:<8} {statistics.median(times):>8.0f}ms {total:>8.0f}ms  {slowest}")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        main(Path(temp_dir), int(sys.argv[1]) if len(sys.argv) > 1 else 10)
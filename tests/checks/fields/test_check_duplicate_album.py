@@ -49,7 +49,7 @@ class TestCheckDuplicateAlbum:
             assert result.fixer.option_automatic_index is None
 
             mock_rmtree = mocker.patch("albums.checks.fields.check_duplicate_album.rmtree")
-            mock_confirm = mocker.patch("albums.checks.fields.check_duplicate_album.confirm", return_value=True)
+            mock_confirm = mocker.patch("prompt_toolkit.shortcuts.confirm", return_value=True)
             fix_result = result.fixer.fix(result.fixer.options[0])
 
             assert fix_result
@@ -80,7 +80,7 @@ class TestCheckDuplicateAlbum:
             assert result.fixer.option_automatic_index is None
 
             mock_rmtree = mocker.patch("albums.checks.fields.check_duplicate_album.rmtree")
-            mock_confirm = mocker.patch("albums.checks.fields.check_duplicate_album.confirm", return_value=True)
+            mock_confirm = mocker.patch("prompt_toolkit.shortcuts.confirm", return_value=True)
             fix_result = result.fixer.fix(result.fixer.options[1])
 
             assert fix_result
@@ -162,3 +162,29 @@ class TestCheckDuplicateAlbum:
             assert result
             assert f'possible duplicate of "Lots{os.sep}' in result.message
             assert result.fixer
+
+    def test_duplicate_match(self):
+        albums = [
+            Album(path="a" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "The One", BasicField.ARTIST: "Foo"})]),
+            Album(path="b" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "One (Deluxe)", BasicField.ARTIST: "Foo"})]),
+            Album(path="c" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Onne", BasicField.ARTIST: "Foo"})]),
+        ]
+        ctx = Context()
+        ctx.db = db_open(MEMORY)
+        with Session(ctx.db) as session:
+            session.add_all(albums)
+            session.flush()
+
+            ctx.config.checks[CheckDuplicateAlbum.name]["match"] = "exact"
+            assert not CheckDuplicateAlbum(ctx).check(albums[0])
+
+            ctx.config.checks[CheckDuplicateAlbum.name]["match"] = "normalized"
+            result = CheckDuplicateAlbum(ctx).check(albums[0])
+            assert result
+            assert f'possible duplicate of "b{os.sep}' in result.message
+
+            ctx.config.checks[CheckDuplicateAlbum.name]["match"] = "similar"
+            ctx.config.checks[CheckDuplicateAlbum.name]["min_similarity"] = 0.5
+            result = CheckDuplicateAlbum(ctx).check(albums[0])
+            assert result
+            assert f'multiple duplicates: "b{os.sep}", "c{os.sep}"' in result.message
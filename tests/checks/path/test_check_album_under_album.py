@@ -58,3 +58,37 @@ class TestCheckAlbumUnderAlbum:
                 assert result is None
         finally:
             ctx.db.dispose()
+
+    def test_album_under_album_prepared(self):
+        albums = [
+            Album(path=f"foo{os.sep}bar{os.sep}baz{os.sep}", tracks=[Track(filename="1.flac")]),
+            Album(path=f"foo{os.sep}bar{os.sep}", tracks=[Track(filename="1.flac")]),
+            Album(path="foo" + os.sep, tracks=[Track(filename="1.flac")]),
+            Album(path="foo!" + os.sep, tracks=[Track(filename="1.flac")]),
+            Album(path=f"Foo{os.sep}qux{os.sep}", tracks=[Track(filename="1.flac")]),
+        ]
+
+        ctx = Context()
+        ctx.db = db_open(MEMORY)
+        try:
+            with Session(ctx.db) as session:
+                session.add_all(albums)
+                session.flush()
+                checker = CheckAlbumUnderAlbum(ctx, session=session)
+                checker.prepare()
+
+                result = checker.check(albums[2])
+                assert result and "there are 2 albums in directories under album foo" in result.message
+                result = checker.check(albums[1])
+                assert result and "there is 1 album in a directory under album" in result.message
+                assert checker.check(albums[0]) is None
+                assert checker.check(albums[3]) is None
+
+                # results are from the library when prepared
+                session.add(Album(path=f"foo!{os.sep}bar{os.sep}", tracks=[Track(filename="1.flac")]))
+                session.flush()
+                assert checker.check(albums[3]) is None
+                checker.prepare()
+                assert checker.check(albums[3])
+        finally:
+            ctx.db.dispose()
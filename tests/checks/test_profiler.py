@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from albums.checks.profiler import CheckProfiler
+from albums.database import MEMORY, db_open
+from albums.tagger import AlbumTaggerProvider, ID3v1Policy
+
+
+class TestCheckProfiler:
+    def test_measure(self, tmp_path: Path):
+        db = db_open(MEMORY)
+        try:
+            tagger = AlbumTaggerProvider(tmp_path, id3v1=ID3v1Policy.UPDATE)
+            profiler = CheckProfiler()
+            profiler.attach(db, tagger)
+            with Session(db) as session:
+                for _ in range(2):
+                    with profiler.measure("foo", "check"):
+                        session.execute(text("SELECT 1"))
+                        with tagger.get("album").open("1.flac"):
+                            pass
+                with profiler.measure("bar", "check"):
+                    pass
+
+                profiler.detach()
+                with profiler.measure("bar", "fix"):
+                    session.execute(text("SELECT 1"))
+        finally:
+            db.dispose()
+
+        foo = profiler.profiles[("foo", "check")]
+        assert (foo.calls, foo.statements, foo.files_opened) == (2, 2, 2)
+        assert profiler.profiles[("bar", "fix")].statements == 0  # detached
+
+        profile_file = tmp_path / "profile.json"
+        profiler.write_json(profile_file)
+        profiles = json.loads(profile_file.read_text(encoding="utf-8"))
+        assert [(profile["check"], profile["call"]) for profile in profiles][0] == ("foo", "check")
+        assert profiles[0]["calls"] == 2
@@ -0,0 +1,58 @@
+from albums.app import Context
+from albums.checks.all import ALL_CHECKS
+from albums.checks.base_check import Check
+from albums.checks.check_types import CheckInput
+from albums.checks.fields.check_track_title import CheckTrackTitle
+from albums.checks.path.check_unreadable_track import CheckUnreadableTrack
+from albums.checks.picture.check_cover_unique import CheckCoverUnique
+from albums.checks.scheduler import depends_on_library, schedule_checks
+from albums.tagger import BasicField, WriteSet
+
+
+class TestScheduler:
+    def test_all_checks_declare_inputs(self):
+        assert all(check.inputs != Check.inputs for check in ALL_CHECKS)
+        assert {check.name for check in ALL_CHECKS if depends_on_library(check)} == {"duplicate-album", "album-under-album"}
+
+    def test_schedule_library_checks_last(self):
+        scheduled = schedule_checks(ALL_CHECKS)
+        assert [check.name for check in scheduled[-2:]] == ["duplicate-album", "album-under-album"]
+        assert [check for check in scheduled if not depends_on_library(check)] == [check for check in ALL_CHECKS if not depends_on_library(check)]
+
+        names = [check.name for check in scheduled]
+        for ix, check in enumerate(scheduled):
+            assert check.must_pass_checks <= set(names[:ix])
+
+    def test_schedule_dependent_of_library_check(self):
+        class Library(Check):
+            name = "library"
+            inputs = frozenset({CheckInput.LIBRARY})
+
+        class Dependent(Check):
+            name = "dependent"
+            inputs = frozenset({CheckInput.FILES})
+            must_pass_checks = {"library"}
+
+        class Other(Check):
+            name = "other"
+            inputs = frozenset({CheckInput.FILES})
+
+        assert schedule_checks([Library, Dependent, Other]) == [Other, Library, Dependent]
+
+    def test_affected_by(self):
+        ctx = Context()
+        track_title = CheckTrackTitle(ctx)
+        cover_unique = CheckCoverUnique(ctx)
+        unreadable_track = CheckUnreadableTrack(ctx)
+
+        title = WriteSet(frozenset({"1.flac"}), frozenset({BasicField.TITLE}), False)
+        album = WriteSet(frozenset({"1.flac"}), frozenset({BasicField.ALBUM}), False)
+        legacy = WriteSet(frozenset({"1.flac"}), frozenset({"tracktotal"}), False)
+        picture = WriteSet(frozenset({"1.flac"}), frozenset(), True)
+        assert track_title.affected_by(title)
+        assert not track_title.affected_by(album)
+        assert track_title.affected_by(legacy)
+        assert not track_title.affected_by(picture)
+        assert cover_unique.affected_by(picture)
+        assert not cover_unique.affected_by(title)
+        assert unreadable_track.affected_by(album)  # file size changed
@@ -1,10 +1,16 @@
+import csv
 import json
 import os
 import re
 import shutil
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
+from sqlalchemy import text
 
+from albums.database import db_open
 from albums.entities import Album, PictureFile, Track
 from albums.picture import PictureInfo
 from albums.tagger import BasicField
@@ -43,6 +49,27 @@ class TestCli:
         assert result.exit_code == 0
         assert "Usage: albums [OPTIONS] COMMAND [ARGS]" in result.output
 
+    def test_startup_imports(self):
+        helpers.init_db(TestCli.library)
+        # other tests have already imported everything, so check in a new process
+        script = (
+            "import sys\n"
+            "from albums.cli.entry_point import albums_group\n"
+            f"albums_group(['--db-file', {str(TestCli.library / 'albums.db')!r}, 'sql', 'SELECT 1'], standalone_mode=False)\n"
+            "print(*sorted(sys.modules))\n"
+        )
+        modules = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.split()
+        assert "albums.cli.sql" in modules
+        for slow_module in (
+            "albums.cli.check",
+            "albums.library.importer",
+            "albums.interactive.configurator",
+            "prompt_toolkit",
+            "skimage",
+            "rich.traceback",
+        ):
+            assert slow_module not in modules
+
     def test_scan(self):
         result = helpers.init_db(TestCli.library)
         assert result.exit_code == 0
@@ -61,6 +88,11 @@ class TestCli:
         assert result.exit_code == 0
         assert re.search("bar.+00:00.+\\d+ Bytes.+foo.+00:00.+\\d+ Bytes.+total: \\d+.*", result.output, re.MULTILINE | re.DOTALL)
 
+        result = self.run(["-p", "foo" + os.sep, "list", "--order", "size"])
+        assert result.exit_code == 0
+        assert re.search("foo.+│ 1 +│", result.output)
+        assert "bar" not in result.output
+
     def test_scan_remove(self):
         result = self.run(["-v", "scan"], init=True)
         assert result.exit_code == 0
@@ -79,6 +111,36 @@ class TestCli:
         assert f'1 track missing album field : "foo{os.sep}"' in result.output
         assert f'2 tracks missing album field : "bar{os.sep}"' in result.output
 
+    def test_check_parallel(self):
+        self.run(["scan"], init=True)
+        serial = self.run(["check", "--default"])
+        assert serial.exit_code == 0
+        result = self.run(["check", "--default", "--jobs", "2"])
+        assert result.exit_code == 0
+        assert result.output == serial.output
+        assert f'1 track missing album field : "foo{os.sep}"' in result.output
+
+        result = self.run(["check", "--jobs", "2", "--automatic"])
+        assert result.exit_code == 1
+        assert "--jobs cannot be used with fix options" in result.output
+
+    def test_check_profile(self):
+        profile_file = TestCli.library / "profile.json"
+        result = self.run(["check", "--automatic", "--profile-json", str(profile_file), "album"], init=True)
+        assert result.exit_code == 0
+        assert "avg ms" in result.output
+
+        profiles = {(profile["check"], profile["call"]): profile for profile in json.loads(profile_file.read_text(encoding="utf-8"))}
+        assert profiles[("album", "check")]["calls"] == 4  # checked again after fixing each album
+        assert profiles[("album", "check")]["statements"] >= 0
+        assert profiles[("album", "fix")]["calls"] == 2
+        assert profiles[("album", "fix")]["files_opened"] == 3
+        assert profiles[("album", "rescan")]["calls"] == 2
+
+        result = self.run(["check", "--jobs", "2", "--profile"])
+        assert result.exit_code == 1
+        assert "--jobs cannot be used with --profile" in result.output
+
     def test_check_automatically_enabled_dependencies(self):
         result = self.run(["check", "disc-numbering"], init=True)
         assert result.exit_code == 0
@@ -137,6 +199,23 @@ class TestCli:
         assert "bar" + os.sep not in result.output
         assert "1.flac" not in result.output
 
+    def test_list_read_only(self):
+        self.run(["scan"], init=True)
+        db = db_open(TestCli.library / "albums.db")
+        try:
+            with db.begin() as conn:
+                conn.execute(text("UPDATE _schema SET maintained_at = 0;"))
+            with db.begin() as conn:
+                conn.execute(text("INSERT INTO collection (collection_name) VALUES ('writing');"))
+                # list does not wait for another process that is writing, and doesn't write (maintenance is due)
+                result = self.run(["list"])
+                assert result.exit_code == 0
+                assert "foo" + os.sep in result.output
+            with db.connect() as conn:
+                assert conn.execute(text("SELECT maintained_at FROM _schema;")).scalar() == 0
+        finally:
+            db.dispose()
+
     def test_list_json(self):
         self.run(["scan"], init=True)
         result = self.run(["list", "--json"])
@@ -147,6 +226,22 @@ class TestCli:
         assert len(result_json[1]["tracks"]) == 1
         assert result_json[1]["tracks"][0]["filename"] == "1.mp3"
 
+    def test_list_json_lines(self):
+        self.run(["scan"], init=True)
+        self.run(["-rp", "foo", "add", "test"])
+        result = self.run(["list", "--json-lines"])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert len(lines) == 2
+        albums_json = [json.loads(line) for line in lines]
+        assert [album["path"] for album in albums_json] == ["bar" + os.sep, "foo" + os.sep]
+        assert albums_json[1]["collections"] == ["test"]
+        assert albums_json[1]["tracks"][0]["filename"] == "1.mp3"
+        assert albums_json[1]["tracks"][0]["fields"]
+
+        # same albums as --json
+        assert json.loads(self.run(["list", "--json"]).output) == albums_json
+
     def test_list_json_empty(self):
         shutil.rmtree(TestCli.library / albums[0].path)
         shutil.rmtree(TestCli.library / albums[1].path)
@@ -273,6 +368,55 @@ class TestCli:
 
         assert len(json.loads(self.run(["list", "-j"]).output)) == 2
 
+    def test_db_maintain(self):
+        result = self.run(["db", "maintain"], init=True)
+        assert result.exit_code == 0
+        assert "database size" in result.output
+        assert "after maintenance" in result.output
+
+    def test_export(self, tmp_path: Path):
+        self.run(["scan"], init=True)
+        result = self.run(["-rp", "foo", "export", str(tmp_path / "export")])
+        assert result.exit_code == 0
+        assert "exported 1 rows to" in result.output
+        with open(tmp_path / "export" / "track_wide.csv", encoding="utf-8", newline="") as file:
+            [track] = list(csv.DictReader(file))
+        assert (track["path"], track["filename"]) == ("foo" + os.sep, "1.mp3")
+
+    def test_export_needs_pyarrow(self, tmp_path: Path, mocker):
+        self.run(["scan"], init=True)
+        mocker.patch("albums.cli.export.find_spec", return_value=None)
+        result = self.run(["export", "--format", "parquet", str(tmp_path / "export")])
+        assert result.exit_code == 1
+        assert "parquet export needs pyarrow" in result.output
+        assert "albums[arrow]" in result.output
+        assert not (tmp_path / "export").exists()
+
+    def test_search(self):
+        self.run(["scan"], init=True)
+        result = self.run(["search", "A", "1"])
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["foo" + os.sep, "  artist: a", "  title: 1", "found 1 album"]
+
+        result = self.run(["-s", "fo*", "list"])
+        assert result.exit_code == 0
+        assert "foo" + os.sep in result.output
+        assert "bar" not in result.output
+
+        result = self.run(["search", "*"])
+        assert result.exit_code == 1
+        assert "search text must contain a word" in result.output
+
+        db = db_open(TestCli.library / "albums.db")
+        try:
+            with db.begin() as conn:
+                conn.execute(text("UPDATE album SET path = :path WHERE path = :old;"), {"path": "foo [Live]" + os.sep, "old": "foo" + os.sep})
+        finally:
+            db.dispose()
+        result = self.run(["search", "A", "1"])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[0] == "foo [Live]" + os.sep
+
     def test_sql(self):
         self.run(["scan"], init=True)
         result = self.run(["sql", "--json", "SELECT * from album ORDER BY path;"])
@@ -286,3 +430,34 @@ class TestCli:
         assert "foo" + os.sep in result.output
         assert "album_id" in result.output  # shows column names
         assert "path" in result.output
+
+    def test_sql_formats(self):
+        self.run(["scan"], init=True)
+        query = "SELECT path, x'0102' AS hash FROM album ORDER BY path;"
+        result = self.run(["sql", "--format", "csv", query])
+        assert result.exit_code == 0
+        assert list(csv.reader(result.output.splitlines())) == [["path", "hash"], ["bar" + os.sep, "0102"], ["foo" + os.sep, "0102"]]
+
+        result = self.run(["sql", "-f", "tsv", "--limit", "1", query])
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["path\thash", f"bar{os.sep}\t0102"]
+
+        result = self.run(["sql", "-f", "jsonl", query])
+        assert result.exit_code == 0
+        assert [json.loads(line) for line in result.output.splitlines()] == [
+            {"path": "bar" + os.sep, "hash": "0102"},
+            {"path": "foo" + os.sep, "hash": "0102"},
+        ]
+
+        result = self.run(["sql", "--json", "--limit", "1", query])
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [["bar" + os.sep, "0102"]]
+
+        result = self.run(["sql", "--limit", "1", query])
+        assert result.exit_code == 0
+        assert "bar" in result.output
+        assert "foo" not in result.output
+        assert "(showing the first 1 rows)" in result.output
+
+        result = self.run(["sql", "--json", "-f", "csv", query])
+        assert result.exit_code == 1
@@ -68,6 +68,16 @@ class TestCliConfig:
         assert result.exit_code == 0
         assert f"settings.more_import_paths = {','.join(p.template for p in DEFAULT_MORE_IMPORT_PATHS)}" in result.output
 
+    def test_config_tag_padding(self):
+        result = self.run(["config", "settings.tag_padding"], init=True)
+        assert "settings.tag_padding = 16384" in result.output
+        result = self.run(["config", "settings.tag_padding=65536"])
+        assert "settings.tag_padding = 65536" in result.output
+        result = self.run(["config", "settings.tag_padding=lots"])
+        assert "settings.tag_padding must be a non-negative integer" in result.output
+        result = self.run(["config", "settings.tag_padding"])
+        assert "settings.tag_padding = 65536" in result.output
+
     def test_config_id3v1(self):
         result = self.run(["config", "settings.id3v1"], init=True)
         assert "settings.id3v1 = UPDATE" in result.output
@@ -0,0 +1,74 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from albums.database import MEMORY, db_open, migrate
+from albums.tagger import BasicField
+
+from .sql_helpers import make_track_sql
+
+FOREIGN_KEY_COLUMNS = {
+    "track": "album_id",
+    "track_field": "track_id",
+    "track_legacy_field": "track_id",
+    "track_picture": "track_id",
+    "album_collection": "album_id",
+    "album_ignore_check": "album_id",
+    "album_picture_file": "album_id",
+    "album_other_file": "album_id",
+    "album_check_pass": "album_id",
+}
+
+
+class TestMigration23ForeignKeyTypes:
+    """Test that migration 23 declares foreign key columns as INTEGER and keeps data, indexes and foreign keys."""
+
+    def test_foreign_key_columns_typed(self):
+        db = db_open(MEMORY, version=22)
+        try:
+            migrate(db, quiet=True, target_version=23)
+
+            with Session(db) as session:
+                for table, column in FOREIGN_KEY_COLUMNS.items():
+                    columns = {r.name: r.type for r in session.execute(text(f"PRAGMA table_info({table});"))}
+                    assert columns[column] == "INTEGER", table
+                indexes = session.execute(text("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%';")).scalars().all()
+                assert "idx_track_field_name_value" in indexes
+                assert "idx_track_field_track_id" in indexes
+                assert "idx_collection_by_album_id" in indexes
+                assert not any(name.startswith("new_") for name in session.execute(text("SELECT name FROM sqlite_master;")).scalars())
+        finally:
+            db.dispose()
+
+    def test_data_preserved(self):
+        db = db_open(MEMORY, version=22)
+        try:
+            with db.begin() as conn:
+                conn.execute(text("INSERT INTO album (path) VALUES ('test_album');"))
+                conn.execute(text(make_track_sql(1, "1.flac")))
+                conn.execute(text(f"INSERT INTO track_field (track_id, name, value) VALUES (1, '{BasicField.ARTIST.value}', 'A');"))
+                conn.execute(
+                    text(
+                        "INSERT INTO track_picture (track_id, picture_type, format, width, height, file_size, file_hash, embed_ix, description) "
+                        "VALUES (1, 3, 'image/png', 400, 300, 1000, x'1234', 1, 'cover');"
+                    )
+                )
+                conn.execute(text("INSERT INTO collection (collection_name) VALUES ('c');"))
+                conn.execute(text("INSERT INTO album_collection (album_id, collection_id) VALUES (1, 1);"))
+                conn.execute(text("INSERT INTO album_ignore_check (album_id, check_name) VALUES (1, 'album-tag');"))
+
+            migrate(db, quiet=True, target_version=23)
+
+            with Session(db) as session:
+                assert session.execute(text("SELECT album_id, filename FROM track;")).tuples().all() == [(1, "1.flac")]
+                assert session.execute(text("SELECT track_id, name, value FROM track_field;")).tuples().all() == [(1, "artist", "A")]
+                picture = session.execute(text("SELECT track_id, format, width, height, file_hash, embed_ix, description FROM track_picture;")).one()
+                assert tuple(picture) == (1, "image/png", 400, 300, b"\x12\x34", 1, "cover")
+                assert session.execute(text("SELECT album_id, collection_id FROM album_collection;")).tuples().all() == [(1, 1)]
+                assert session.execute(text("SELECT album_id, check_name FROM album_ignore_check;")).tuples().all() == [(1, "album-tag")]
+
+                # foreign keys refer to the new tables
+                session.execute(text("DELETE FROM album;"))
+                for table in FOREIGN_KEY_COLUMNS:
+                    assert session.execute(text(f"SELECT COUNT(*) FROM {table};")).scalar() == 0, table
+        finally:
+            db.dispose()
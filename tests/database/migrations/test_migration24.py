@@ -0,0 +1,35 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from albums.database import MEMORY, db_open, migrate
+
+from .sql_helpers import make_track_sql
+
+
+class TestMigration24LowerValueIndex:
+    """Test that migration 24 indexes lowercase field values and that looking up a value ignoring case uses the index."""
+
+    def test_lower_value_index(self):
+        db = db_open(MEMORY, version=23)
+        try:
+            with db.begin() as conn:
+                conn.execute(text("INSERT INTO album (path) VALUES ('test_album');"))
+                conn.execute(text(make_track_sql(1, "1.flac")))
+                for ix in range(100):
+                    conn.execute(text(f"INSERT INTO track_field (track_id, name, value) VALUES (1, 'album', 'Album {ix}');"))
+
+            migrate(db, quiet=True, target_version=24)
+
+            with Session(db) as session:
+                indexes = session.execute(text("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='track_field';")).scalars().all()
+                assert "idx_track_field_name_lower_value" in indexes
+                session.execute(text("ANALYZE;"))  # like database maintenance
+                plan = [
+                    str(row[3])
+                    for row in session.execute(
+                        text("EXPLAIN QUERY PLAN SELECT track_id FROM track_field WHERE name = 'album' AND lower(value) = lower('Foo');")
+                    )
+                ]
+                assert any("idx_track_field_name_lower_value" in step for step in plan), plan
+        finally:
+            db.dispose()
@@ -0,0 +1,35 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from albums.database import MEMORY, db_open, migrate
+from albums.tagger import BasicField
+
+from .sql_helpers import make_track_sql
+
+
+class TestMigration25Search:
+    """Test that migration 25 indexes existing values for full-text search, and keeps the index up to date."""
+
+    def test_existing_values_indexed(self):
+        db = db_open(MEMORY, version=24)
+        try:
+            with db.begin() as conn:
+                conn.execute(text("INSERT INTO album (path) VALUES ('Foo/Bar');"))
+                conn.execute(text(make_track_sql(1, "1.flac")))
+                conn.execute(text(f"INSERT INTO track_field (track_id, name, value) VALUES (1, '{BasicField.ARTIST.value}', 'Ünïcode Artist');"))
+
+            migrate(db, quiet=True, target_version=25)
+
+            with Session(db) as session:
+                assert session.execute(text("SELECT rowid FROM track_field_search WHERE track_field_search MATCH 'unicode';")).scalars().all() == [1]
+                assert session.execute(text("SELECT rowid FROM album_search WHERE album_search MATCH 'bar';")).scalars().all() == [1]
+
+                session.execute(text("UPDATE track_field SET value = 'Other' WHERE track_field_id = 1;"))
+                assert session.execute(text("SELECT rowid FROM track_field_search WHERE track_field_search MATCH 'unicode';")).scalars().all() == []
+                assert session.execute(text("SELECT rowid FROM track_field_search WHERE track_field_search MATCH 'other';")).scalars().all() == [1]
+
+                session.execute(text("DELETE FROM album;"))  # cascades to track_field
+                assert session.execute(text("SELECT rowid FROM track_field_search WHERE track_field_search MATCH 'other';")).scalars().all() == []
+                assert session.execute(text("SELECT rowid FROM album_search WHERE album_search MATCH 'bar';")).scalars().all() == []
+        finally:
+            db.dispose()
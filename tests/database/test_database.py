@@ -1,13 +1,18 @@
+import csv
 import os
 from pathlib import Path
 
 import pytest
 from sqlalchemy import select, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
-from albums.database import MEMORY, db_open
-from albums.entities import Album, Track
-from albums.tagger import BasicField
+from albums.database import MEMORY, Match, database_space, db_open, maintain, select_album_ids
+from albums.database.export import export_catalog
+from albums.database.maintain import AUTO_VACUUM_INCREMENTAL, maintain_if_due
+from albums.entities import Album, FieldV, Track, TrackPicture
+from albums.picture import PictureInfo
+from albums.tagger import BasicField, PictureType
 
 
 class TestDatabase:
@@ -50,6 +55,70 @@ class TestDatabase:
             db_open(db_file)
             assert False  # shouldn't get this far
 
+    def test_maintain(self, tmp_path: Path):
+        db = db_open(tmp_path / "albums.db")
+        try:
+            with db.connect() as conn:
+                assert database_space(conn).auto_vacuum == AUTO_VACUUM_INCREMENTAL
+                maintained_at = conn.execute(text("SELECT maintained_at FROM _schema;")).scalar_one()
+            assert maintained_at > 1_000_000_000  # maintained when opened
+            assert not maintain_if_due(db)
+
+            with db.begin() as conn:
+                conn.execute(text("UPDATE _schema SET maintained_at = 0;"))
+                conn.execute(text("CREATE TABLE junk (data BLOB);"))
+                conn.execute(
+                    text(
+                        "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 4000) INSERT INTO junk SELECT randomblob(8000) FROM n;"
+                    )
+                )
+            with db.begin() as conn:
+                conn.execute(text("DROP TABLE junk;"))
+                assert database_space(conn).free > 10 * 1024 * 1024
+            assert maintain_if_due(db)
+            with db.connect() as conn:
+                assert database_space(conn).free == 0  # incremental vacuum
+
+            # database created by an older version
+            with db.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("PRAGMA auto_vacuum = NONE;")
+                conn.exec_driver_sql("VACUUM;")
+                assert database_space(conn).auto_vacuum == 0
+            maintain(db, full=True)
+            with db.connect() as conn:
+                assert database_space(conn).auto_vacuum == AUTO_VACUUM_INCREMENTAL
+        finally:
+            db.dispose()
+
+    def test_concurrent_access(self, tmp_path: Path):
+        db = db_open(tmp_path / "albums.db")
+        reader = db_open(tmp_path / "albums.db", read_only=True)
+        try:
+            with db.connect() as conn:
+                assert conn.exec_driver_sql("PRAGMA journal_mode;").scalar() == "wal"
+
+            with db.begin() as conn:
+                conn.execute(text("INSERT INTO album (path) VALUES ('a');"))
+                # reading does not wait for a write to finish, and sees the database as it was
+                with reader.connect() as read_conn:
+                    assert read_conn.execute(text("SELECT COUNT(*) FROM album;")).scalar() == 0
+
+            with reader.connect() as read_conn:
+                read_conn.exec_driver_sql("BEGIN;")
+                assert read_conn.execute(text("SELECT COUNT(*) FROM album;")).scalar() == 1
+                # writing does not wait for a read to finish
+                with db.begin() as conn:
+                    conn.execute(text("INSERT INTO album (path) VALUES ('b');"))
+                assert read_conn.execute(text("SELECT COUNT(*) FROM album;")).scalar() == 1
+                read_conn.exec_driver_sql("COMMIT;")
+                assert read_conn.execute(text("SELECT COUNT(*) FROM album;")).scalar() == 2
+
+                with pytest.raises(OperationalError, match="readonly"):
+                    read_conn.execute(text("DELETE FROM album;"))
+        finally:
+            reader.dispose()
+            db.dispose()
+
     def test_album_created_at(self):
         db = db_open(MEMORY)
         try:
@@ -96,3 +165,103 @@ class TestDatabase:
                 assert sorted(tag[BasicField.UNKNOWN]) == ["bar", "baz"]
         finally:
             db.dispose()
+
+    def test_track_field_values_follow_changes(self):
+        track = Track(filename="1.flac", tag={BasicField.ALBUM: "foo", BasicField.GENRE: ["a", "b"]})
+        assert track.get(BasicField.ALBUM) == ("foo",)
+
+        track.fields[0].value = "bar"
+        assert track.get(BasicField.ALBUM) == ("bar",)
+        track.fields.append(FieldV(field=BasicField.ARTIST, value="baz"))
+        assert track.get(BasicField.ARTIST) == ("baz",)
+        track.fields = [field for field in track.fields if field.field != BasicField.GENRE]
+        assert not track.has(BasicField.GENRE)
+
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                session.add(Album(path="foo" + os.sep, tracks=[track]))
+                session.flush()
+                assert track.field_dict() == {BasicField.ALBUM: ["bar"], BasicField.ARTIST: ["baz"]}
+                track.fields[0].field = BasicField.TITLE
+                assert track.get(BasicField.TITLE) == ("bar",)
+                assert not track.has(BasicField.ALBUM)
+
+                session.execute(text(f"UPDATE track_field SET value = 'qux' WHERE track_id = {track.track_id} AND name = 'artist'"))
+                session.expire(track)
+                assert track.get(BasicField.ARTIST) == ("qux",)
+        finally:
+            db.dispose()
+
+    def test_export_csv(self, tmp_path: Path):
+        picture = TrackPicture(picture_info=PictureInfo("image/png", 400, 400, 24, 1, b"\x12\xab"), picture_type=PictureType.COVER_FRONT)
+        tracks = [
+            Track(filename="1.flac", tag={BasicField.ARTIST: ["A", "B"], BasicField.TITLE: "one"}, pictures=[picture]),
+            Track(filename="2.flac"),
+        ]
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                session.add_all([Album(path="foo" + os.sep, tracks=tracks), Album(path="bar" + os.sep, tracks=[Track(filename="1.flac")])])
+                session.commit()
+
+            counts = export_catalog(db, select_album_ids({"path": [Match("foo" + os.sep)]}), tmp_path)
+            assert counts == {"album": 1, "track": 2, "track_field": 3, "track_picture": 1, "track_wide": 2}
+
+            def read(name: str):
+                with open(tmp_path / f"{name}.csv", encoding="utf-8", newline="") as file:
+                    return list(csv.DictReader(file))
+
+            assert [album["path"] for album in read("album")] == ["foo" + os.sep]
+            assert [track["filename"] for track in read("track")] == ["1.flac", "2.flac"]
+            assert [(field["name"], field["value"]) for field in read("track_field")] == [("artist", "A"), ("artist", "B"), ("title", "one")]
+            [track_picture] = read("track_picture")
+            assert (track_picture["picture_type"], track_picture["format"], track_picture["file_hash"]) == ("3", "image/png", "12AB")
+
+            [track1, track2] = read("track_wide")
+            assert (track1["path"], track1["filename"], track1["artist"], track1["title"], track1["album"]) == (
+                "foo" + os.sep,
+                "1.flac",
+                "A\nB",
+                "one",
+                "",
+            )
+            assert (track2["filename"], track2["artist"]) == ("2.flac", "")
+        finally:
+            db.dispose()
+
+    @pytest.mark.parametrize("format_", ["parquet", "arrow"])
+    def test_export_columnar(self, tmp_path: Path, format_: str):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet
+
+        picture = TrackPicture(picture_info=PictureInfo("image/png", 400, 400, 24, 1, b"\x12\xab"), picture_type=PictureType.COVER_FRONT)
+        tracks = [
+            Track(filename="1.flac", tag={BasicField.ARTIST: ["A", "B"], BasicField.TITLE: "one"}, pictures=[picture]),
+            Track(filename="2.flac"),
+        ]
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                session.add_all([Album(path="foo" + os.sep, tracks=tracks), Album(path="bar" + os.sep, tracks=[Track(filename="1.flac")])])
+                session.commit()
+
+            counts = export_catalog(db, select_album_ids({"path": [Match("foo" + os.sep)]}), tmp_path, format_)
+            assert counts == {"album": 1, "track": 2, "track_field": 3, "track_picture": 1, "track_wide": 2}
+
+            def read(name: str):
+                path = tmp_path / f"{name}.{format_}"
+                return pyarrow.parquet.read_table(path) if format_ == "parquet" else pa.ipc.open_file(path).read_all()
+
+            track = read("track")
+            assert track.schema.field("track_id").type == pa.int64()
+            assert track.schema.field("stream_length").type == pa.float64()
+            assert track.column("filename").to_pylist() == ["1.flac", "2.flac"]
+            [file_hash] = read("track_picture").column("file_hash").to_pylist()
+            assert file_hash == b"\x12\xab"
+
+            track_wide = read("track_wide").to_pylist()
+            assert (track_wide[0]["artist"], track_wide[0]["title"], track_wide[0]["album"]) == ("A\nB", "one", None)
+            assert (track_wide[1]["filename"], track_wide[1]["artist"]) == ("2.flac", None)
+        finally:
+            db.dispose()
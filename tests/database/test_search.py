@@ -0,0 +1,127 @@
+import os
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from albums.database import MEMORY, Match, db_open, load_album_entities, select_album_ids
+from albums.database import search as search_module
+from albums.database.search import HIGHLIGHT_END, HIGHLIGHT_START, search_clause, search_matches, search_terms
+from albums.entities import Album, Track
+from albums.tagger import BasicField
+
+
+def _albums():
+    return [
+        Album(
+            path="Beatles" + os.sep + "Abbey Road" + os.sep,
+            tracks=[
+                Track(filename="1.flac", tag={BasicField.ARTIST: "The Beatles", BasicField.ALBUM: "Abbey Road", BasicField.TITLE: "Come Together"}),
+                Track(filename="2.flac", tag={BasicField.ARTIST: "The Beatles", BasicField.ALBUM: "Abbey Road", BasicField.TITLE: "Something"}),
+            ],
+        ),
+        Album(
+            path="Björk" + os.sep,
+            tracks=[Track(filename="1.flac", tag={BasicField.ARTIST: "Björk", BasicField.ALBUM: "Début", BasicField.TITLE: "Human Behaviour"})],
+        ),
+    ]
+
+
+class TestSearch:
+    def test_search_terms(self):
+        assert search_terms("The Beatles") == ['"The"', '"Beatles"']
+        assert search_terms('beat* "x" OR NEAR(') == ['"beat"*', '"x"', '"OR"', '"NEAR"']
+        assert search_terms(" * - ") == []
+        with pytest.raises(ValueError):
+            search_clause("*")
+
+    @pytest.mark.parametrize(
+        "search_text,paths",
+        [
+            ("beatles", ["Beatles"]),
+            ("BEATLES road", ["Beatles"]),  # words in different fields
+            ("beatles debut", []),
+            ("bjork", ["Björk"]),  # accents are ignored
+            ("debut human", ["Björk"]),
+            ("beh*", ["Björk"]),
+            ("beh", []),
+            ("abbey", ["Beatles"]),
+        ],
+    )
+    def test_search_filter(self, search_text: str, paths: list[str]):
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                session.add_all(_albums())
+                session.flush()
+                result = [album.path.split(os.sep)[0] for album in load_album_entities(session, {"search": [Match(search_text)]})]
+                assert result == paths
+                inverted = [album.path.split(os.sep)[0] for album in load_album_entities(session, {"search": [Match(search_text)]}, invert=True)]
+                assert sorted(inverted + result) == ["Beatles", "Björk"]
+        finally:
+            db.dispose()
+
+    def test_index_follows_changes(self):
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                (beatles, bjork) = _albums()
+                session.add_all((beatles, bjork))
+                session.flush()
+
+                def found(search_text: str):
+                    return [album.album_id for album in load_album_entities(session, {"search": [Match(search_text)]})]
+
+                beatles.tracks[1].fields[2].value = "Octopus's Garden"
+                bjork.path = "Bjork" + os.sep + "Debut" + os.sep
+                session.flush()
+                assert found("octopus") == [beatles.album_id]
+                assert found("something") == []
+                assert found("bjork debut") == [bjork.album_id]
+
+                session.delete(beatles)
+                session.flush()
+                assert found("beatles") == []
+                count = session.execute(text("SELECT COUNT(*) FROM track_field_search WHERE track_field_search MATCH 'beatles';")).scalar()
+                assert count == 0
+                session.execute(text("INSERT INTO track_field_search(track_field_search) VALUES ('integrity-check');"))
+                session.execute(text("INSERT INTO album_search(album_search) VALUES ('integrity-check');"))
+        finally:
+            db.dispose()
+
+    @pytest.mark.parametrize("lookup_max_albums", [1000, 0])
+    def test_search_matches(self, lookup_max_albums: int, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(search_module, "SEARCH_LOOKUP_MAX_ALBUMS", lookup_max_albums)
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                session.add_all(_albums())
+                session.flush()
+                result = list(search_matches(session, select_album_ids(), "beatles the road"))
+                assert [(field, value.replace(HIGHLIGHT_START, "<").replace(HIGHLIGHT_END, ">")) for _, field, value in result] == [
+                    (None, f"<Beatles>{os.sep}Abbey <Road>{os.sep}"),
+                    ("album", "Abbey <Road>"),
+                    ("artist", "<The> <Beatles>"),
+                ]
+
+                selected = select_album_ids({"path": [Match("Björk" + os.sep)]})
+                assert list(search_matches(session, selected, "beatles")) == []
+                [(path, field, value)] = search_matches(session, selected, "béhav*")
+                assert (path, field, value) == ("Björk" + os.sep, "title", f"Human {HIGHLIGHT_START}Behaviour{HIGHLIGHT_END}")
+        finally:
+            db.dispose()
+
+    def test_search_uses_index(self):
+        db = db_open(MEMORY)
+        try:
+            statement = select(Album.album_id).where(search_clause("beatles road")).compile(db, compile_kwargs={"literal_binds": True})
+            with db.connect() as conn:
+                plan = [str(row[3]) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {statement}"))]
+            assert [
+                step
+                for step in plan
+                if step.startswith("SCAN ") and not step.startswith(("SCAN album ", "SCAN track_field_search ", "SCAN album_search "))
+            ] == [], plan
+            assert any("VIRTUAL TABLE INDEX" in step for step in plan), plan
+        finally:
+            db.dispose()
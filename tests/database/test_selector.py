@@ -1,10 +1,13 @@
+import gc
 import os
 import re
 
 import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Session
 
-from albums.database import MEMORY, Comparator, Match, db_open, load_album_entities
+from albums.database import MEMORY, Comparator, Match, db_open, load_album_entities, select_album_ids
 from albums.entities import Album, PictureFile, Track, TrackPicture
 from albums.picture import PictureInfo
 from albums.tagger import BasicField, PictureType, StreamInfo
@@ -285,6 +288,30 @@ class TestSelector:
         finally:
             db.dispose()
 
+    @pytest.mark.parametrize(
+        "pattern",
+        ["Foo", "oo", "^Fo", "^Foo$", "^F.o", "^Foo?", "^Foo*d", "^Fo+", "^Ba|Foo", r"^\(x\)", r"\(x", "^.", "^Ü", "ü", "^", ""],
+    )
+    def test_regex_same_as_python(self, pattern: str):
+        titles = ["Foo", "Food", "Fo", "Bar", "(x)", "Über", "über", "F\U0010ffff"]
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                session.add_all(
+                    Album(path=f"{ix}" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.TITLE: title})]) for ix, title in enumerate(titles)
+                )
+                session.flush()
+                albums = load_album_entities(session, {"field:title": [Match(pattern, Comparator.MATCH_REGEX)]})
+                result = [album.tracks[0].get(BasicField.TITLE)[0] for album in albums]
+                assert sorted(result) == sorted(title for title in titles if re.search(pattern, title))
+        finally:
+            db.dispose()
+
+    @pytest.mark.parametrize("pattern,uses_python", [("Foo", False), ("^Foo", False), (r"^Foo\.", False), ("^Foo.*", True), ("F.o", True)])
+    def test_regex_without_python(self, pattern: str, uses_python: bool):
+        statement = str(select_album_ids({"field:title": [Match(pattern, Comparator.MATCH_REGEX)]}).compile(dialect=sqlite.dialect()))
+        assert ("REGEXP" in statement) == uses_python
+
     def test_compare_any_track_bitrate(self):
         db = db_open(MEMORY)
         try:
@@ -348,3 +375,64 @@ class TestSelector:
                 assert "foo" in result[0].path
         finally:
             db.dispose()
+
+    def test_paged(self):
+        db = db_open(MEMORY)
+        try:
+            with Session(db) as session:
+                session.add_all(
+                    Album(path=f"{ix:02}" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.TITLE: str(ix)})]) for ix in reversed(range(10))
+                )
+                session.commit()
+                session.expunge_all()
+
+                paths: list[str] = []
+                loaded: list[int] = []
+                for album in load_album_entities(session, page_size=3):
+                    paths.append(album.path)
+                    assert album.tracks[0].fields[0].value == str(int(album.path[:2]))
+                    if album.path == "05" + os.sep:
+                        album.path = "99" + os.sep  # renamed while iterating
+                    if album.path == "03" + os.sep:
+                        session.delete(session.scalars(select(Album).where(Album.path == "07" + os.sep)).one())  # deleted while iterating
+                    session.commit()
+                    del album
+                    gc.collect()
+                    loaded.append(sum(1 for obj in session.identity_map.values() if isinstance(obj, Album)))
+
+                assert paths == [f"{ix:02}" + os.sep for ix in range(10) if ix != 7]
+                assert max(loaded) <= 3  # albums that were already checked are not kept in the session
+        finally:
+            db.dispose()
+
+
+class TestSelectorQueryPlans:
+    """Filters must find albums with indexes, because scanning a table for every album is very slow with a large library."""
+
+    @pytest.mark.parametrize(
+        "filter,index",
+        [
+            ({"field:artist": [Match("Foo")]}, "idx_track_field_name_value"),
+            ({"field:artist": []}, "idx_track_field_name_value"),
+            ({"field:artist": [Match("^F", Comparator.MATCH_REGEX)]}, "idx_track_field_name_value"),
+            ({"field:artist": [Match("Foo")], "field:album": [Match("Bar")]}, "idx_track_field_name_value"),
+            ({"collection": [Match("foo")]}, "idx_collection_by_collection_id"),
+            ({"ignore_check": [Match("album")]}, "idx_ignore_check_album_id"),
+            ({"codec": [Match("FLAC")]}, "idx_track_album_id"),
+            ({"path": [Match("^foo", Comparator.MATCH_REGEX)]}, "album_path"),
+        ],
+    )
+    @pytest.mark.parametrize("invert", [False, True])
+    def test_filter_uses_index(self, filter: dict[str, list[Match]], index: str, invert: bool):
+        db = db_open(MEMORY)
+        try:
+            statement = select_album_ids(filter, invert).compile(db, compile_kwargs={"literal_binds": True})
+            with db.connect() as conn:
+                plan = [str(row[3]) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {statement}"))]
+            assert any(index in step for step in plan), plan
+            # the only table that may be scanned is album, once
+            assert [step for step in plan if step.startswith("SCAN ") and not step.startswith("SCAN album ")] == [], plan
+            if any(key.startswith(("field:", "collection")) for key in filter):
+                assert not any("CORRELATED" in step for step in plan), plan  # matching albums are found once, not for each album
+        finally:
+            db.dispose()
@@ -0,0 +1,150 @@
+import os
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from albums.app import Context
+from albums.database import MEMORY, db_open
+from albums.entities import Album, AlbumNameKeyEntity, AlbumNameTrigramEntity, Track
+from albums.library.duplicates import DuplicateFinder, NameMatch, album_in_library, name_trigrams, normalize_name, update_name_keys
+from albums.tagger import BasicField
+from albums.utility import get_album_name_from_tracks, get_artist_from_tracks
+
+
+class TestDuplicateFinder:
+    def test_name_keys_match_tracks(self):
+        albums = [
+            # ties are won by the first value
+            Album(
+                path="a" + os.sep,
+                tracks=[
+                    Track(filename="1.flac", tag={BasicField.ALBUM: "One", BasicField.ARTIST: "B", BasicField.ALBUMARTIST: "A"}),
+                    Track(filename="2.flac", tag={BasicField.ALBUM: "Two", BasicField.ARTIST: "A", BasicField.ALBUMARTIST: "B"}),
+                ],
+            ),
+            # most frequent value, counting artist and album artist
+            Album(
+                path="b" + os.sep,
+                tracks=[
+                    Track(filename="1.flac", tag={BasicField.ALBUM: "Two", BasicField.ARTIST: ["X", "Y"]}),
+                    Track(filename="2.flac", tag={BasicField.ALBUM: "Two", BasicField.ARTIST: "X", BasicField.ALBUMARTIST: "Y"}),
+                    Track(filename="3.flac", tag={BasicField.ALBUM: "One", BasicField.ALBUMARTIST: "Y"}),
+                ],
+            ),
+            Album(path="c" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.TITLE: "no album or artist"})]),
+            Album(path="d" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Ünïcode", BasicField.ARTIST: "ÀRTIST"})]),
+        ]
+        ctx_db = db_open(MEMORY)
+        try:
+            with Session(ctx_db) as session:
+                session.add_all(albums)
+                session.flush()
+                update_name_keys(session)
+
+                keys = {key.album_id: (key.artist, key.album_name) for (key,) in session.execute(select(AlbumNameKeyEntity)).tuples()}
+                for album in albums:
+                    artist = get_artist_from_tracks(album)
+                    album_name = get_album_name_from_tracks(album)
+                    assert keys.get(album.album_id or 0) == (artist.lower() if artist else None, album_name.lower() if album_name else None)
+        finally:
+            ctx_db.dispose()
+
+    def test_find_after_album_changed(self):
+        albums = [
+            Album(path="one" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "One", BasicField.ARTIST: "Foo"})]),
+            Album(path="one again" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "one", BasicField.ARTIST: "foo"})]),
+            Album(path="two" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Two", BasicField.ARTIST: "Foo"})]),
+        ]
+        ctx_db = db_open(MEMORY)
+        try:
+            with Session(ctx_db) as session:
+                session.add_all(albums)
+                session.flush()
+
+                # only the first album by path is reported
+                finder = DuplicateFinder().start(session)
+                assert finder.find(albums[0]) is None
+                assert finder.find(albums[1]) == [albums[0].album_id]
+                assert finder.find(albums[2]) is None
+
+                # the scanner deletes stored names when an album changes
+                albums[2].tracks[0].fields[0].value = "One"
+                session.delete(session.get_one(AlbumNameKeyEntity, albums[2].album_id))
+                session.flush()
+
+                finder = DuplicateFinder().start(session)
+                assert finder.find(albums[1]) == [albums[0].album_id, albums[2].album_id]
+        finally:
+            ctx_db.dispose()
+
+    def test_album_in_library_ignores_case(self):
+        ctx = Context()
+        ctx.db = db_open(MEMORY)
+        try:
+            with Session(ctx.db) as session:
+                session.add(
+                    Album(path="a" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Ünïcode", BasicField.ALBUMARTIST: "Foo"})])
+                )
+                session.commit()
+
+            def album(album_name: str, artist: str):
+                return Album(path="new" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: album_name, BasicField.ARTIST: artist})])
+
+            assert album_in_library(ctx, album("Ünïcode", "foo")) == "a" + os.sep
+            assert album_in_library(ctx, album("Ünïcode", "FOO")) == "a" + os.sep
+            assert album_in_library(ctx, album("ünïcode", "Foo")) is None  # like SQLite lower(), only ASCII letters are case-insensitive
+            assert album_in_library(ctx, album("Unicode", "Foo")) is None
+        finally:
+            ctx.db.dispose()
+
+    def test_normalize_name(self):
+        assert normalize_name("The Beatles") == "beatles"
+        assert normalize_name("Beatles, The") == "beatles"
+        assert normalize_name("A Hard Day's Night (2009 Remaster)") == "hard day s night"
+        assert normalize_name("Sigur Rós [Deluxe]") == "sigur ros"
+        assert normalize_name("Simon & Garfunkel") == "simon and garfunkel"
+        # nothing is ignored if nothing would be left
+        assert normalize_name("The The") == "the the"
+        assert normalize_name("(Untitled)") == "untitled"
+        assert normalize_name("...") == "..."
+
+    def test_find_normalized_and_similar(self):
+        albums = [
+            Album(path="a" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Abbey Road", BasicField.ARTIST: "The Beatles"})]),
+            Album(
+                path="b" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Abbey Road (Remastered)", BasicField.ARTIST: "Beatles"})]
+            ),
+            Album(path="c" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Abey Road", BasicField.ARTIST: "Beatles"})]),
+            Album(path="d" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Let It Be", BasicField.ARTIST: "Beatles"})]),
+        ]
+        ctx_db = db_open(MEMORY)
+        try:
+            with Session(ctx_db) as session:
+                session.add_all(albums)
+                session.flush()
+
+                assert DuplicateFinder(NameMatch.EXACT).start(session).find(albums[0]) is None
+                assert DuplicateFinder(NameMatch.NORMALIZED).start(session).find(albums[0]) == [albums[1].album_id]
+
+                finder = DuplicateFinder(NameMatch.SIMILAR).start(session)
+                assert finder.find(albums[0]) == [albums[1].album_id, albums[2].album_id]
+                assert finder.find(albums[2]) is None
+                assert finder.find(albums[3]) is None
+
+                # trigram index is stored with the names
+                key = session.get_one(AlbumNameKeyEntity, albums[2].album_id)
+                trigrams = session.execute(select(AlbumNameTrigramEntity.trigram).where(AlbumNameTrigramEntity.album_id == albums[2].album_id))
+                assert set(trigrams.scalars()) == name_trigrams("beatles", "abey road")
+                assert key.trigram_count == len(name_trigrams("beatles", "abey road"))
+
+                # deleted albums are not found again
+                finder.remove(albums[2])
+                assert finder.find(albums[0]) == [albums[1].album_id]
+
+                # album that is not in the library (being imported)
+                other = Album(
+                    path="import" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ALBUM: "Let it be!", BasicField.ARTIST: "BEATLES"})]
+                )
+                assert finder.candidates(other, session) == [(albums[3].album_id, albums[3].path)]
+        finally:
+            ctx_db.dispose()
@@ -2,19 +2,21 @@ import os
 import shutil
 from pathlib import Path
 
+import pytest
 import xxhash
 from mutagen.flac import FLAC
 from PIL import Image
-from sqlalchemy import Engine, select, update
+from sqlalchemy import Engine, func, select, update
 from sqlalchemy.orm import Session
 
 from albums.app import SCANNER_VERSION, Context
 from albums.database import MEMORY, db_open, load_album_entities
 from albums.entities import Album, OtherFile, PictureFile, Track, TrackPicture
-from albums.library import run_scan
+from albums.library import run_scan, scanner
 from albums.library.scanner_types import MAX_IMAGE_SIZE, TargetRescan
 from albums.picture import PictureInfo
 from albums.tagger import AlbumTagger, BasicField, Picture, PictureType
+from albums.tagger.file_types.flac import FlacTagger
 
 from ..fixtures.create_library import create_album_in_library, create_library, create_picture_file, make_image_data
 
@@ -58,6 +60,22 @@ class TestScanner:
         ),
     ]
 
+    def test_scan_commits_while_scanning(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(scanner, "SCAN_COMMIT_INTERVAL", 0)
+        db = db_open(tmp_path / "albums.db")
+        reader = db_open(tmp_path / "albums.db", read_only=True)
+        try:
+            library = create_library("test_scan_commits", self.sample_library)
+            with Session(db) as session:
+                run_scan(context(db, library), session)
+                # the caller has not committed, but another process can see scanned albums and write to the database
+                with Session(reader) as read_session:
+                    assert read_session.scalar(select(func.count()).select_from(Album)) == 5
+                session.rollback()
+        finally:
+            reader.dispose()
+            db.dispose()
+
     def test_initial_scan(self):
         db = db_open(MEMORY)
         try:
@@ -517,7 +535,7 @@ class TestScanner:
                     assert pic.picture_type == PictureType.COVER_FRONT
                     tags.remove_picture(album.tracks[0].pictures[0].to_picture())
                     image_data = make_image_data(411, 411, "PNG")
-                    file_hash = xxhash.xxh32_digest(image_data)
+                    file_hash = xxhash.xxh3_128_digest(image_data)
                     replacement_pic = Picture(PictureInfo("image/png", 411, 411, 24, len(image_data), file_hash), PictureType.COVER_FRONT, "")
                     tags.add_picture(replacement_pic, image_data)
                 with open(library / album.path / album.picture_files[0].filename, "wb") as f:
@@ -560,6 +578,39 @@ class TestScanner:
         finally:
             db.dispose()
 
+    def test_partial_rescan_fields_only(self, mocker):
+        db = db_open(MEMORY)
+        try:
+            track = Track(
+                filename="1.flac",
+                tag={BasicField.TITLE: "1"},
+                pictures=[TrackPicture(picture_info=PictureInfo("image/png", 400, 400, 24, 1, b""), picture_type=PictureType.COVER_FRONT)],
+            )
+            library = create_library("test_partial_rescan_fields", [Album(path="foo" + os.sep, tracks=[track])])
+            ctx = context(db, library)
+            run_scan(ctx)
+            with Session(db) as session:
+                session.execute(update(Album).values(scanner=0))
+                session.commit()
+
+            def rescan_only_fields(scanner, file):
+                return TargetRescan(file, fields=True, images=False, streams=False)
+
+            mocker.patch("albums.library.album_scanner._needs_rescan", side_effect=rescan_only_fields)
+            spy_get_pictures = mocker.spy(FlacTagger, "get_pictures")
+            spy_get_stream_info = mocker.spy(FlacTagger, "get_stream_info")
+            run_scan(ctx)
+
+            assert spy_get_pictures.call_count == 0
+            assert spy_get_stream_info.call_count == 0
+            with Session(db) as session:
+                (track,) = session.execute(select(Track)).tuples().one()
+                assert track.field_dict()[BasicField.TITLE] == ["1"]
+                assert len(track.pictures) == 1  # kept from the stored track
+                assert track.stream.codec == "FLAC"
+        finally:
+            db.dispose()
+
     def test_scanner_library_modified_at(self):
         db = db_open(MEMORY)
         try:
@@ -608,3 +659,29 @@ class TestScanner:
                 assert album.modified_at > 1_000_000_000
         finally:
             db.dispose()
+
+    @pytest.mark.parametrize("scanner_version", [6, 7, 8, 9])
+    def test_scanner_rehash_legacy_picture_hash(self, mocker, scanner_version: int):
+        db = db_open(MEMORY)
+        try:
+            library = create_library("test_scanner_rehash", [self.sample_library[0]])
+            ctx = context(db, library)
+            run_scan(ctx)
+            with Session(db) as session:
+                (album,) = session.execute(select(Album)).tuples().one()
+                picture_file = album.picture_files[0]
+                file_hash = picture_file.picture_info.file_hash
+                picture_file._file_hash = xxhash.xxh32_digest(b"legacy")
+                album.scanner = scanner_version
+                session.commit()
+
+            spy_flac_open = mocker.spy(FLAC, "__init__")
+            run_scan(ctx)
+            if scanner_version == 9:
+                assert spy_flac_open.call_count == 0  # tracks without pictures are not re-read
+            with Session(db) as session:
+                (album,) = session.execute(select(Album)).tuples().one()
+                assert album.scanner == SCANNER_VERSION
+                assert album.picture_files[0].picture_info.file_hash == file_hash
+        finally:
+            db.dispose()
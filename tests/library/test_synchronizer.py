@@ -5,6 +5,7 @@ from string import Template
 from unittest.mock import call
 
 import pytest
+from mutagen.mp3 import MP3
 from sqlalchemy.orm import Session
 
 from albums.app import Context
@@ -150,3 +151,28 @@ class TestSynchronizer:
             ]
         finally:
             ctx.db.dispose()
+
+    def test_synchronizer_tag_padding(self, mocker):
+        albums = [Album(path="foo" + os.sep, tracks=[Track(filename="1.flac", tag={BasicField.ARTIST: "baz", BasicField.ALBUM: "foo"})])]
+        mocker.patch("albums.library.transcoder.ensure_ffmpeg")
+        mocker.patch("albums.library.transcoder.run_ffmpeg", side_effect=fake_ffmpeg)
+
+        ctx = Context()
+        ctx.config.transcoder_cache = TestSynchronizer.transcoder_cache
+        ctx.config.library = create_library("sync_padding", albums)
+        ctx.config.tag_padding = 48 * 1024
+        ctx.db = db_open(MEMORY)
+        try:
+            with Session(ctx.db) as session:
+                session.add_all(albums)
+                session.commit()
+
+            dest = SyncDestination(ALL_ALBUMS, TestSynchronizer.destination, Template(f"$artist{os.sep}$album"), Template(""), ["mp3"], "mp3")
+            Synchronizer(ctx, dest).do_sync(True, True)
+
+            # transcoded file has no tags, so writing them rewrites it with the configured padding
+            file = MP3(TestSynchronizer.destination / "baz" / "foo" / "1.mp3")
+            assert file.tags is not None
+            assert file.tags._padding == 48 * 1024  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        finally:
+            ctx.db.dispose()
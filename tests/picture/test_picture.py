@@ -1,6 +1,6 @@
 import xxhash
 
-from albums.picture import PictureInfo, PictureScanner, mime_type_to_format
+from albums.picture import PICTURE_HASH_SIZE, PictureInfo, PictureScanner, mime_type_to_format, scan
 
 from ..fixtures.create_library import make_image_data
 
@@ -10,7 +10,8 @@ class TestPicture:
         image_data = make_image_data(100, 200, "PNG")
         result = PictureScanner().scan(image_data)
         assert result.file_size == len(image_data)
-        assert result.file_hash == xxhash.xxh32_digest(image_data)
+        assert result.file_hash == xxhash.xxh3_128_digest(image_data)
+        assert len(result.file_hash) == PICTURE_HASH_SIZE
 
     def test_scan_png(self):
         image_data = make_image_data(100, 200, mime_type_to_format("image/png"))
@@ -81,7 +82,7 @@ class TestPicture:
         assert result.file_size == len(image_data)
         assert result.mime_type == ""
         assert result.height == result.width == 0
-        assert result.file_hash == xxhash.xxh32_digest(image_data)
+        assert result.file_hash == xxhash.xxh3_128_digest(image_data)
         assert result.load_issue == (("error", "cannot identify image file"),)
 
     def test_get_picture_metadata_cache(self, mocker):
@@ -94,3 +95,14 @@ class TestPicture:
         result2 = scanner.scan(image_data)
         assert get_picture_info_mock.call_count == 1
         assert result1 == result2
+
+    def test_preload_ignores_legacy_hash(self, mocker):
+        image_data = make_image_data(400, 400, "PNG")
+        legacy_hash = xxhash.xxh32_digest(image_data)
+        stale = PictureInfo("image/png", 1, 1, 24, len(image_data), legacy_hash)
+        scanner = PictureScanner({(len(image_data), legacy_hash): stale})
+        spy_get_picture_info = mocker.spy(scan, "get_picture_info")
+        result = scanner.scan(image_data)
+        assert spy_get_picture_info.call_count == 1
+        assert result.width == 400
+        assert len(result.file_hash) == PICTURE_HASH_SIZE
@@ -137,7 +137,7 @@ class TestFlac:
         back = pictures[1]
 
         image_data = make_image_data(600, 600, "JPEG")
-        pic_info = PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh32_digest(image_data))
+        pic_info = PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh3_128_digest(image_data))
         replacement = Picture(pic_info, PictureType.FISH, "")
         with TestFlac.tagger.open(track2.filename) as file:
             file.remove_picture(front)
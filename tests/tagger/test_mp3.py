@@ -248,7 +248,7 @@ class TestMp3:
         back = pictures[1]
 
         image_data = make_image_data(600, 600, "JPEG")
-        replacement = Picture(PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh32_digest(image_data)), PictureType.FISH, "")
+        replacement = Picture(PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh3_128_digest(image_data)), PictureType.FISH, "")
 
         with TestMp3.tagger.open(track.filename) as file:
             file.remove_picture(front)
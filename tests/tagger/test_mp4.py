@@ -97,6 +97,25 @@ class TestMp4:
         track_fields = track2.field_dict()
         assert fields[BasicField.TRACKNUMBER] == tuple(track_fields[BasicField.TRACKNUMBER])
 
+    def test_read_all(self):
+        with TestMp4.tagger.open(track1.filename) as file:
+            info = file.read_all()
+            assert info.pictures == tuple(pic for (pic, _) in file.get_pictures())
+            assert info.fields == file.get_fields()
+            assert info.stream == file.get_stream_info()
+        assert not info.has_video
+        assert info.pictures is not None and len(info.pictures) == 2
+
+        with TestMp4.tagger.open(video.filename) as file:
+            assert file.read_all().has_video
+
+        with TestMp4.tagger.open(track1.filename) as file:
+            info = file.read_all(pictures=False, stream=False)
+        assert info.fields is not None
+        assert info.pictures is None
+        assert info.stream is None
+        assert info.has_video is None
+
     def test_mp4_video(self):
         with TestMp4.tagger.open(video.filename) as file:
             assert file.has_video()
@@ -106,7 +125,7 @@ class TestMp4:
             assert len(fields) == 0
             file.set_field(BasicField.TRACKNUMBER, "3")
             image_data = make_image_data(600, 600, "JPEG")
-            pic = Picture(PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh32_digest(image_data)), PictureType.COVER_FRONT, "")
+            pic = Picture(PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh3_128_digest(image_data)), PictureType.COVER_FRONT, "")
             file.add_picture(pic, image_data)
 
         with TestMp4.tagger.open(video.filename) as file:
@@ -258,7 +277,9 @@ class TestMp4:
         second = pictures[1]
 
         image_data = make_image_data(600, 600, "JPEG")
-        replacement = Picture(PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh32_digest(image_data)), PictureType.COVER_FRONT, "")
+        replacement = Picture(
+            PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh3_128_digest(image_data)), PictureType.COVER_FRONT, ""
+        )
 
         with TestMp4.tagger.open(track1.filename) as file:
             file.remove_picture(first)
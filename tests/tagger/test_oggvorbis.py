@@ -158,7 +158,7 @@ class TestOggVorbis:
         back = pictures[1]
 
         image_data = make_image_data(600, 600, "JPEG")
-        pic_info = PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh32_digest(image_data))
+        pic_info = PictureInfo("image/jpeg", 600, 600, 24, len(image_data), xxhash.xxh3_128_digest(image_data))
         replacement = Picture(pic_info, PictureType.FISH, "")
 
         with TestOggVorbis.tagger.open(track.filename) as file:
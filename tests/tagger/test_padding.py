@@ -0,0 +1,50 @@
+import os
+
+import pytest
+from mutagen.flac import FLAC
+
+from albums.entities import Album, Track
+from albums.picture import PictureInfo
+from albums.tagger import AlbumTagger, BasicField, PaddingPolicy, Picture, PictureType
+
+from ..fixtures.create_library import create_library, make_image_data
+
+track = Track(filename="1.flac", tag={BasicField.TITLE: "one"})
+album = Album(path="foo" + os.sep, tracks=[track])
+
+
+class TestPaddingPolicy:
+    @pytest.fixture(scope="function", autouse=True)
+    def setup_tests(self):
+        TestPaddingPolicy.library = create_library("tagger_padding", [album])
+
+    def _padding(self) -> int:
+        file = FLAC(TestPaddingPolicy.library / album.path / track.filename)
+        return sum(block.length for block in file.metadata_blocks if block.code == 1)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType, reportUnknownArgumentType, reportAttributeAccessIssue]
+
+    def test_padding_in_place_and_rewrite(self):
+        padding = PaddingPolicy(reserve=64 * 1024)
+        tagger = AlbumTagger(TestPaddingPolicy.library / album.path, padding=padding)
+        path = tagger.path() / track.filename
+
+        # fixture file has no padding, so it must be rewritten and the reserve is added
+        tagger.set_basic_fields(path, [(BasicField.TITLE, "a longer title")])
+        assert (padding.in_place, padding.rewrites) == (0, 1)
+        assert self._padding() == 64 * 1024
+
+        # small change fits in existing padding
+        tagger.set_basic_fields(path, [(BasicField.TITLE, "an even longer title")])
+        assert (padding.in_place, padding.rewrites) == (1, 1)
+        assert self._padding() == 64 * 1024 - (len("an even longer title") - len("a longer title"))
+
+        # picture does not fit
+        image_data = make_image_data(400, 400) + os.urandom(200_000)
+        with tagger.open(track.filename) as file:
+            file.add_picture(Picture(PictureInfo("image/png", 400, 400, 24, len(image_data), b""), PictureType.COVER_FRONT, ""), image_data)
+        assert (padding.in_place, padding.rewrites) == (1, 2)
+        assert self._padding() == 64 * 1024
+
+        # large padding is kept instead of shrinking it to mutagen's default size
+        tagger.set_basic_fields(path, [(BasicField.TITLE, "t")])
+        assert (padding.in_place, padding.rewrites) == (2, 2)
+        assert self._padding() == 64 * 1024 + len("an even longer title") - 1
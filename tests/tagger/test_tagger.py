@@ -5,7 +5,7 @@ from mutagen.mp3 import MP3
 
 from albums.entities import Album, Track, TrackPicture
 from albums.picture import PictureInfo
-from albums.tagger import AlbumTagger, BasicField, PictureType
+from albums.tagger import AlbumTagger, BasicField, PictureType, WriteSet
 
 from ..fixtures.create_library import create_library
 
@@ -51,3 +51,44 @@ class TestAlbumTagger:
             assert len(list(file.get_pictures())) == 0
             file.add_picture(picture, image_data)
         assert mock_mp3_save.call_count == 3
+
+    def test_deferred_writes(self, mocker):
+        tagger = AlbumTagger(TestAlbumTagger.library / mp3album.path, defer_writes=True)
+        mock_mp3_save = mocker.spy(MP3, "save")
+
+        with tagger.open(mp3track.filename) as file:
+            file.set_field(BasicField.ALBUM, "baz")
+        tagger.set_basic_fields(tagger.path() / mp3track.filename, [(BasicField.TITLE, "new title")])
+        with tagger.open(mp3track.filename) as file:
+            tags = dict(file.get_fields())
+            assert tags[BasicField.ALBUM] == ("baz",)
+            assert tags[BasicField.TITLE] == ("new title",)
+        assert mock_mp3_save.call_count == 0
+        assert str(MP3(TestAlbumTagger.library / mp3album.path / mp3track.filename)["TIT2"]) == "T"
+
+        tagger.flush()
+        assert mock_mp3_save.call_count == 1
+        tagger.flush()
+        assert mock_mp3_save.call_count == 1
+
+        with AlbumTagger(TestAlbumTagger.library / mp3album.path).open(mp3track.filename) as file:
+            tags = dict(file.get_fields())
+            assert tags[BasicField.ALBUM] == ("baz",)
+            assert tags[BasicField.TITLE] == ("new title",)
+
+    def test_write_set(self):
+        tagger = AlbumTagger(TestAlbumTagger.library / mp3album.path, defer_writes=True)
+        with tagger.open(mp3track.filename) as file:
+            dict(file.get_fields())
+        assert not tagger.take_write_set()
+
+        with tagger.open(mp3track.filename) as file:
+            file.set_field(BasicField.ALBUM, "baz")
+        tagger.set_basic_fields(tagger.path() / mp3track.filename, [(BasicField.TITLE, "new title")])
+        assert tagger.take_write_set() == WriteSet(frozenset({mp3track.filename}), frozenset({BasicField.ALBUM, BasicField.TITLE}), False)
+        assert not tagger.take_write_set()
+
+        with tagger.open(mp3track.filename) as file:
+            (picture, _) = next(file.get_pictures())
+            file.remove_picture(picture)
+        assert tagger.take_write_set() == WriteSet(frozenset({mp3track.filename}), frozenset(), True)
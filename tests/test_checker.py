@@ -1,13 +1,21 @@
 import os
 
 import pytest
+from mutagen.flac import FLAC
 from rich.text import Text
 from sqlalchemy.orm import Session
 
 from albums.app import Context
 from albums.checks.checker import Checker
+from albums.checks.fields.check_album import CheckAlbumField
+from albums.checks.fields.check_extra_whitespace import CheckExtraWhitespace
+from albums.checks.fields.check_track_title import CheckTrackTitle
+from albums.checks.numbering.check_track_numbering import CheckTrackNumbering
+from albums.checks.path.check_album_under_album import CheckAlbumUnderAlbum
+from albums.checks.path.check_track_filename import CheckTrackFilename
 from albums.database import MEMORY, db_open, load_album_entities
 from albums.entities import Album, Track
+from albums.interactive.interact import OPTION_DO_NOTHING, OPTION_MORE_OPTIONS, OPTION_SCAN_AGAIN
 from albums.library import run_scan
 from albums.tagger import BasicField
 
@@ -80,6 +88,44 @@ class TestChecker:
         finally:
             ctx.db.dispose()
 
+    def test_run_enabled_automatic_saves_each_file_once(self, mocker):
+        album = Album(
+            path="Foo" + os.sep,
+            tracks=[
+                Track(
+                    filename="1-01 one.flac",
+                    tag={BasicField.ARTIST: "A", BasicField.ALBUM: "Foo", BasicField.TRACKNUMBER: "1-1", BasicField.TITLE: "one "},
+                )
+            ],
+        )
+        ctx = Context()
+        ctx.config.library = create_library("checker_coalesce_writes", [album])
+        ctx.db = db_open(MEMORY, True)
+        try:
+            with Session(ctx.db) as session:
+                ctx.select_album_entities = lambda session, order_by="path": load_album_entities(session)
+                run_scan(ctx, session)
+                session.commit()
+
+                mock_flac_save = mocker.spy(FLAC, "save")
+                showed_issues = Checker(ctx, automatic=True, preview=False, fix=False, interactive=False, show_ignore_option=False).run_enabled(
+                    session
+                )
+                assert showed_issues == 3  # disc-in-track-number, extra-whitespace, zero-pad-numbers
+                assert mock_flac_save.call_count == 1
+
+                # database has current file size and timestamp
+                (_, any_changes) = run_scan(ctx, session)
+                assert not any_changes
+
+            with Session(ctx.db) as session:
+                album = next(ctx.select_album_entities(session))
+                assert album.tracks[0].get(BasicField.DISCNUMBER) == ("1",)
+                assert album.tracks[0].get(BasicField.TRACKNUMBER) == ("01",)
+                assert album.tracks[0].get(BasicField.TITLE) == ("one",)
+        finally:
+            ctx.db.dispose()
+
     def test_run_enabled_dependent_check_failures(self, mocker):
         album = Album(
             path="foo" + os.sep,
@@ -125,6 +171,55 @@ class TestChecker:
         assert "Configuration error" in output
         assert "invalid-track-or-disc-number required by" in output
 
+    def test_run_enabled_interactive_keeps_external_changes(self, mocker):
+        album = Album(
+            path="Foo" + os.sep,
+            tracks=[Track(filename="01 one.flac", tag={BasicField.ARTIST: "A", BasicField.TRACKNUMBER: "01", BasicField.TITLE: "one "})],
+        )
+        ctx = Context()
+        ctx.config.library = create_library("checker_external_changes", [album])
+        for name, check_config in ctx.config.checks.items():
+            check_config["enabled"] = name in (CheckExtraWhitespace.name, CheckAlbumField.name)
+        ctx.db = db_open(MEMORY, True)
+        ctx.select_album_entities = lambda session, order_by="path": load_album_entities(session)
+        track_path = ctx.config.library / album.path / album.tracks[0].filename
+        prompts: list[str] = []
+
+        def choose(prompt: str, options: list[str], default_option_index: int | None):
+            prompts.append(prompt)
+            if OPTION_SCAN_AGAIN in options:
+                file = FLAC(track_path)  # user changes the album tag in another program
+                file["album"] = "External"
+                file.save()
+                return options.index(OPTION_SCAN_AGAIN)
+            if len(prompts) == 1:
+                return default_option_index  # strip whitespace
+            if len(prompts) == 2:
+                return options.index(OPTION_MORE_OPTIONS)  # instead of fixing the album tag
+            return options.index(OPTION_DO_NOTHING)
+
+        try:
+            with Session(ctx.db) as session:
+                run_scan(ctx, session)
+                session.commit()
+
+                mocker.patch("albums.interactive.interact._choose_from_menu", side_effect=choose)
+                Checker(ctx, automatic=False, preview=False, fix=False, interactive=True, show_ignore_option=False).run_enabled(session)
+                assert len(prompts) == 3  # the album check passed after the external change
+
+                (_, any_changes) = run_scan(ctx, session)
+                assert not any_changes
+
+            with Session(ctx.db) as session:
+                album = next(ctx.select_album_entities(session))
+                assert album.tracks[0].get(BasicField.ALBUM) == ("External",)
+                assert album.tracks[0].get(BasicField.TITLE) == ("one",)
+
+            file = FLAC(track_path)
+            assert (file["album"], file["title"]) == (["External"], ["one"])
+        finally:
+            ctx.db.dispose()
+
     def test_run_enabled_delete_other_album(self, mocker):
         albums = [
             Album(
@@ -153,7 +248,7 @@ class TestChecker:
                     "albums.interactive.interact.choice",
                     return_value=f">> KEEP left (THIS album) and DELETE right (other): One{os.sep}",
                 )
-                mock_confirm = mocker.patch("albums.checks.fields.check_duplicate_album.confirm", return_value=True)
+                mock_confirm = mocker.patch("prompt_toolkit.shortcuts.confirm", return_value=True)
                 showed_issues = Checker(ctx, automatic=True, preview=False, fix=True, interactive=False, show_ignore_option=False).run_enabled(
                     session
                 )
@@ -201,17 +296,114 @@ class TestChecker:
                     "albums.interactive.interact.choice",
                     return_value=f">> DELETE left (THIS album) and KEEP right (other): One{os.sep}",
                 )
-                mock_confirm = mocker.patch("albums.checks.fields.check_duplicate_album.confirm", return_value=True)
+                mock_confirm = mocker.patch("prompt_toolkit.shortcuts.confirm", return_value=True)
                 showed_issues = Checker(ctx, automatic=True, preview=False, fix=True, interactive=False, show_ignore_option=False).run_enabled(
                     session
                 )
 
                 assert mock_choice.call_count == 1
                 assert mock_confirm.call_count == 1
-                assert showed_issues == 1
+                assert showed_issues == 2  # folder-name can't rename "One!" and runs before duplicate-album
 
                 after = list(ctx.select_album_entities(session))
                 assert len(after) == 1
                 assert after[0].path == "One" + os.sep
         finally:
             ctx.db.dispose()
+
+    def test_run_enabled_skips_checks_that_passed_before(self, mocker):
+        album = Album(
+            path="Foo" + os.sep,
+            tracks=[
+                Track(
+                    filename="01 one.flac",
+                    tag={BasicField.ARTIST: "A", BasicField.ALBUM: "Foo", BasicField.TRACKNUMBER: "01", BasicField.TITLE: "one"},
+                )
+            ],
+        )
+        ctx = Context()
+        ctx.config.library = create_library("checker_result_cache", [album])
+        ctx.db = db_open(MEMORY)
+        ctx.select_album_entities = lambda session, order_by="path": load_album_entities(session)
+        try:
+            with Session(ctx.db) as session:
+                run_scan(ctx, session)
+                album = next(ctx.select_album_entities(session))
+                album.modified_at -= 60  # a pass is not remembered if the album might change again within the same second
+                session.commit()
+
+                check_album = mocker.spy(CheckAlbumField, "check")
+                check_under = mocker.spy(CheckAlbumUnderAlbum, "check")
+
+                def run(recheck: bool = False):
+                    return Checker(ctx, False, False, False, False, False, recheck=recheck).run_enabled(session)
+
+                assert run() == 0
+                assert (check_album.call_count, check_under.call_count) == (1, 1)
+                assert run() == 0
+                assert (check_album.call_count, check_under.call_count) == (1, 2)  # album-under-album depends on other albums
+
+                assert run(recheck=True) == 0
+                assert check_album.call_count == 2
+
+                checks = dict(ctx.config.checks)
+                checks["album"] = dict(checks["album"]) | {"ignore_folders": ["misc", "other"]}
+                ctx.config.checks = checks
+                assert run() == 0
+                assert check_album.call_count == 3
+                assert run() == 0
+                assert check_album.call_count == 3
+
+                album.modified_at += 1
+                session.commit()
+                assert run() == 0
+                assert check_album.call_count == 4
+
+                check_filename = mocker.spy(CheckTrackFilename, "check")
+                assert run() == 0
+                assert check_filename.call_count == 0
+                ctx.config.path_replace_slash = "_"
+                assert run() == 0
+                assert check_filename.call_count == 1  # track-filename uses global path settings
+                ctx.config.checks = checks | {"zero-pad-numbers": dict(checks["zero-pad-numbers"]) | {"tracknumber_pad": "ignore"}}
+                assert run() == 0
+                assert check_filename.call_count == 2  # and zero-pad-numbers configuration
+                assert check_album.call_count == 4
+        finally:
+            ctx.db.dispose()
+
+    def test_run_enabled_automatic_reruns_affected_checks(self, mocker):
+        album = Album(
+            path="Foo" + os.sep,
+            tracks=[Track(filename="01 one.flac", tag={BasicField.ARTIST: "A", BasicField.ALBUM: "Foo", BasicField.TRACKNUMBER: "01"})],
+        )
+        ctx = Context()
+        ctx.config.library = create_library("checker_rerun_affected", [album])
+        ctx.db = db_open(MEMORY, True)
+        ctx.select_album_entities = lambda session, order_by="path": load_album_entities(session)
+        try:
+            with Session(ctx.db) as session:
+                run_scan(ctx, session)
+                session.commit()
+
+                check_album = mocker.spy(CheckAlbumField, "check")
+                check_numbering = mocker.spy(CheckTrackNumbering, "check")
+                check_whitespace = mocker.spy(CheckExtraWhitespace, "check")
+                check_title = mocker.spy(CheckTrackTitle, "check")
+                showed_issues = Checker(ctx, automatic=True, preview=False, fix=False, interactive=False, show_ignore_option=False).run_enabled(
+                    session
+                )
+                assert showed_issues == 1  # track-title
+
+                # setting the title does not affect checks of other fields, but any field could have extra whitespace
+                assert (check_album.call_count, check_numbering.call_count) == (1, 1)
+                assert (check_whitespace.call_count, check_title.call_count) == (2, 2)
+
+                (_, any_changes) = run_scan(ctx, session)
+                assert not any_changes
+
+            with Session(ctx.db) as session:
+                album = next(ctx.select_album_entities(session))
+                assert album.tracks[0].get(BasicField.TITLE) == ("one",)
+        finally:
+            ctx.db.dispose()